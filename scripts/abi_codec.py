@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Solidity ABI encoding/decoding on bytes (stdlib only).
+
+Decoding converts a hex result to bytes once and then walks a memoryview: words are read
+with int.from_bytes on zero-copy slices, so large batched responses (string[], Result[])
+decode in linear time instead of slicing and re-parsing hex strings per word.
+
+Supported types: address, bool, uint<N>, int<N>, bytes<N>, bytes, string, T[], T[k]
+and tuples "(T1,T2,...)" in any nesting, e.g. ISiloConfig.ConfigData (CONFIG_DATA_TYPE).
+Values: address -> lowercase "0x..." str, uint/int -> int, bool -> bool, bytes/bytesN -> bytes,
+string -> str, arrays -> list, tuples -> tuple.
+
+Usage:
+
+  calldata = encode_call("0xf58e82b5", ["address[]"], [addresses])   # getVersions(address[])
+  (versions,) = decode_hex(["string[]"], result_hex)
+  config = decode_config_data(result_hex)                            # dict by field name
+
+  python3 scripts/abi_codec.py --benchmark          # decode throughput vs hex slicing
+  python3 scripts/abi_codec.py --fuzz 2000          # random encode/decode round trips
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+WORD = 32
+
+# ISiloConfig.ConfigData (silo-core/contracts/interfaces/ISiloConfig.sol), in declaration order.
+CONFIG_DATA_FIELDS: list[tuple[str, str]] = [
+    ("daoFee", "uint256"),
+    ("deployerFee", "uint256"),
+    ("silo", "address"),
+    ("token", "address"),
+    ("protectedShareToken", "address"),
+    ("collateralShareToken", "address"),
+    ("debtShareToken", "address"),
+    ("solvencyOracle", "address"),
+    ("maxLtvOracle", "address"),
+    ("interestRateModel", "address"),
+    ("maxLtv", "uint256"),
+    ("lt", "uint256"),
+    ("liquidationTargetLtv", "uint256"),
+    ("liquidationFee", "uint256"),
+    ("flashloanFee", "uint256"),
+    ("hookReceiver", "address"),
+    ("callBeforeQuote", "bool"),
+]
+CONFIG_DATA_TYPE = "(" + ",".join(t for _name, t in CONFIG_DATA_FIELDS) + ")"
+
+
+class AbiDecodeError(ValueError):
+    """Malformed or truncated ABI data."""
+
+
+@dataclass(frozen=True)
+class AbiType:
+    kind: str  # "address" | "bool" | "uint" | "int" | "fixed_bytes" | "bytes" | "string" | "array" | "tuple"
+    size: int = 0  # bits for uint/int, bytes for fixed_bytes, length for fixed arrays (-1: dynamic array)
+    item: AbiType | None = None  # array element type
+    components: tuple[AbiType, ...] = ()  # tuple members
+
+    @property
+    def dynamic(self) -> bool:
+        if self.kind in ("bytes", "string"):
+            return True
+        if self.kind == "array":
+            return self.size < 0 or self.item.dynamic  # type: ignore[union-attr]
+        if self.kind == "tuple":
+            return any(c.dynamic for c in self.components)
+        return False
+
+    @property
+    def head_size(self) -> int:
+        """Bytes this type occupies in the head of an enclosing tuple/array."""
+        if self.dynamic:
+            return WORD
+        if self.kind == "array":
+            return self.size * self.item.head_size  # type: ignore[union-attr]
+        if self.kind == "tuple":
+            return sum(c.head_size for c in self.components)
+        return WORD
+
+
+_ARRAY_SUFFIX = re.compile(r"\[(\d*)\]$")
+_TYPE_CACHE: dict[str, AbiType] = {}
+
+
+def _split_top_level(inner: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(inner):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(inner[start:i])
+            start = i + 1
+    parts.append(inner[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def parse_type(spec: str) -> AbiType:
+    """Parse a canonical ABI type string ("uint256", "(address,bool,bytes)[]", ...). Cached."""
+    t = _TYPE_CACHE.get(spec)
+    if t is not None:
+        return t
+    s = spec.replace(" ", "")
+    m = _ARRAY_SUFFIX.search(s)
+    if m:
+        t = AbiType("array", int(m.group(1)) if m.group(1) else -1, item=parse_type(s[: m.start()]))
+    elif s.startswith("(") and s.endswith(")"):
+        t = AbiType("tuple", components=tuple(parse_type(p) for p in _split_top_level(s[1:-1])))
+    elif s == "address":
+        t = AbiType("address")
+    elif s == "bool":
+        t = AbiType("bool")
+    elif s in ("string", "bytes"):
+        t = AbiType(s)
+    elif s.startswith("uint") or s.startswith("int"):
+        kind = "uint" if s.startswith("uint") else "int"
+        bits = int(s[len(kind) :] or 256)
+        if bits % 8 or not 8 <= bits <= 256:
+            raise ValueError(f"invalid ABI type {spec!r}")
+        t = AbiType(kind, bits)
+    elif s.startswith("bytes") and s[5:].isdigit() and 1 <= int(s[5:]) <= 32:
+        t = AbiType("fixed_bytes", int(s[5:]))
+    else:
+        raise ValueError(f"unsupported ABI type {spec!r}")
+    _TYPE_CACHE[spec] = t
+    return t
+
+
+# --- decoding ---------------------------------------------------------------------------
+
+
+# Decoders are compiled once per type into closures (view, offset) -> value; this avoids
+# re-dispatching on the type for every element of large arrays.
+_Decoder = Callable[[memoryview, int], Any]
+_DECODER_CACHE: dict[AbiType, _Decoder] = {}
+
+_from_bytes = int.from_bytes
+
+
+def _out_of_range(view: memoryview, offset: int) -> AbiDecodeError:
+    return AbiDecodeError(f"word at {offset} out of range (data is {len(view)} bytes)")
+
+
+def _word_int(view: memoryview, offset: int) -> int:
+    if offset < 0 or offset + WORD > len(view):
+        raise _out_of_range(view, offset)
+    return _from_bytes(view[offset : offset + WORD], "big")
+
+
+def _pointer(view: memoryview, offset: int, base: int) -> int:
+    target = base + _word_int(view, offset)
+    if target > len(view):
+        raise AbiDecodeError(f"offset {target} at {offset} points past end ({len(view)} bytes)")
+    return target
+
+
+def _decode_address(view: memoryview, offset: int) -> str:
+    if offset < 0 or offset + WORD > len(view):
+        raise _out_of_range(view, offset)
+    return "0x" + view[offset + 12 : offset + WORD].hex()
+
+
+def _decode_bool(view: memoryview, offset: int) -> bool:
+    return _word_int(view, offset) != 0
+
+
+def _decode_int(view: memoryview, offset: int) -> int:
+    v = _word_int(view, offset)
+    return v - (1 << 256) if v >> 255 else v
+
+
+def _decode_raw_bytes(view: memoryview, offset: int) -> bytes:
+    length = _word_int(view, offset)
+    start = offset + WORD
+    if start + length > len(view):
+        raise AbiDecodeError(f"bytes of length {length} at {offset} run past end ({len(view)} bytes)")
+    return bytes(view[start : start + length])
+
+
+def _decode_string(view: memoryview, offset: int) -> str:
+    if offset < 0 or offset + WORD > len(view):
+        raise _out_of_range(view, offset)
+    start = offset + WORD
+    end = start + _from_bytes(view[offset:start], "big")
+    if end > len(view):
+        raise AbiDecodeError(f"string of length {end - start} at {offset} runs past end ({len(view)} bytes)")
+    try:
+        return str(view[start:end], "utf-8")  # decodes straight from the buffer, no bytes copy
+    except UnicodeDecodeError as e:
+        raise AbiDecodeError(f"invalid utf-8 string at {offset}: {e}") from e
+
+
+def _fixed_bytes_decoder(size: int) -> _Decoder:
+    def dec(view: memoryview, offset: int) -> bytes:
+        if offset < 0 or offset + WORD > len(view):
+            raise _out_of_range(view, offset)
+        return bytes(view[offset : offset + size])
+
+    return dec
+
+
+def _sequence_decoder(types: tuple[AbiType, ...]) -> Callable[[memoryview, int], list[Any]]:
+    """Decoder of a tuple-like sequence whose head starts at base (offsets relative to base)."""
+    steps = []
+    pos = 0
+    for t in types:
+        steps.append((pos, t.dynamic, _decoder_for(t)))
+        pos += t.head_size
+
+    def dec(view: memoryview, base: int) -> list[Any]:
+        out = []
+        for rel, dynamic, item_dec in steps:
+            if dynamic:
+                out.append(item_dec(view, _pointer(view, base + rel, base)))
+            else:
+                out.append(item_dec(view, base + rel))
+        return out
+
+    return dec
+
+
+def _dynamic_array_decoder(item: AbiType) -> _Decoder:
+    item_dec = _decoder_for(item)
+    item_dynamic = item.dynamic
+    step = item.head_size
+
+    def dec(view: memoryview, offset: int) -> list[Any]:
+        count = _word_int(view, offset)
+        base = offset + WORD
+        # Every element needs at least one head word; reject absurd lengths before looping.
+        if count * step > len(view) - base:
+            raise AbiDecodeError(f"array length {count} at {offset} exceeds data")
+        if not item_dynamic:
+            return [item_dec(view, base + i * step) for i in range(count)]
+        out = []
+        size = len(view)
+        for i in range(count):
+            head = base + i * WORD
+            target = base + _from_bytes(view[head : head + WORD], "big")
+            if target > size:
+                raise AbiDecodeError(f"offset {target} at {head} points past end ({size} bytes)")
+            out.append(item_dec(view, target))
+        return out
+
+    return dec
+
+
+def _decoder_for(t: AbiType) -> _Decoder:
+    dec = _DECODER_CACHE.get(t)
+    if dec is not None:
+        return dec
+    kind = t.kind
+    if kind == "address":
+        dec = _decode_address
+    elif kind == "uint":
+        dec = _word_int
+    elif kind == "int":
+        dec = _decode_int
+    elif kind == "bool":
+        dec = _decode_bool
+    elif kind == "fixed_bytes":
+        dec = _fixed_bytes_decoder(t.size)
+    elif kind == "bytes":
+        dec = _decode_raw_bytes
+    elif kind == "string":
+        dec = _decode_string
+    elif kind == "array" and t.size < 0:
+        dec = _dynamic_array_decoder(t.item)  # type: ignore[arg-type]
+    elif kind == "array":
+        dec = _sequence_decoder((t.item,) * t.size)  # type: ignore[arg-type]
+    elif kind == "tuple":
+        seq = _sequence_decoder(t.components)
+        dec = lambda view, offset: tuple(seq(view, offset))  # noqa: E731
+    else:
+        raise ValueError(f"cannot decode {kind}")
+    _DECODER_CACHE[t] = dec
+    return dec
+
+
+def decode(types: list[str], data: bytes | bytearray | memoryview) -> tuple[Any, ...]:
+    """Decode ABI-encoded values of types (a function's outputs) from raw bytes."""
+    return tuple(_sequence_decoder(tuple(parse_type(t) for t in types))(memoryview(data), 0))
+
+
+def hex_to_bytes(hex_data: str) -> bytes:
+    h = hex_data.strip()
+    h = h[2:] if h[:2] in ("0x", "0X") else h
+    try:
+        return bytes.fromhex(h)
+    except ValueError as e:
+        raise AbiDecodeError(f"invalid hex: {e}") from e
+
+
+def decode_hex(types: list[str], hex_data: str) -> tuple[Any, ...]:
+    """decode() for a 0x-prefixed hex string (e.g. eth_call result). One hex->bytes conversion."""
+    return decode(types, hex_to_bytes(hex_data))
+
+
+def decode_config_data(hex_data: str) -> dict[str, Any]:
+    """ISiloConfig.getConfig(silo) result as {field name: value}."""
+    (values,) = decode_hex([CONFIG_DATA_TYPE], hex_data)
+    return {name: v for (name, _t), v in zip(CONFIG_DATA_FIELDS, values)}
+
+
+# --- encoding ---------------------------------------------------------------------------
+
+
+def _uint_word(value: int) -> bytes:
+    return value.to_bytes(WORD, "big")
+
+
+def _encode_sequence(types: tuple[AbiType, ...], values: Any) -> bytes:
+    values = list(values)
+    if len(values) != len(types):
+        raise ValueError(f"expected {len(types)} values, got {len(values)}")
+    heads: list[bytes] = []
+    tails: list[bytes] = []
+    tail_offset = sum(t.head_size for t in types)
+    for t, v in zip(types, values):
+        enc = _encode(t, v)
+        if t.dynamic:
+            heads.append(_uint_word(tail_offset))
+            tails.append(enc)
+            tail_offset += len(enc)
+        else:
+            heads.append(enc)
+    return b"".join(heads) + b"".join(tails)
+
+
+def _encode(t: AbiType, value: Any) -> bytes:
+    kind = t.kind
+    if kind == "address":
+        raw = bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+        if len(raw) != 20:
+            raise ValueError(f"invalid address {value!r}")
+        return b"\x00" * 12 + raw
+    if kind == "uint":
+        if not 0 <= value < (1 << t.size):
+            raise ValueError(f"uint{t.size} out of range: {value}")
+        return _uint_word(value)
+    if kind == "int":
+        if not -(1 << (t.size - 1)) <= value < (1 << (t.size - 1)):
+            raise ValueError(f"int{t.size} out of range: {value}")
+        return (value % (1 << 256)).to_bytes(WORD, "big")
+    if kind == "bool":
+        return _uint_word(1 if value else 0)
+    if kind == "fixed_bytes":
+        raw = bytes(value)
+        if len(raw) != t.size:
+            raise ValueError(f"bytes{t.size} needs {t.size} bytes, got {len(raw)}")
+        return raw + b"\x00" * (WORD - t.size)
+    if kind in ("bytes", "string"):
+        raw = value.encode("utf-8") if kind == "string" else bytes(value)
+        return _uint_word(len(raw)) + raw + b"\x00" * (-len(raw) % WORD)
+    if kind == "array":
+        item = t.item
+        assert item is not None
+        values = list(value)
+        if t.size >= 0 and len(values) != t.size:
+            raise ValueError(f"fixed array needs {t.size} values, got {len(values)}")
+        body = _encode_sequence((item,) * len(values), values)
+        return body if t.size >= 0 else _uint_word(len(values)) + body
+    if kind == "tuple":
+        return _encode_sequence(t.components, value)
+    raise ValueError(f"cannot encode {kind}")
+
+
+def encode(types: list[str], values: list[Any]) -> bytes:
+    """ABI-encode values (function arguments) of types."""
+    return _encode_sequence(tuple(parse_type(t) for t in types), values)
+
+
+def encode_call(selector: str, types: list[str], values: list[Any]) -> str:
+    """0x-prefixed calldata: 4-byte selector (hex) + encoded arguments."""
+    return "0x" + selector.removeprefix("0x") + encode(types, values).hex()
+
+
+# --- convenience for single-word results ------------------------------------------------
+
+
+def decode_address(hex_data: str | None) -> str | None:
+    """First word of an eth_call result as lowercase address; None for empty/short/zero."""
+    if not hex_data:
+        return None
+    try:
+        (addr,) = decode_hex(["address"], hex_data)
+    except AbiDecodeError:
+        return None
+    return None if addr == "0x" + "0" * 40 else addr
+
+
+def decode_uint(hex_data: str | None) -> int | None:
+    """First word of an eth_call result as uint256; None for empty/short/malformed data."""
+    if not hex_data:
+        return None
+    try:
+        (value,) = decode_hex(["uint256"], hex_data)
+    except AbiDecodeError:
+        return None
+    return value
+
+
+# --- benchmark / fuzz ---------------------------------------------------------------------
+
+
+def _hex_slicing_string_array(hex_result: str) -> list[str]:
+    """Reference: decode string[] the way the checkers used to (hex slices + int(..., 16) per word)."""
+    h = hex_result.removeprefix("0x")
+    base = int(h[0:64], 16) * 2
+    n = int(h[base : base + 64], 16)
+    out = []
+    for i in range(n):
+        elem = base + 64 + int(h[base + 64 + i * 64 : base + 128 + i * 64], 16) * 2
+        length = int(h[elem : elem + 64], 16)
+        out.append(bytes.fromhex(h[elem + 64 : elem + 64 + length * 2]).decode("utf-8"))
+    return out
+
+
+def _benchmark() -> int:
+    print(f"  {'payload':<44}{'hex slicing':>14}{'abi_codec':>12}")
+    for n in (100, 1000, 10000):
+        versions = [f"Silo {i % 7}.{i % 13}.{i % 5}" for i in range(n)]
+        payload = "0x" + encode(["string[]"], [versions]).hex()
+        assert _hex_slicing_string_array(payload) == versions == decode_hex(["string[]"], payload)[0]
+        timings = []
+        for fn in (_hex_slicing_string_array, lambda p: decode_hex(["string[]"], p)[0]):
+            best = float("inf")
+            for _ in range(5):
+                t0 = time.perf_counter()
+                fn(payload)
+                best = min(best, time.perf_counter() - t0)
+            timings.append(best)
+        label = f"string[{n}] ({len(payload) // 2 / 1024:.0f} KiB)"
+        print(f"  {label:<44}{timings[0] * 1000:>12.2f}ms{timings[1] * 1000:>10.2f}ms")
+
+    configs = [
+        tuple(
+            random.getrandbits(64) if t.startswith("uint") else ("0x" + random.randbytes(20).hex() if t == "address" else True)
+            for _n, t in CONFIG_DATA_FIELDS
+        )
+        for _ in range(1000)
+    ]
+    payload = "0x" + encode([f"{CONFIG_DATA_TYPE}[]"], [configs]).hex()
+    t0 = time.perf_counter()
+    (decoded,) = decode_hex([f"{CONFIG_DATA_TYPE}[]"], payload)
+    elapsed = time.perf_counter() - t0
+    assert decoded == configs
+    print(f"  {'ConfigData[1000] decode':<44}{'':>14}{elapsed * 1000:>10.2f}ms")
+    return 0
+
+
+_FUZZ_LEAVES = ["address", "bool", "uint256", "uint8", "int256", "int24", "bytes32", "bytes4", "bytes", "string"]
+
+
+def _random_type(rng: random.Random, depth: int = 0) -> str:
+    r = rng.random()
+    if depth < 3 and r < 0.2:
+        return _random_type(rng, depth + 1) + "[]"
+    if depth < 3 and r < 0.3:
+        return _random_type(rng, depth + 1) + f"[{rng.randint(1, 3)}]"
+    if depth < 3 and r < 0.45:
+        return "(" + ",".join(_random_type(rng, depth + 1) for _ in range(rng.randint(1, 4))) + ")"
+    return rng.choice(_FUZZ_LEAVES)
+
+
+def _random_value(rng: random.Random, t: AbiType) -> Any:
+    if t.kind == "address":
+        return "0x" + rng.randbytes(20).hex()
+    if t.kind == "bool":
+        return rng.random() < 0.5
+    if t.kind == "uint":
+        return rng.getrandbits(t.size)
+    if t.kind == "int":
+        return rng.getrandbits(t.size) - (1 << (t.size - 1))
+    if t.kind == "fixed_bytes":
+        return rng.randbytes(t.size)
+    if t.kind == "bytes":
+        return rng.randbytes(rng.randint(0, 70))
+    if t.kind == "string":
+        return "".join(rng.choice("abcXYZ019 ._-ü€") for _ in range(rng.randint(0, 40)))
+    if t.kind == "array":
+        count = t.size if t.size >= 0 else rng.randint(0, 4)
+        return [_random_value(rng, t.item) for _ in range(count)]  # type: ignore[arg-type]
+    return tuple(_random_value(rng, c) for c in t.components)
+
+
+def _fuzz(rounds: int, seed: int) -> int:
+    rng = random.Random(seed)
+    failures = 0
+    for i in range(rounds):
+        types = [_random_type(rng) for _ in range(rng.randint(1, 4))]
+        values = [_random_value(rng, parse_type(t)) for t in types]
+        data = encode(types, values)
+        decoded = list(decode(types, data))
+        if decoded != values:
+            failures += 1
+            print(f"round {i}: round trip mismatch for {types}", file=sys.stderr)
+            continue
+        # Truncated / corrupted input must raise AbiDecodeError (never IndexError etc.).
+        corrupted = bytearray(data[: rng.randint(0, len(data))])
+        if corrupted and rng.random() < 0.5:
+            corrupted[rng.randrange(len(corrupted))] = 0xFF
+        try:
+            decode(types, corrupted)
+        except AbiDecodeError:
+            pass
+        except Exception as e:  # noqa: BLE001 - this is what the fuzzer looks for
+            failures += 1
+            print(f"round {i}: {type(e).__name__} instead of AbiDecodeError for {types}: {e}", file=sys.stderr)
+    print(f"fuzz: {rounds} rounds (seed {seed}), {failures} failures")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="ABI codec self-checks.")
+    p.add_argument("--benchmark", action="store_true", help="Compare string[] decode with hex slicing.")
+    p.add_argument("--fuzz", type=int, metavar="ROUNDS", help="Random encode/decode round trips.")
+    p.add_argument("--seed", type=int, default=0, help="Fuzz seed. Default: 0.")
+    args = p.parse_args()
+    if args.benchmark:
+        return _benchmark()
+    if args.fuzz:
+        return _fuzz(args.fuzz, args.seed)
+    p.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
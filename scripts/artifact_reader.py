@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Partial, streaming reads of large JSON artifacts (stdlib only).
+
+Deployment artifacts are {"address", "abi", "bytecode", "deployedBytecode", ...} and the
+checkers only need address and abi; forge broadcast runs put every deployment in
+"transactions" ahead of the large "receipts". json.loads materialises everything, so
+reading ~15 MB of artifacts allocates several times that in Python strings.
+
+extract_top_level() reads the file in chunks and walks the top-level object:
+  - wanted keys are decoded with json's raw_decode
+  - hashed keys (string values) are fed to sha256 chunk by chunk, never held in memory
+  - other values are skipped by scanning for the closing quote/bracket
+and returns as soon as all wanted and hashed keys were seen.
+
+Usage:
+
+  fields = read_deployment_artifact(Path("silo-core/deployments/sonic/SiloLens.sol.json"))
+  fields.address, fields.abi, fields.deployed_bytecode_hash
+
+  # compare against json.loads on the real tree (time + peak memory)
+  python3 scripts/artifact_reader.py --benchmark
+  python3 scripts/artifact_reader.py --benchmark silo-core/deployments
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+CHUNK_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+
+
+class _Stream:
+    """Text buffer over a file: refills on demand and drops consumed data."""
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append one chunk (dropping consumed text first). False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character (not consumed), "" at end of file."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the buffer end may continue in the next chunk.
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip_string(self, sink: Any = None) -> None:
+        """Skip a string value starting at pos (the opening quote); feed raw contents to sink.update."""
+        self.pos += 1
+        while True:
+            end = self.buf.find('"', self.pos)
+            while end != -1:
+                backslashes = 0
+                while end - 1 - backslashes >= self.pos and self.buf[end - 1 - backslashes] == "\\":
+                    backslashes += 1
+                if backslashes % 2 == 0:
+                    break
+                end = self.buf.find('"', end + 1)
+            if end != -1:
+                if sink is not None:
+                    sink.update(self.buf[self.pos : end])
+                self.pos = end + 1
+                return
+            # Keep a trailing backslash run so an escaped quote at the chunk edge is still seen.
+            keep = len(self.buf)
+            while keep > self.pos and self.buf[keep - 1] == "\\":
+                keep -= 1
+            if sink is not None:
+                sink.update(self.buf[self.pos : keep])
+            self.pos = keep
+            if not self.fill():
+                raise ValueError("unterminated string")
+
+    def skip_value(self) -> None:
+        first = self.peek()
+        if first == '"':
+            self.skip_string()
+            return
+        if first not in "{[":
+            self.decode()  # number / true / false / null
+            return
+        depth = 0
+        while True:
+            m = _STRUCTURAL.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise ValueError("unterminated container")
+                continue
+            ch = m.group()
+            self.pos = m.start()
+            if ch == '"':
+                self.skip_string()
+                continue
+            self.pos += 1
+            if ch in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+class _Sha256Sink:
+    """Lowercases hex text before hashing, so hashes match sha256(value.lower())."""
+
+    def __init__(self) -> None:
+        self.h = hashlib.sha256()
+        self.length = 0
+
+    def update(self, text: str) -> None:
+        self.length += len(text)
+        self.h.update(text.lower().encode("ascii", errors="ignore"))
+
+
+def extract_top_level(
+    fp: TextIO,
+    wanted: set[str],
+    hashed: set[str] | frozenset[str] = frozenset(),
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    ({key: value} for wanted keys, {key: sha256 hex} for hashed string keys) of the
+    top-level JSON object in fp. Stops reading once every wanted/hashed key was found.
+    Raises ValueError on malformed JSON.
+    """
+    stream = _Stream(fp, chunk_size)
+    values: dict[str, Any] = {}
+    hashes: dict[str, str] = {}
+    remaining = set(wanted) | set(hashed)
+    try:
+        stream.expect("{")
+        if stream.peek() == "}":
+            return values, hashes
+        while remaining:
+            key = stream.decode()
+            stream.expect(":")
+            if key in wanted:
+                values[key] = stream.decode()
+            elif key in hashed and stream.peek() == '"':
+                sink = _Sha256Sink()
+                stream.skip_string(sink)
+                if sink.length > 2:  # "" and "0x" mean no code
+                    hashes[key] = sink.h.hexdigest()
+            else:
+                stream.skip_value()
+            remaining.discard(key)
+            sep = stream.peek()
+            if sep == "}":
+                break
+            stream.expect(",")
+    except json.JSONDecodeError as e:
+        raise ValueError(str(e)) from e
+    return values, hashes
+
+
+@dataclass(frozen=True)
+class DeploymentArtifact:
+    address: Any
+    abi: Any
+    deployed_bytecode_hash: str  # sha256 of lowercased deployedBytecode, "" if missing
+
+
+def read_deployment_artifact(path: Path) -> DeploymentArtifact:
+    """address, abi and deployedBytecode hash of a deployment artifact (OSError/ValueError on failure)."""
+    with path.open(encoding="utf-8") as fp:
+        values, hashes = extract_top_level(fp, {"address", "abi"}, {"deployedBytecode"})
+    return DeploymentArtifact(values.get("address"), values.get("abi"), hashes.get("deployedBytecode", ""))
+
+
+def read_broadcast_transactions(path: Path) -> Any:
+    """The "transactions" array of a forge run-latest.json (skips receipts etc.)."""
+    with path.open(encoding="utf-8") as fp:
+        values, _ = extract_top_level(fp, {"transactions"})
+    return values.get("transactions")
+
+
+def _benchmark(root: Path) -> int:
+    files = sorted(root.glob("**/*.json"))
+    if not files:
+        print(f"No JSON files under {root}", file=sys.stderr)
+        return 2
+    total_bytes = sum(f.stat().st_size for f in files)
+
+    def full_load() -> int:
+        n = 0
+        for f in files:
+            data = json.loads(f.read_text(encoding="utf-8"))
+            n += isinstance(data, dict) and isinstance(data.get("address"), str)
+        return n
+
+    def address_abi() -> int:
+        n = 0
+        for f in files:
+            with f.open(encoding="utf-8") as fp:
+                values, _ = extract_top_level(fp, {"address", "abi"})
+            n += isinstance(values.get("address"), str)
+        return n
+
+    def with_bytecode_hash() -> int:
+        return sum(isinstance(read_deployment_artifact(f).address, str) for f in files)
+
+    print(f"{len(files)} files, {total_bytes / 1e6:.1f} MB under {root}")
+    print(f"  {'mode':<34}{'time':>10}{'peak mem':>12}")
+    for label, fn in [
+        ("json.loads (full document)", full_load),
+        ("stream: address + abi", address_abi),
+        ("stream: + deployedBytecode sha256", with_bytecode_hash),
+    ]:
+        # Time without tracemalloc (it slows down allocation-heavy parsing), then a traced run for peak memory.
+        elapsed = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            found = fn()
+            elapsed = min(elapsed, time.perf_counter() - t0)
+        tracemalloc.start()
+        fn()
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {label:<34}{elapsed * 1000:>8.0f}ms{peak / 1e6:>10.1f}MB   ({found} with address)")
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Partial JSON reads of deployment artifacts.")
+    p.add_argument(
+        "--benchmark",
+        nargs="?",
+        const="silo-core/deployments",
+        metavar="DIR",
+        help="Compare json.loads with streaming extraction over DIR (default: silo-core/deployments).",
+    )
+    args = p.parse_args()
+    if args.benchmark is None:
+        p.print_help()
+        return 0
+    repo_root = Path(__file__).resolve().parents[1]
+    return _benchmark((repo_root / args.benchmark).resolve())
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
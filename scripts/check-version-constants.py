@@ -4,37 +4,62 @@ Script to validate VERSION constants in Solidity contracts.
 
 For release/hotfix PRs: checks if VERSION matches the branch version.
 For regular PRs: checks if VERSION is higher than the last tag.
+
+Usage:
+    python3 scripts/check-version-constants.py regular
+    python3 scripts/check-version-constants.py release-hotfix
+
+    # read VERSIONs by git blob hash (one `git diff --raw`, cached in .cache/version-constants.json);
+    # checks the committed content of the diffed range, so uncommitted edits are not seen.
+    # Also requires each modified VERSION to be higher than the VERSION its file had at the last
+    # tag (the tag's VERSION map is computed once per tag and cached). CI runs this mode.
+    python3 scripts/check-version-constants.py regular --incremental
 """
 
 import re
 import sys
 import os
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional, Tuple, List
 from packaging import version
 
+from sol_lexer import scan_source
+from version_cache import ZERO_BLOB, VersionCache, default_cache_path, diff_raw
 
-def get_modified_sol_files() -> List[str]:
-    """Get list of modified .sol files in contracts/* directories."""
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def get_diff_ranges() -> List[str]:
+    """Ranges to diff, most specific first (the first one git can diff is used)."""
     # In GitHub Actions PR context, use GITHUB_BASE_REF
     base_ref = os.environ.get('GITHUB_BASE_REF', 'main')
     head_ref = os.environ.get('GITHUB_HEAD_REF', None)
     
-    # Try different approaches to get modified files
-    diff_commands = []
+    ranges = []
     
     if head_ref:
         # PR context: compare head with base
-        diff_commands.append(["git", "diff", "--name-only", "--diff-filter=AM", f"origin/{base_ref}...origin/{head_ref}"])
-        diff_commands.append(["git", "diff", "--name-only", "--diff-filter=AM", f"{base_ref}...{head_ref}"])
+        ranges.append(f"origin/{base_ref}...origin/{head_ref}")
+        ranges.append(f"{base_ref}...{head_ref}")
     
     # Fallback options
-    diff_commands.extend([
-        ["git", "diff", "--name-only", "--diff-filter=AM", f"origin/{base_ref}...HEAD"],
-        ["git", "diff", "--name-only", "--diff-filter=AM", f"origin/master...HEAD"],
-        ["git", "diff", "--name-only", "--diff-filter=AM", "HEAD~1"],
+    ranges.extend([
+        f"origin/{base_ref}...HEAD",
+        f"origin/master...HEAD",
+        "HEAD~1",
     ])
+    return ranges
+
+
+def get_modified_sol_files() -> List[str]:
+    """Get list of modified .sol files in contracts/* directories."""
+    # Try different approaches to get modified files
+    diff_commands = [
+        ["git", "diff", "--name-only", "--diff-filter=AM", diff_range]
+        for diff_range in get_diff_ranges()
+    ]
     
     for cmd in diff_commands:
         try:
@@ -68,75 +93,11 @@ def extract_contract_name(file_path: str) -> str:
 
 
 def extract_version_constant(file_path: str) -> Optional[str]:
-    """Extract VERSION constant or function value from Solidity file."""
+    """Extract VERSION constant or function value from Solidity file (see sol_lexer.py)."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        # First, try to match constant: string public constant VERSION = "ContractName X.Y.Z";
-        # or: string public constant VERSION = 'ContractName X.Y.Z';
-        constant_pattern = r'string\s+public\s+constant\s+VERSION\s*=\s*["\']([^"\']+)["\']\s*;'
-        match = re.search(constant_pattern, content)
-        
-        if match:
-            return match.group(1)
-        
-        # If not found, try to match function: function VERSION() ... returns (string memory) { return "ContractName X.Y.Z"; }
-        # This pattern handles multi-line function definitions with DOTALL flag
-        # Match from function declaration through the return statement
-        function_pattern = r'function\s+VERSION\(\)[^{]*?\{[^}]*?return\s+["\']([^"\']+)["\']\s*;'
-        match = re.search(function_pattern, content, re.DOTALL)
-        
-        if match:
-            return match.group(1)
-        
-        # More robust approach: find function VERSION() and extract return value from its body
-        # Look for function VERSION() declaration
-        function_start_match = re.search(r'function\s+VERSION\(\)', content)
-        
-        if function_start_match:
-            # Find the opening brace of the function
-            start_pos = function_start_match.end()
-            brace_start = content.find('{', start_pos)
-            
-            if brace_start != -1:
-                # Find matching closing brace
-                brace_count = 0
-                in_string = False
-                string_char = None
-                
-                for i in range(brace_start, len(content)):
-                    char = content[i]
-                    
-                    # Handle string literals (skip escaped quotes)
-                    if char in ('"', "'") and (i == 0 or content[i-1] != '\\'):
-                        if not in_string:
-                            in_string = True
-                            string_char = char
-                        elif char == string_char:
-                            in_string = False
-                            string_char = None
-                        continue
-                    
-                    if in_string:
-                        continue
-                    
-                    # Count braces
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            # Found the end of the function
-                            function_body = content[brace_start:i+1]
-                            # Look for return statement in the function body
-                            return_pattern = r'return\s+["\']([^"\']+)["\']\s*;'
-                            return_match = re.search(return_pattern, function_body)
-                            if return_match:
-                                return return_match.group(1)
-                            break
-        
-        return None
+        return scan_source(content).version
     except Exception as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
         return None
@@ -159,8 +120,8 @@ def parse_version_string(version_str: str) -> Tuple[Optional[str], Optional[str]
     return None, None
 
 
-def get_last_tag_version() -> Optional[str]:
-    """Get the latest git tag version."""
+def get_last_tag() -> Optional[str]:
+    """Get the latest git tag name."""
     try:
         result = subprocess.run(
             ["git", "describe", "--tags", "--abbrev=0"],
@@ -168,15 +129,22 @@ def get_last_tag_version() -> Optional[str]:
             text=True,
             check=True
         )
-        tag = result.stdout.strip()
-        # Remove 'v' prefix if present
-        if tag.startswith('v'):
-            tag = tag[1:]
-        return tag
+        return result.stdout.strip()
     except subprocess.CalledProcessError:
         return None
 
 
+def tag_to_version(tag: str) -> str:
+    """Tag name without its 'v' prefix."""
+    return tag[1:] if tag.startswith('v') else tag
+
+
+def get_last_tag_version() -> Optional[str]:
+    """Get the latest git tag version."""
+    tag = get_last_tag()
+    return tag_to_version(tag) if tag is not None else None
+
+
 def get_branch_version() -> Optional[str]:
     """Extract version from branch name (release/X.Y.Z or hotfix/X.Y.Z)."""
     try:
@@ -212,8 +180,11 @@ def get_branch_version() -> Optional[str]:
 
 def validate_version_for_release_hotfix(file_path: str, expected_version: str) -> Tuple[bool, str]:
     """Validate VERSION constant for release/hotfix PRs."""
-    version_str = extract_version_constant(file_path)
-    
+    return check_version_for_release_hotfix(file_path, extract_version_constant(file_path), expected_version)
+
+
+def check_version_for_release_hotfix(file_path: str, version_str: Optional[str], expected_version: str) -> Tuple[bool, str]:
+    """Validate an already extracted VERSION of file_path for release/hotfix PRs."""
     if version_str is None:
         # No VERSION constant, skip
         return True, "No VERSION constant found, skipping"
@@ -237,8 +208,11 @@ def validate_version_for_release_hotfix(file_path: str, expected_version: str) -
 
 def validate_version_for_regular_pr(file_path: str, last_tag: Optional[str]) -> Tuple[bool, str]:
     """Validate VERSION constant for regular PRs."""
-    version_str = extract_version_constant(file_path)
-    
+    return check_version_for_regular_pr(file_path, extract_version_constant(file_path), last_tag)
+
+
+def check_version_for_regular_pr(file_path: str, version_str: Optional[str], last_tag: Optional[str]) -> Tuple[bool, str]:
+    """Validate an already extracted VERSION of file_path for regular PRs."""
     if version_str is None:
         # No VERSION constant, skip
         return True, "No VERSION constant found, skipping"
@@ -268,10 +242,59 @@ def validate_version_for_regular_pr(file_path: str, last_tag: Optional[str]) ->
         return False, f"Error comparing versions: {e}"
 
 
+def check_version_against_tag(version_str: Optional[str], previous: Optional[str], tag: str) -> Tuple[bool, str]:
+    """Compare a VERSION with the VERSION the same file had at tag (from the tag's VERSION map)."""
+    if version_str is None or previous is None:
+        return True, f"no VERSION at {tag}"
+    
+    _name, version_num = parse_version_string(version_str)
+    _previous_name, previous_num = parse_version_string(previous)
+    if version_num is None or previous_num is None:
+        return True, f"VERSION at {tag}: '{previous}'"
+    
+    try:
+        if version.parse(version_num) > version.parse(previous_num):
+            return True, f"VERSION at {tag}: '{previous}'"
+        return False, f"Version '{version_num}' must be higher than '{previous}' at {tag}"
+    except Exception as e:
+        return False, f"Error comparing versions: {e}"
+
+
+def get_modified_versions_incremental(cache: VersionCache) -> List[Tuple[str, Optional[str]]]:
+    """
+    (path, VERSION) of modified .sol files in contracts/* directories, from the blob hashes of one
+    `git diff --raw`. Blobs already in the cache are not read again; the rest are read in one git call.
+    """
+    changed = diff_raw(get_diff_ranges()) or []
+    versions = cache.versions(blob for _path, blob in changed if blob != ZERO_BLOB)
+    result = []
+    for path, blob in changed:
+        if blob not in versions:
+            # Working-tree change (no blob yet) or unreadable blob: hash the file on disk
+            try:
+                data = (REPO_ROOT / path).read_bytes()
+            except OSError as e:
+                print(f"Error reading {path}: {e}", file=sys.stderr)
+                result.append((path, None))
+                continue
+            blob = cache.add_content(data)
+            versions.update(cache.versions([blob]))
+        result.append((path, versions[blob]))
+    return result
+
+
 def main():
-    mode = sys.argv[1] if len(sys.argv) > 1 else "regular"
+    args = [arg for arg in sys.argv[1:] if arg != "--incremental"]
+    incremental = len(args) != len(sys.argv) - 1
+    mode = args[0] if args else "regular"
     
-    modified_files = get_modified_sol_files()
+    started = time.perf_counter()
+    cache = VersionCache(default_cache_path(REPO_ROOT)) if incremental else None
+    if cache is not None:
+        modified = get_modified_versions_incremental(cache)
+    else:
+        modified = [(f, None) for f in get_modified_sol_files()]
+    modified_files = [f for f, _version in modified]
     
     if not modified_files:
         print("No modified .sol files in contracts/* directories found.")
@@ -284,6 +307,11 @@ def main():
     
     errors = []
     
+    # Incremental: VERSION of every contract at the last tag, computed once per tag and cached;
+    # each modified VERSION must be higher than the one its file had at that tag
+    tag = get_last_tag() if cache is not None else None
+    tag_versions = cache.tag_versions(tag) if cache is not None and tag is not None else {}
+    
     if mode == "release-hotfix":
         expected_version = get_branch_version()
         if expected_version is None:
@@ -292,9 +320,15 @@ def main():
         
         print(f"Checking VERSION constants against branch version: {expected_version}\n")
         
-        for file_path in modified_files:
+        for file_path, version_str in modified:
             print(f"Checking {file_path}...")
-            is_valid, message = validate_version_for_release_hotfix(file_path, expected_version)
+            if cache is not None:
+                is_valid, message = check_version_for_release_hotfix(file_path, version_str, expected_version)
+                if is_valid and version_str is not None and tag is not None:
+                    is_valid, tag_message = check_version_against_tag(version_str, tag_versions.get(file_path), tag)
+                    message = tag_message if not is_valid else f"{message} ({tag_message})"
+            else:
+                is_valid, message = validate_version_for_release_hotfix(file_path, expected_version)
             print(f"  {message}")
             
             if not is_valid:
@@ -302,21 +336,34 @@ def main():
             print()
     
     else:  # regular PR
-        last_tag = get_last_tag_version()
+        if cache is None:
+            tag = get_last_tag()
+        last_tag = tag_to_version(tag) if tag is not None else None
         if last_tag:
             print(f"Last tag version: {last_tag}\n")
         else:
             print("No previous tags found.\n")
         
-        for file_path in modified_files:
+        for file_path, version_str in modified:
             print(f"Checking {file_path}...")
-            is_valid, message = validate_version_for_regular_pr(file_path, last_tag)
+            if cache is not None:
+                is_valid, message = check_version_for_regular_pr(file_path, version_str, last_tag)
+                if is_valid and version_str is not None and tag is not None:
+                    is_valid, tag_message = check_version_against_tag(version_str, tag_versions.get(file_path), tag)
+                    message = tag_message if not is_valid else f"{message} ({tag_message})"
+            else:
+                is_valid, message = validate_version_for_regular_pr(file_path, last_tag)
             print(f"  {message}")
             
             if not is_valid:
                 errors.append((file_path, message))
             print()
     
+    if cache is not None:
+        cache.save()
+        elapsed = time.perf_counter() - started
+        print(f"Incremental check: {cache.hits} cached / {cache.misses} new blob(s), {elapsed * 1000:.0f} ms")
+    
     if errors:
         print("\n❌ Validation failed for the following files:")
         for file_path, error_msg in errors:
@@ -6,7 +6,7 @@ common/addresses for that chain.
 
 Uses deployment ABI to decide: only contracts whose ABI has getRoleMemberCount(bytes32)
 and getRoleMember(bytes32,uint256) are checked. Then eth_call getRoleMemberCount(DEFAULT_ADMIN_ROLE)
-and getRoleMember(DEFAULT_ADMIN_ROLE, 0). If admin != DAO -> FAIL.
+and getRoleMember(DEFAULT_ADMIN_ROLE, 0), JSON-RPC batched (scripts/rpc_client.py). If admin != DAO -> FAIL.
 
 Output and behaviour mirror check_deployments_owner_is_dao.py: one line per
 contract ([ ok ] / [skip] / [FAIL]), no summary, exit 1 if any FAIL.
@@ -25,9 +25,14 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import TextIO
+
+from abi_codec import decode_address, decode_uint, encode_call
+from deployment_index import load_index
+from rpc_client import RpcClient, get_client
 
 # OpenZeppelin AccessControl: DEFAULT_ADMIN_ROLE = bytes32(0)
-DEFAULT_ADMIN_ROLE_HEX = "0" * 64
+DEFAULT_ADMIN_ROLE = bytes(32)
 
 # getRoleMemberCount(bytes32) selector
 GET_ROLE_MEMBER_COUNT_SELECTOR = "0xca15c873"
@@ -79,107 +84,36 @@ def get_dao_address(common_addresses: dict[str, str]) -> str | None:
     return common_addresses.get("DAO")
 
 
-def abi_has_access_control_admin(abi: list | None) -> bool:
-    """True if ABI has getRoleMemberCount(bytes32) and getRoleMember(bytes32,uint256) (AccessControlEnumerable)."""
-    if not abi:
-        return False
-    has_count = has_member = False
-    for item in abi:
-        if not (isinstance(item, dict) and item.get("type") == "function"):
-            continue
-        name = item.get("name")
-        ins = item.get("inputs") or []
-        types = [inp.get("type") for inp in ins]
-        if name == "getRoleMemberCount" and types == ["bytes32"]:
-            has_count = True
-        if name == "getRoleMember" and types == ["bytes32", "uint256"]:
-            has_member = True
-    return has_count and has_member
-
-
 def collect_deployment_addresses(
     repo_root: Path, chain: str, components: list[str]
-) -> list[tuple[str, str, str, list | None]]:
-    """Returns list of (component, contract_name, address, abi). abi is from deployment JSON or None."""
-    out: list[tuple[str, str, str, list | None]] = []
-    for comp in components:
-        base = repo_root / COMPONENT_PATHS[comp] / chain
-        if not base.exists():
-            continue
-        for j in base.glob("*.json"):
-            try:
-                data = json.loads(j.read_text(encoding="utf-8"))
-                addr = (data.get("address") or "").strip()
-                if isinstance(addr, str) and addr.startswith("0x") and len(addr) >= 42:
-                    name = j.stem
-                    if name.endswith(".sol"):
-                        name = name[:-4]
-                    abi = data.get("abi")
-                    if not isinstance(abi, list):
-                        abi = None
-                    out.append((comp, name, addr.lower(), abi))
-            except (json.JSONDecodeError, OSError):
-                continue
-    return out
-
-
-def _eth_call(rpc_url: str, to: str, data: str) -> str | None:
-    to = to if to.startswith("0x") else "0x" + to
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "eth_call",
-        "params": [{"to": to, "data": data}, "latest"],
-    }
-    try:
-        from urllib.request import Request, urlopen
-        from urllib.error import HTTPError, URLError
-
-        req = Request(
-            rpc_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=30) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-    except (HTTPError, URLError, OSError, json.JSONDecodeError, KeyError):
-        return None
-    if body.get("error"):
-        return None
-    result = (body.get("result") or "").strip()
-    return result if result else None
+) -> list[tuple[str, str, str, frozenset[str]]]:
+    """Returns list of (component, contract_name, address, interfaces) from the deployment index."""
+    return [(d.component, d.name, d.address, d.interfaces) for d in load_index(repo_root).deployments(chain, components)]
 
 
-def eth_call_admin(rpc_url: str, contract_address: str) -> str | None:
+def eth_call_admin(client: RpcClient, contract_address: str) -> str | None:
     """
     Get first DEFAULT_ADMIN_ROLE holder via getRoleMemberCount + getRoleMember.
     Returns address (lowercase) or None if contract has no AccessControlEnumerable / revert.
     """
-    # getRoleMemberCount(DEFAULT_ADMIN_ROLE): selector + bytes32(0)
-    data_count = GET_ROLE_MEMBER_COUNT_SELECTOR + DEFAULT_ADMIN_ROLE_HEX
-    result = _eth_call(rpc_url, contract_address, data_count)
-    if result is None:
-        return None
-    # uint256: 32 bytes = 64 hex chars
-    if len(result) < 64:
-        return None
-    count_hex = result[-64:]
-    try:
-        count = int(count_hex, 16)
-    except ValueError:
-        return None
-    if count == 0:
-        return None
-    # getRoleMember(DEFAULT_ADMIN_ROLE, 0): selector + role (32 bytes) + index (32 bytes = 0)
-    data_member = GET_ROLE_MEMBER_SELECTOR + DEFAULT_ADMIN_ROLE_HEX + "0" * 64
-    result = _eth_call(rpc_url, contract_address, data_member)
-    if result is None or len(result) < 64:
-        return None
-    addr = "0x" + result[-40:].lower()
-    if addr == "0x" + "0" * 40:
-        return None
-    return addr
+    return eth_call_admins(client, [contract_address])[0]
+
+
+def eth_call_admins(client: RpcClient, contract_addresses: list[str]) -> list[str | None]:
+    """
+    Batched eth_call_admin for many contracts: one JSON-RPC batch of getRoleMemberCount,
+    then one batch of getRoleMember for contracts with count > 0. Same order as input.
+    """
+    data_count = encode_call(GET_ROLE_MEMBER_COUNT_SELECTOR, ["bytes32"], [DEFAULT_ADMIN_ROLE])
+    counts = [
+        decode_uint(result)
+        for result, _err in client.eth_call_many([(a, data_count) for a in contract_addresses])
+    ]
+    with_admin = [a for a, count in zip(contract_addresses, counts) if count]
+    data_member = encode_call(GET_ROLE_MEMBER_SELECTOR, ["bytes32", "uint256"], [DEFAULT_ADMIN_ROLE, 0])
+    members = client.eth_call_many([(a, data_member) for a in with_admin])
+    admin_by_address = {a: decode_address(result) for a, (result, _err) in zip(with_admin, members)}
+    return [admin_by_address.get(a) for a in contract_addresses]
 
 
 def main() -> int:
@@ -191,79 +125,107 @@ def main() -> int:
             print(f"Unknown component: {c}. Allowed: {list(COMPONENT_PATHS.keys())}", file=sys.stderr)
             return 2
 
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None)
+    if not args.dry_run and not rpc_url:
+        hint = rpc_env or f"RPC_<chain> (add {chain!r} to CHAIN_TO_RPC_ENV)"
+        print(f"RPC URL not set. Use --rpc-url or set env {hint}", file=sys.stderr)
+        return 2
+
     repo_root = Path(__file__).resolve().parents[1]
+    return check_chain(repo_root, chain, components, rpc_url, dry_run=args.dry_run)
+
+
+def check_chain(
+    repo_root: Path,
+    chain: str,
+    components: list[str],
+    rpc_url: str | None,
+    *,
+    dry_run: bool = False,
+    out: TextIO | None = None,
+) -> int:
+    """Run the admin-is-DAO check for one chain. Report lines go to out (default stdout). Returns exit code."""
+    # Diagnostics go to out when it is a buffered per-chain report (all-chains run), else to stderr.
+    log = out or sys.stderr
+    out = out or sys.stdout
     common_addresses = load_common_addresses(repo_root, chain)
     dao_address = get_dao_address(common_addresses)
     if not dao_address:
-        print(f"DAO not found in common/addresses/{chain}.json", file=sys.stderr)
+        print(f"DAO not found in common/addresses/{chain}.json", file=log)
         return 2
 
     addr_to_key: dict[str, str] = {addr: key for key, addr in common_addresses.items()}
 
-    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
-    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None)
-    if not args.dry_run and not rpc_url:
-        hint = rpc_env or f"RPC_<chain> (add {chain!r} to CHAIN_TO_RPC_ENV)"
-        print(f"RPC URL not set. Use --rpc-url or set env {hint}", file=sys.stderr)
-        return 2
-
     deployments = collect_deployment_addresses(repo_root, chain, components)
     if not deployments:
-        print(f"No deployments found for chain={chain}, components={components}", file=sys.stderr)
+        print(f"No deployments found for chain={chain}, components={components}", file=log)
         return 0
 
     deployments.sort(key=lambda x: (x[0], x[1]))  # alphabetical: component, then contract name
 
+    # Batch RPC: admin lookup for every AccessControl contract up front.
+    admin_by_address: dict[str, str | None] = {}
+    if not dry_run:
+        checked = sorted(
+            {
+                address
+                for _c, name, address, tags in deployments
+                if name not in CONTRACTS_EXCLUDED and "AccessControlEnumerable" in tags
+            }
+        )
+        admin_by_address = dict(zip(checked, eth_call_admins(get_client(rpc_url), checked)))
+
     has_failure = False
     skip_count = 0
     ok_count = 0
     fail_count = 0
     failed_contracts: list[tuple[str, str]] = []
 
-    for component, contract_name, address, abi in deployments:
-        if args.dry_run:
-            print(f"[dry-run] {component} {contract_name} {address}")
+    for component, contract_name, address, interfaces in deployments:
+        if dry_run:
+            print(f"[dry-run] {component} {contract_name} {address}", file=out)
             continue
 
         if contract_name in CONTRACTS_EXCLUDED:
-            print(f"[skip] {component} {contract_name} excluded from check")
+            print(f"[skip] {component} {contract_name} excluded from check", file=out)
             skip_count += 1
             continue
 
-        if not abi_has_access_control_admin(abi):
-            print(f"[skip] {component} {contract_name} no AccessControl")
+        if "AccessControlEnumerable" not in interfaces:
+            print(f"[skip] {component} {contract_name} no AccessControl", file=out)
             skip_count += 1
             continue
 
-        admin = eth_call_admin(rpc_url, address)
+        admin = admin_by_address.get(address)
         if admin is None:
-            print(f"[skip] {component} {contract_name} getRoleMember call failed")
+            print(f"[skip] {component} {contract_name} getRoleMember call failed", file=out)
             skip_count += 1
             continue
 
         if admin == dao_address:
-            print(f"[ ok ] {component} {contract_name} admin is DAO")
+            print(f"[ ok ] {component} {contract_name} admin is DAO", file=out)
             ok_count += 1
             continue
 
         key = addr_to_key.get(admin)
         if key is None:
-            print(f"[FAIL] {component} {contract_name} admin {admin} not in common/addresses/{chain}.json (expected DAO)")
+            print(f"[FAIL] {component} {contract_name} admin {admin} not in common/addresses/{chain}.json (expected DAO)", file=out)
         else:
-            print(f"[FAIL] {component} {contract_name} admin is {key} ({admin}), expected DAO")
+            print(f"[FAIL] {component} {contract_name} admin is {key} ({admin}), expected DAO", file=out)
         has_failure = True
         fail_count += 1
         failed_contracts.append((component, contract_name))
 
-    if args.dry_run:
-        print(f"Dry-run: would check {len(deployments)} deployments for chain={chain}.")
+    if dry_run:
+        print(f"Dry-run: would check {len(deployments)} deployments for chain={chain}.", file=out)
         return 0
 
-    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}")
+    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}", file=out)
     if failed_contracts:
-        print("Contracts failing verification:")
+        print("Contracts failing verification:", file=out)
         for component, contract_name in failed_contracts:
-            print(f"  - {component}/{contract_name}")
+            print(f"  - {component}/{contract_name}", file=out)
     return 1 if has_failure else 0
 
 
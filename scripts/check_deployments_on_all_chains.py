@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Run the on-chain deployment checks (owner, admin, version) for many chains in one process.
+
+Each chain gets its own worker pool running its checks concurrently; chains run in
+parallel too, so total wall time is roughly the slowest chain instead of the sum over
+chains. RPC traffic goes through the shared pooled client (scripts/rpc_client.py):
+one connection pool per RPC URL, capped at --max-rpc-concurrency in-flight requests.
+
+Output of every (chain, check) is buffered and printed as one merged report, followed
+by a summary table with exit codes and per-chain wall time.
+
+Usage:
+
+  # all chains from CHAIN_TO_RPC_ENV, all checks (RPC_* env vars as for the single-chain scripts)
+  python3 scripts/check_deployments_on_all_chains.py --chain all
+
+  # subset of chains and checks
+  python3 scripts/check_deployments_on_all_chains.py --chain mainnet,sonic --checks admin,version
+
+Exit code: highest exit code of all (chain, check) runs (0 ok, 1 check failed, 2 config/RPC error).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import check_deployments_admin_is_dao as admin_check
+import check_deployments_owner_is_dao as owner_check
+import check_deployments_version_on_chain as version_check
+from rpc_client import DEFAULT_MAX_CONNECTIONS, get_client
+
+CHAIN_TO_RPC_ENV = owner_check.CHAIN_TO_RPC_ENV
+CHAIN_DISPLAY_NAMES = owner_check.CHAIN_DISPLAY_NAMES
+COMPONENTS = list(owner_check.COMPONENT_PATHS.keys())
+
+CHECK_NAMES = ["owner", "admin", "version"]
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Run owner/admin/version deployment checks for many chains concurrently."
+    )
+    p.add_argument(
+        "--chain",
+        default="all",
+        help="Comma-separated chain names, or 'all' for every chain in CHAIN_TO_RPC_ENV. Default: all.",
+    )
+    p.add_argument(
+        "--checks",
+        default=",".join(CHECK_NAMES),
+        help=f"Comma-separated checks to run: {', '.join(CHECK_NAMES)}. Default: all.",
+    )
+    p.add_argument("--components", default="core,oracle,vaults", help="Comma-separated: core, oracle, vaults.")
+    p.add_argument(
+        "--max-rpc-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help=f"Max in-flight requests per RPC URL. Default: {DEFAULT_MAX_CONNECTIONS}.",
+    )
+    p.add_argument("--multicall", action="store_true", help="Owner check: use Multicall3 aggregate3 mode.")
+    p.add_argument("--resolve-proxies", action="store_true", help="Owner/version checks: show proxy kind of failing contracts.")
+    p.add_argument("--dry-run", action="store_true", help="Only list contracts, do not call RPC.")
+    return p.parse_args()
+
+
+def parse_list(raw: str, allowed: list[str], what: str) -> list[str]:
+    if raw.strip().lower() == "all":
+        return list(allowed)
+    items = [c.strip() for c in raw.split(",") if c.strip()]
+    unknown = [c for c in items if c not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown {what}: {unknown}. Allowed: {allowed}")
+    return items
+
+
+def build_check_runners(args: argparse.Namespace) -> dict[str, Callable[..., int]]:
+    """check name -> fn(repo_root, chain, components, rpc_url, out) -> exit code."""
+    return {
+        "owner": lambda root, chain, comps, rpc_url, out: owner_check.check_chain(
+            root,
+            chain,
+            comps,
+            rpc_url,
+            dry_run=args.dry_run,
+            multicall=args.multicall,
+            resolve_proxies=args.resolve_proxies,
+            out=out,
+        ),
+        "admin": lambda root, chain, comps, rpc_url, out: admin_check.check_chain(
+            root, chain, comps, rpc_url, dry_run=args.dry_run, out=out
+        ),
+        "version": lambda root, chain, comps, rpc_url, out: version_check.check_chain(
+            root, chain, comps, rpc_url, dry_run=args.dry_run, resolve_proxies=args.resolve_proxies, out=out
+        ),
+    }
+
+
+def run_chain(
+    repo_root: Path,
+    chain: str,
+    checks: list[str],
+    components: list[str],
+    runners: dict[str, Callable[..., int]],
+    *,
+    dry_run: bool,
+    max_rpc_concurrency: int,
+) -> tuple[dict[str, tuple[int, str, float]], float]:
+    """Run all checks for one chain in its own worker pool. Returns ({check: (exit, output, seconds)}, wall)."""
+    started = time.perf_counter()
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = os.environ.get(rpc_env) if rpc_env else None
+    if not dry_run and not rpc_url:
+        msg = f"RPC URL not set. Set env {rpc_env or 'RPC_<chain>'}\n"
+        return {check: (2, msg, 0.0) for check in checks}, 0.0
+    if rpc_url:
+        # Create the shared client first, so every check of this chain uses the same capped pool.
+        get_client(rpc_url, max_connections=max_rpc_concurrency)
+
+    def run_one(check: str) -> tuple[int, str, float]:
+        out = io.StringIO()
+        t0 = time.perf_counter()
+        try:
+            code = runners[check](repo_root, chain, components, rpc_url, out)
+        except Exception as e:  # one broken check must not hide the others
+            print(f"{check} check crashed: {type(e).__name__}: {e}", file=out)
+            code = 2
+        return code, out.getvalue(), time.perf_counter() - t0
+
+    with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix=f"{chain}") as pool:
+        results = dict(zip(checks, pool.map(run_one, checks)))
+    return results, time.perf_counter() - started
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        chains = parse_list(args.chain, sorted(CHAIN_TO_RPC_ENV.keys()), "chain(s)")
+        checks = parse_list(args.checks, CHECK_NAMES, "check(s)")
+        components = parse_list(args.components, COMPONENTS, "component(s)")
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    if not chains or not checks:
+        return 0
+
+    repo_root = Path(__file__).resolve().parents[1]
+    runners = build_check_runners(args)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(chains), thread_name_prefix="chain") as pool:
+        futures = {
+            chain: pool.submit(
+                run_chain,
+                repo_root,
+                chain,
+                checks,
+                components,
+                runners,
+                dry_run=args.dry_run,
+                max_rpc_concurrency=args.max_rpc_concurrency,
+            )
+            for chain in chains
+        }
+        results = {chain: f.result() for chain, f in futures.items()}
+    total = time.perf_counter() - started
+
+    exit_code = 0
+    for chain in chains:
+        by_check, _wall = results[chain]
+        for check in checks:
+            code, output, seconds = by_check[check]
+            exit_code = max(exit_code, code)
+            print("=" * 60)
+            print(f"[{chain}] {check} check (exit {code}, {seconds:.2f}s)")
+            print("=" * 60)
+            print(output.rstrip("\n"))
+            print()
+
+    print("Summary:")
+    header = f"  {'chain':<14}" + "".join(f"{check:>10}" for check in checks) + f"{'wall':>10}"
+    print(header)
+    for chain in chains:
+        by_check, wall = results[chain]
+        status = "".join(f"{_status(by_check[check][0]):>10}" for check in checks)
+        print(f"  {CHAIN_DISPLAY_NAMES.get(chain, chain):<14}{status}{wall:>9.2f}s")
+    slowest = max(results[c][1] for c in chains)
+    summed = sum(results[c][1] for c in chains)
+    print()
+    print(f"Total wall time: {total:.2f}s (slowest chain {slowest:.2f}s, sum over chains {summed:.2f}s)")
+    return exit_code
+
+
+def _status(code: int) -> str:
+    return {0: "ok", 1: "FAIL"}.get(code, "ERROR")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
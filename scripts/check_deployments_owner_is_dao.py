@@ -6,7 +6,7 @@ owner() returns an owner that is the DAO from common/addresses for that chain.
 Intended to run in CI matrix per blockchain. For each chain:
   - Load all deployment addresses (and ABI) from silo-core, silo-oracles, silo-vaults.
   - For each address: if the deployment ABI has no owner() function, skip (no RPC call).
-  - If ABI has owner(): eth_call owner() and check that the owner is DAO in common/addresses/<chain>.json
+  - If ABI has owner(): eth_call owner() (JSON-RPC batched, see scripts/rpc_client.py) and check that the owner is DAO in common/addresses/<chain>.json
     and that the key is "DAO". If key is DAO -> pass (green). If key is something else or
     owner not in file -> CI fail with a clear message (contract name, owner address, key or "not in common-addresses").
 
@@ -18,6 +18,12 @@ Usage (single chain, e.g. in CI matrix):
   # Optional: limit to specific components
   python3 scripts/check_deployments_owner_is_dao.py --chain mainnet --components core,oracle
 
+  # Multicall3 mode: all owner() calls in one or two aggregate3 eth_calls
+  python3 scripts/check_deployments_owner_is_dao.py --chain arbitrum_one --multicall
+
+  # Annotate failing contracts with their proxy kind and implementation (scripts/proxy_resolver.py)
+  python3 scripts/check_deployments_owner_is_dao.py --chain arbitrum_one --resolve-proxies
+
   # Dry run (list what would be checked)
   python3 scripts/check_deployments_owner_is_dao.py --chain arbitrum_one --dry-run
 
@@ -32,6 +38,13 @@ import os
 import re
 import sys
 from pathlib import Path
+from typing import TextIO
+
+from abi_codec import decode_address
+from deployment_index import load_index
+from multicall3 import aggregate3_with_errors
+from proxy_resolver import get_resolver
+from rpc_client import RpcClient, get_client, is_transport_error
 
 # owner() selector: first 4 bytes of keccak256("owner()")
 OWNER_SELECTOR = "0x8da5cb5b"
@@ -103,6 +116,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Only list contracts and addresses, do not call RPC.",
     )
+    p.add_argument(
+        "--multicall",
+        action="store_true",
+        help="Pack owner()/pendingOwner() calls into Multicall3.aggregate3 calls (a few eth_calls per chain).",
+    )
+    p.add_argument(
+        "--resolve-proxies",
+        action="store_true",
+        help="List failing contracts with their proxy kind and implementation (ERC-1167 / EIP-1967).",
+    )
     return p.parse_args()
 
 
@@ -119,142 +142,63 @@ def get_dao_address(common_addresses: dict[str, str]) -> str | None:
     return common_addresses.get("DAO")
 
 
-def abi_has_owner(abi: list | None) -> bool:
-    """True if ABI declares a view function owner() with no arguments (Ownable)."""
-    if not abi:
-        return False
-    for item in abi:
-        if (
-            isinstance(item, dict)
-            and item.get("type") == "function"
-            and item.get("name") == "owner"
-        ):
-            ins = item.get("inputs") or []
-            if len(ins) == 0:
-                return True
-    return False
-
-
 def collect_deployment_addresses(
     repo_root: Path, chain: str, components: list[str]
-) -> list[tuple[str, str, str, list | None]]:
+) -> list[tuple[str, str, str, frozenset[str]]]:
     """
-    Returns list of (component, contract_name, address, abi) for the given chain.
-    abi is the "abi" array from the deployment JSON, or None if missing.
+    Returns list of (component, contract_name, address, interfaces) for the given chain.
+    interfaces are the ABI interface tags from the deployment index (scripts/deployment_index.py).
     """
-    out: list[tuple[str, str, str, list | None]] = []
-    for comp in components:
-        base = repo_root / COMPONENT_PATHS[comp] / chain
-        if not base.exists():
-            continue
-        for j in base.glob("*.json"):
-            try:
-                data = json.loads(j.read_text(encoding="utf-8"))
-                addr = (data.get("address") or "").strip()
-                if isinstance(addr, str) and addr.startswith("0x") and len(addr) >= 42:
-                    name = j.stem
-                    if name.endswith(".sol"):
-                        name = name[:-4]
-                    abi = data.get("abi")
-                    if not isinstance(abi, list):
-                        abi = None
-                    out.append((comp, name, addr.lower(), abi))
-            except (json.JSONDecodeError, OSError):
-                continue
-    return out
+    return [(d.component, d.name, d.address, d.interfaces) for d in load_index(repo_root).deployments(chain, components)]
 
 
-def eth_call_owner(rpc_url: str, contract_address: str) -> str | None:
+def eth_call_owner(client: RpcClient, contract_address: str) -> str | None:
     """
     Call owner() on contract via eth_call. Returns owner address (lowercase) or None if call reverts/fails.
     """
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "eth_call",
-        "params": [
-            {
-                "to": contract_address if contract_address.startswith("0x") else "0x" + contract_address,
-                "data": OWNER_SELECTOR,
-            },
-            "latest",
-        ],
-    }
-    try:
-        from urllib.request import Request, urlopen
-        from urllib.error import HTTPError, URLError
-
-        req = Request(
-            rpc_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=30) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-    except (HTTPError, URLError, OSError, json.JSONDecodeError, KeyError) as e:
-        print(f"RPC error for {contract_address}: {e}", file=sys.stderr)
-        return None
-
-    err = body.get("error")
-    if err:
-        # Revert or RPC error -> no owner / not callable
-        return None
-
-    result = (body.get("result") or "").strip()
-    if not result or result == "0x":
-        return None
-    # address is 32 bytes (64 hex chars); last 20 bytes = address
-    if len(result) >= 64:
-        addr = "0x" + result[-40:].lower()
-        if addr == "0x" + "0" * 40:
-            return None
-        return addr
-    return None
-
-
-def eth_call_pending_owner(rpc_url: str, contract_address: str) -> str | None:
+    return eth_call_owners(client, [contract_address])[0]
+
+
+def eth_call_owners(
+    client: RpcClient, contract_addresses: list[str], *, multicall: bool = False, log: TextIO | None = None
+) -> list[str | None]:
     """
-    Call pendingOwner() on contract via eth_call (Ownable2Step).
-    Returns pending owner address (lowercase) or None if call reverts/fails or no pending owner.
+    Batched owner() for many contracts (JSON-RPC batch, or Multicall3.aggregate3 if multicall).
+    Same order as contract_addresses; None where the call reverted/failed. RPC errors go to log (default stderr).
     """
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "eth_call",
-        "params": [
-            {
-                "to": contract_address if contract_address.startswith("0x") else "0x" + contract_address,
-                "data": PENDING_OWNER_SELECTOR,
-            },
-            "latest",
-        ],
-    }
-    try:
-        from urllib.request import Request, urlopen
-        from urllib.error import HTTPError, URLError
-
-        req = Request(
-            rpc_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=30) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-    except (HTTPError, URLError, OSError, json.JSONDecodeError, KeyError):
-        return None
+    return _call_address_getter(client, contract_addresses, OWNER_SELECTOR, multicall=multicall, log=log)
 
-    if body.get("error"):
-        return None
 
-    result = (body.get("result") or "").strip()
-    if not result or result == "0x" or len(result) < 64:
-        return None
-    addr = "0x" + result[-40:].lower()
-    if addr == "0x" + "0" * 40:
-        return None
-    return addr
+def eth_call_pending_owner(client: RpcClient, contract_address: str) -> str | None:
+    """
+    Call pendingOwner() on contract via eth_call (Ownable2Step).
+    Returns pending owner address (lowercase) or None if call reverts/fails or no pending owner.
+    """
+    return eth_call_pending_owners(client, [contract_address])[0]
+
+
+def eth_call_pending_owners(
+    client: RpcClient, contract_addresses: list[str], *, multicall: bool = False, log: TextIO | None = None
+) -> list[str | None]:
+    """Batched pendingOwner() for many contracts. Same order as contract_addresses; RPC errors go to log."""
+    return _call_address_getter(client, contract_addresses, PENDING_OWNER_SELECTOR, multicall=multicall, log=log)
+
+
+def _call_address_getter(
+    client: RpcClient, contract_addresses: list[str], selector: str, *, multicall: bool, log: TextIO | None
+) -> list[str | None]:
+    """Zero-arg address getter on every contract; transport errors are reported as "RPC error for <addr>"."""
+    calls = [(a, selector) for a in contract_addresses]
+    if multicall:
+        results = [(data if ok else None, err) for ok, data, err in aggregate3_with_errors(client, calls)]
+    else:
+        results = client.eth_call_many(calls)
+    out: list[str | None] = []
+    for contract_address, (result, err) in zip(contract_addresses, results):
+        if is_transport_error(err):
+            print(f"RPC error for {contract_address}: {err}", file=log or sys.stderr)
+        out.append(decode_address(result))
+    return out
 
 
 def main() -> int:
@@ -266,104 +210,151 @@ def main() -> int:
             print(f"Unknown component: {c}. Allowed: {list(COMPONENT_PATHS.keys())}", file=sys.stderr)
             return 2
 
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None)
+    if not args.dry_run and not rpc_url:
+        hint = rpc_env or f"RPC_<chain> (add {chain!r} to CHAIN_TO_RPC_ENV)"
+        print(f"RPC URL not set. Use --rpc-url or set env {hint}", file=sys.stderr)
+        return 2
+
     repo_root = Path(__file__).resolve().parents[1]
+    return check_chain(
+        repo_root,
+        chain,
+        components,
+        rpc_url,
+        dry_run=args.dry_run,
+        multicall=args.multicall,
+        resolve_proxies=args.resolve_proxies,
+    )
+
+
+def check_chain(
+    repo_root: Path,
+    chain: str,
+    components: list[str],
+    rpc_url: str | None,
+    *,
+    dry_run: bool = False,
+    multicall: bool = False,
+    resolve_proxies: bool = False,
+    out: TextIO | None = None,
+) -> int:
+    """Run the owner-is-DAO check for one chain. Report lines go to out (default stdout). Returns exit code."""
+    # Diagnostics go to out when it is a buffered per-chain report (all-chains run), else to stderr.
+    log = out or sys.stderr
+    out = out or sys.stdout
     common_addresses = load_common_addresses(repo_root, chain)
     dao_address = get_dao_address(common_addresses)
     if not dao_address:
-        print(f"DAO not found in common/addresses/{chain}.json", file=sys.stderr)
+        print(f"DAO not found in common/addresses/{chain}.json", file=log)
         return 2
 
     # Build reverse map: address -> key for reporting
     addr_to_key: dict[str, str] = {addr: key for key, addr in common_addresses.items()}
 
-    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
-    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None)
-    if not args.dry_run and not rpc_url:
-        hint = rpc_env or f"RPC_<chain> (add {chain!r} to CHAIN_TO_RPC_ENV)"
-        print(f"RPC URL not set. Use --rpc-url or set env {hint}", file=sys.stderr)
-        return 2
-
     deployments = collect_deployment_addresses(repo_root, chain, components)
     if not deployments:
-        print(f"No deployments found for chain={chain}, components={components}", file=sys.stderr)
+        print(f"No deployments found for chain={chain}, components={components}", file=log)
         return 0
 
     deployments.sort(key=lambda x: (x[0], x[1]))  # alphabetical: component, then contract name
 
+    # Batch RPC: owner() for every owned contract, then pendingOwner() for every non-DAO Ownable2Step owner.
+    owner_by_address: dict[str, str | None] = {}
+    pending_by_address: dict[str, str | None] = {}
+    if not dry_run:
+        client = get_client(rpc_url)
+        owned = sorted(
+            {address for _c, name, address, tags in deployments if name not in CONTRACTS_EXCLUDED and "Ownable" in tags}
+        )
+        two_step = {address for _c, _name, address, tags in deployments if "Ownable2Step" in tags}
+        owner_by_address = dict(zip(owned, eth_call_owners(client, owned, multicall=multicall, log=log)))
+        not_dao = [
+            a
+            for a in owned
+            if a in two_step and owner_by_address[a] is not None and owner_by_address[a] != dao_address
+        ]
+        pending_by_address = dict(zip(not_dao, eth_call_pending_owners(client, not_dao, multicall=multicall, log=log)))
+
     has_failure = False
     skip_count = 0
     ok_count = 0
     fail_count = 0
-    failed_contracts: list[tuple[str, str]] = []
+    failed_contracts: list[tuple[str, str, str]] = []  # (component, contract_name, address)
     pending_owner_contracts: list[tuple[str, str, str, str]] = []  # (component, contract_name, address, pending_owner)
 
-    for component, contract_name, address, abi in deployments:
-        if args.dry_run:
-            print(f"[dry-run] {component} {contract_name} {address}")
+    for component, contract_name, address, interfaces in deployments:
+        if dry_run:
+            print(f"[dry-run] {component} {contract_name} {address}", file=out)
             continue
 
         if contract_name in CONTRACTS_EXCLUDED:
-            print(f"[skip] {component} {contract_name} excluded from check")
+            print(f"[skip] {component} {contract_name} excluded from check", file=out)
             skip_count += 1
             continue
 
-        if not abi_has_owner(abi):
-            print(f"[skip] {component} {contract_name} no owner()")
+        if "Ownable" not in interfaces:
+            print(f"[skip] {component} {contract_name} no owner()", file=out)
             skip_count += 1
             continue
 
-        owner = eth_call_owner(rpc_url, address)
+        owner = owner_by_address.get(address)
         if owner is None:
-            print(f"[skip] {component} {contract_name} owner() call failed")
+            print(f"[skip] {component} {contract_name} owner() call failed", file=out)
             skip_count += 1
             continue
 
         if owner == dao_address:
-            print(f"[ ok ] {component} {contract_name} owner is DAO")
+            print(f"[ ok ] {component} {contract_name} owner is DAO", file=out)
             ok_count += 1
             continue
 
         key = addr_to_key.get(owner)
         if key is None:
-            print(f"[FAIL] {component} {contract_name} owner {owner} not in common/addresses/{chain}.json (expected DAO)")
+            print(f"[FAIL] {component} {contract_name} owner {owner} not in common/addresses/{chain}.json (expected DAO)", file=out)
         else:
-            print(f"[FAIL] {component} {contract_name} owner is {key} ({owner}), expected DAO")
-        pending = eth_call_pending_owner(rpc_url, address)
+            print(f"[FAIL] {component} {contract_name} owner is {key} ({owner}), expected DAO", file=out)
+        pending = pending_by_address.get(address)
         if pending:
             pending_key = addr_to_key.get(pending)
             if pending_key is not None:
-                print(f"       -> pending owner: {pending_key}")
+                print(f"       -> pending owner: {pending_key}", file=out)
             else:
-                print(f"       -> pending owner: unknown ({pending})")
+                print(f"       -> pending owner: unknown ({pending})", file=out)
             pending_owner_contracts.append((component, contract_name, address, pending))
         has_failure = True
         fail_count += 1
-        failed_contracts.append((component, contract_name))
+        failed_contracts.append((component, contract_name, address))
 
-    if args.dry_run:
-        print(f"Dry-run: would check {len(deployments)} deployments for chain={chain}.")
+    if dry_run:
+        print(f"Dry-run: would check {len(deployments)} deployments for chain={chain}.", file=out)
         return 0
 
-    print()
-    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}")
-    print()
+    print(file=out)
+    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}", file=out)
+    print(file=out)
 
     chain_label = CHAIN_DISPLAY_NAMES.get(chain, chain)
 
     if failed_contracts:
-        print()
-        print(f"Contracts failing verification on {chain_label}:")
-        for component, contract_name in failed_contracts:
-            print(f"  - {component}/{contract_name}")
+        print(file=out)
+        print(f"Contracts failing verification on {chain_label}:", file=out)
+        proxies = get_resolver(client).resolve_many([a for _c, _n, a in failed_contracts]) if resolve_proxies else {}
+        for component, contract_name, address in failed_contracts:
+            if address in proxies:
+                print(f"  - {component}/{contract_name}, {address} ({proxies[address].describe()})", file=out)
+            else:
+                print(f"  - {component}/{contract_name}", file=out)
 
     if pending_owner_contracts:
-        print()
-        print(f"Contracts with pending owner to accept on {chain_label}:")
+        print(file=out)
+        print(f"Contracts with pending owner to accept on {chain_label}:", file=out)
         for component, contract_name, address, pending_owner in pending_owner_contracts:
-            print(f"  - {component}/{contract_name} {address} (pending owner: {pending_owner})")
-        print()
-        print(f"Acceptance ownership method signature: acceptOwnership() {ACCEPT_OWNERSHIP_SELECTOR}")
-        print()
+            print(f"  - {component}/{contract_name} {address} (pending owner: {pending_owner})", file=out)
+        print(file=out)
+        print(f"Acceptance ownership method signature: acceptOwnership() {ACCEPT_OWNERSHIP_SELECTOR}", file=out)
+        print(file=out)
 
     return 1 if has_failure else 0
 
@@ -16,6 +16,16 @@ It collects addresses from:
 Then, for each address, it calls explorer API (etherscan-compatible):
   module=contract&action=getsourcecode&address=<address>&apikey=<api_key>
 
+Requests run concurrently (--concurrency) under one token bucket per explorer host
+(the Etherscan v2 host is shared by most chains), with backoff and retry on
+"Max rate limit reached" responses. Per-host rates: DEFAULT_HOST_RATES in
+scripts/explorer_scheduler.py, override with --rate-limit host=rps.
+
+Positive results are cached on disk (scripts/verification_cache.py, default
+.cache/explorer-verification.sqlite) keyed by (explorer, address, deployedBytecode
+hash) for --cache-ttl-days; only new or not yet verified addresses hit the explorer.
+Use --no-cache to query everything.
+
 Status output per contract:
   [chain] or [chain explorer] component/contract_name address Verified|Not Verified
   (For Avalanche both routescan and etherscan are checked; explorer name in brackets.)
@@ -40,13 +50,18 @@ import argparse
 import json
 import os
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from deployment_index import load_index
+from explorer_scheduler import ExplorerScheduler, parse_host_rates
+from verification_cache import CACHE_FILE_NAME, DEFAULT_TTL_DAYS, VerificationCache
+
 COMPONENT_PATHS = {
     "core": "silo-core",
     "oracle": "silo-oracles",
@@ -110,6 +125,8 @@ class ContractEntry:
     component: str
     contract_name: str
     address: str
+    # sha256 of deployedBytecode from the deployment artifact; "" when unknown (broadcast-only entries)
+    bytecode_hash: str = ""
 
 
 def parse_args() -> argparse.Namespace:
@@ -125,6 +142,31 @@ def parse_args() -> argparse.Namespace:
         help="Comma-separated list: core,oracle,vaults. Default: all.",
     )
     p.add_argument("--timeout", type=int, default=20, help="HTTP timeout in seconds. Default: 20.")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Max explorer requests in flight (rate limits per host still apply). Default: 8.",
+    )
+    p.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="HOST=RPS",
+        help="Override requests per second for an explorer host (repeatable), e.g. api.etherscan.io=10.",
+    )
+    p.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Directory of the verification cache. Default: <repo>/.cache.",
+    )
+    p.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help=f"Re-check cached verified contracts after this many days. Default: {DEFAULT_TTL_DAYS}.",
+    )
+    p.add_argument("--no-cache", action="store_true", help="Do not read or write the verification cache.")
     p.add_argument("--verbose", action="store_true", help="Print API endpoint info and errors.")
     p.add_argument(
         "--no-fail",
@@ -190,75 +232,24 @@ def resolve_api_config(chain: str) -> tuple[list[tuple[str, str]], str]:
     return explorers, api_key
 
 
-def _normalize_name(file_name: str) -> str:
-    return file_name[:-4] if file_name.endswith(".sol") else file_name
-
-
-def _is_address(value: Any) -> bool:
-    return isinstance(value, str) and value.startswith("0x") and len(value) >= 42
-
-
 def collect_from_deployments(repo_root: Path, chain: str, component: str) -> list[ContractEntry]:
-    base = repo_root / COMPONENT_PATHS[component] / "deployments" / chain
-    if not base.exists():
-        return []
-
-    out: list[ContractEntry] = []
-    for jf in base.glob("*.json"):
-        try:
-            data = json.loads(jf.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            continue
-        addr = data.get("address")
-        if not _is_address(addr):
-            continue
-        out.append(
-            ContractEntry(
-                chain=chain,
-                component=component,
-                contract_name=_normalize_name(jf.stem),
-                address=addr.lower(),
-            )
+    return [
+        ContractEntry(
+            chain=chain,
+            component=component,
+            contract_name=d.name,
+            address=d.address,
+            bytecode_hash=d.bytecode_hash,
         )
-    return out
-
-
-def _extract_contract_entries_from_obj(
-    obj: Any, chain: str, component: str, out: list[ContractEntry]
-) -> None:
-    if isinstance(obj, dict):
-        contract_name = obj.get("contractName")
-        contract_addr = obj.get("contractAddress")
-        if isinstance(contract_name, str) and _is_address(contract_addr):
-            out.append(
-                ContractEntry(
-                    chain=chain,
-                    component=component,
-                    contract_name=contract_name.strip(),
-                    address=contract_addr.lower(),
-                )
-            )
-        for v in obj.values():
-            _extract_contract_entries_from_obj(v, chain, component, out)
-    elif isinstance(obj, list):
-        for item in obj:
-            _extract_contract_entries_from_obj(item, chain, component, out)
+        for d in load_index(repo_root).deployments(chain, [component])
+    ]
 
 
 def collect_from_broadcast(repo_root: Path, chain: str, component: str) -> list[ContractEntry]:
-    chain_id = CHAIN_TO_CHAIN_ID[chain]
-    base = repo_root / COMPONENT_PATHS[component] / "broadcast"
-    if not base.exists():
-        return []
-
-    out: list[ContractEntry] = []
-    for run_file in base.glob(f"**/{chain_id}/run-latest.json"):
-        try:
-            data = json.loads(run_file.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            continue
-        _extract_contract_entries_from_obj(data, chain, component, out)
-    return out
+    return [
+        ContractEntry(chain=chain, component=component, contract_name=b.name, address=b.address)
+        for b in load_index(repo_root).broadcast_contracts(CHAIN_TO_CHAIN_ID[chain], [component])
+    ]
 
 
 def collect_contracts(repo_root: Path, chain: str, components: list[str]) -> list[ContractEntry]:
@@ -272,8 +263,10 @@ def collect_contracts(repo_root: Path, chain: str, components: list[str]) -> lis
         for entry in collect_from_broadcast(repo_root, chain, component):
             key = (entry.component, entry.address)
             prev = dedup.get(key)
-            if prev is None or prev.contract_name.lower() in {"", "unknown"}:
+            if prev is None:
                 dedup[key] = entry
+            elif prev.contract_name.lower() in {"", "unknown"}:
+                dedup[key] = replace(entry, bytecode_hash=prev.bytecode_hash)
 
     result = list(dedup.values())
     result.sort(key=lambda e: (e.component, e.contract_name.lower(), e.address))
@@ -350,6 +343,36 @@ def is_verified_from_getsourcecode(payload: dict[str, Any]) -> tuple[bool, str |
     return False, None
 
 
+def fetch_all_getsourcecode(
+    plan: list[tuple[str, list[tuple[str, str]], str, list[ContractEntry]]],
+    *,
+    timeout: int,
+    concurrency: int,
+    host_rates: dict[str, float],
+    skip: set[tuple[str, str]] | None = None,
+) -> dict[tuple[str, str], tuple[dict[str, Any] | None, str | None]]:
+    """
+    getsourcecode for every (explorer api_url, address) in plan that is not in skip, concurrently.
+    Requests share one token bucket per explorer host and are retried with backoff
+    on rate-limit responses (see explorer_scheduler.py).
+    """
+    scheduler = ExplorerScheduler(host_rates)
+    jobs = {
+        (api_url, c.address): api_key
+        for _chain, explorer_configs, api_key, contracts in plan
+        for _label, api_url in explorer_configs
+        for c in contracts
+        if not skip or (api_url, c.address) not in skip
+    }
+
+    def run(job: tuple[str, str]) -> tuple[dict[str, Any] | None, str | None]:
+        api_url, address = job
+        return scheduler.call(api_url, lambda: fetch_getsourcecode(api_url, jobs[job], address, timeout))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return dict(zip(jobs, pool.map(run, jobs)))
+
+
 def main() -> int:
     args = parse_args()
     repo_root = Path(__file__).resolve().parents[1]
@@ -369,8 +392,14 @@ def main() -> int:
             )
         return 2
 
-    has_failures = False
+    try:
+        host_rates = parse_host_rates(args.rate_limit)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
 
+    # Resolve explorers and contracts for every chain first, then fetch all of them concurrently.
+    plan: list[tuple[str, list[tuple[str, str]], str, list[ContractEntry]]] = []
     for chain in chains:
         try:
             explorer_configs, api_key = resolve_api_config(chain)
@@ -384,9 +413,31 @@ def main() -> int:
             return 2
 
         contracts = collect_contracts(repo_root, chain, components)
-        if not contracts:
-            continue
+        if contracts:
+            plan.append((chain, explorer_configs, api_key, contracts))
+
+    cache: VerificationCache | None = None
+    cached: set[tuple[str, str]] = set()
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else repo_root / ".cache"
+        cache = VerificationCache(cache_dir / CACHE_FILE_NAME, args.cache_ttl_days * 86400)
+        cached = {
+            (api_url, c.address)
+            for _chain, explorer_configs, _api_key, contracts in plan
+            for _label, api_url in explorer_configs
+            for c in contracts
+            if cache.is_verified(api_url, c.address, c.bytecode_hash)
+        }
+
+    fetched = fetch_all_getsourcecode(
+        plan, timeout=args.timeout, concurrency=args.concurrency, host_rates=host_rates, skip=cached
+    )
+    if cache is not None:
+        print(f"Verification cache: {len(cached)} cached, {len(fetched)} fetched from explorers", file=sys.stderr)
 
+    has_failures = False
+
+    for chain, explorer_configs, _api_key, contracts in plan:
         for explorer_label, api_url in explorer_configs:
             if args.verbose:
                 print(f"[verbose] chain={chain} explorer={explorer_label} api_url={api_url}", file=sys.stderr)
@@ -397,7 +448,13 @@ def main() -> int:
             chain_unverified: list[ContractEntry] = []
 
             for c in contracts:
-                payload, err = fetch_getsourcecode(api_url, api_key, c.address, timeout=args.timeout)
+                if (api_url, c.address) in cached:
+                    display = f"[{chain}]" if len(explorer_configs) == 1 else f"[{chain} {explorer_label}]"
+                    print(f"{display} {c.component}/{c.contract_name} {c.address} Verified")
+                    verified_count += 1
+                    continue
+
+                payload, err = fetched[(api_url, c.address)]
                 if err is not None:
                     if args.verbose:
                         print(f"[verbose] {chain} {c.address} API error: {err}", file=sys.stderr)
@@ -414,6 +471,8 @@ def main() -> int:
                 if verified:
                     print(f"{display} {c.component}/{c.contract_name} {c.address} Verified")
                     verified_count += 1
+                    if cache is not None:
+                        cache.mark_verified(api_url, c.address, c.bytecode_hash)
                 else:
                     print(f"{display} {c.component}/{c.contract_name} {c.address} Not Verified")
                     not_verified_count += 1
@@ -436,6 +495,9 @@ def main() -> int:
             print(f"  Not verified: {not_verified_count}")
             print(f"  Fetch errors: {fetch_error_count}")
 
+    if cache is not None:
+        cache.close()
+
     # List unverified contracts at the end
     if unverified:
         print()
@@ -12,19 +12,31 @@ Output is sorted alphabetically by contract name. Uses same chain/RPC/env as
 check_deployments_owner_is_dao.py.
 
 python3 scripts/check_deployments_version_on_chain.py --chain arbitrum_one
+
+# also show the proxy kind / implementation of every failing address (scripts/proxy_resolver.py)
+python3 scripts/check_deployments_version_on_chain.py --chain arbitrum_one --resolve-proxies
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
-import re
 import sys
 from pathlib import Path
+from typing import TextIO
+
+from abi_codec import AbiDecodeError, decode_hex, encode_call
+from deployment_index import Deployment, load_index
+from proxy_resolver import get_resolver
+from rpc_client import RpcClient, get_client, is_transport_error
+from source_index import load_source_index
 
 # getVersions(address[]) selector
 GET_VERSIONS_SELECTOR = "0xf58e82b5"
+# Max addresses per getVersions call (each one is a try/catch VERSION() call inside SiloLens,
+# large lists can hit the RPC eth_call gas cap).
+DEFAULT_MAX_VERSIONS_PER_CALL = 32
+
 # DynamicKinkModelFactory.IRM() getter (public immutable)
 IRM_SELECTOR = "0x1e75db16"
 # OracleFactory.ORACLE_IMPLEMENTATION() getter (public immutable)
@@ -71,27 +83,6 @@ CHAIN_TO_RPC_ENV: dict[str, str] = {
     "sonic": "RPC_SONIC",
 }
 
-# Regex: constant VERSION = "Name X.Y.Z"; or (in VERSION function) return "Name X.Y.Z";
-_RE_VERSION_CONST = re.compile(r'VERSION\s*=\s*"([^"]+)"\s*;', re.MULTILINE)
-# After "function VERSION(...)" find return "..." within the same function (next ~400 chars)
-_RE_VERSION_RETURN = re.compile(
-    r'function\s+VERSION\s*\([^)]*\)[^{]*\{[^}]*?return\s+"([^"]+)"\s*;',
-    re.MULTILINE | re.DOTALL,
-)
-_RE_VERSION_ASSIGN = re.compile(
-    r'function\s+VERSION\s*\([^)]*\)[^{]*\{[^}]*?=\s*"([^"]+)"\s*;',
-    re.MULTILINE | re.DOTALL,
-)
-_RE_ORACLE_IMPLEMENTATION_TYPE = re.compile(
-    r"\b([A-Za-z_][A-Za-z0-9_]*)\s+public\s+immutable\s+ORACLE_IMPLEMENTATION\b"
-)
-_RE_ORACLE_FACTORY_NEW_IMPL = re.compile(
-    r"OracleFactory\s*\(\s*address\s*\(\s*new\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(",
-    re.MULTILINE,
-)
-
-
-
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
@@ -105,277 +96,110 @@ def parse_args() -> argparse.Namespace:
         help="Comma-separated list: core,oracle,vaults. Default: core,oracle,vaults",
     )
     p.add_argument("--dry-run", action="store_true", help="Only list contracts and expected versions, no RPC.")
+    p.add_argument(
+        "--max-versions-per-call",
+        type=int,
+        default=DEFAULT_MAX_VERSIONS_PER_CALL,
+        help=f"Max addresses per SiloLens.getVersions call. Default: {DEFAULT_MAX_VERSIONS_PER_CALL}.",
+    )
     p.add_argument("--verbose", action="store_true", help="Print raw RPC response on getVersions (for debugging read failed).")
+    p.add_argument(
+        "--resolve-proxies",
+        action="store_true",
+        help="List failing contracts with their proxy kind and implementation (ERC-1167 / EIP-1967).",
+    )
     return p.parse_args()
 
 
-def find_contract_source(repo_root: Path, contract_name: str, contracts_root: Path) -> Path | None:
-    """Return path to ContractName.sol under component contracts root, or None."""
-    base = repo_root / contracts_root
-    candidates = list(base.rglob(f"{contract_name}.sol"))
-    for c in candidates:
-        if c.stem == contract_name:
-            return c
-    return None
-
-
-def extract_version_from_sol(sol_path: Path) -> str | None:
-    """Extract VERSION string from .sol file (function VERSION() return \"...\" or constant VERSION = \"...\")."""
-    try:
-        text = sol_path.read_text(encoding="utf-8")
-    except OSError:
-        return None
-    m = _RE_VERSION_RETURN.search(text)
-    if m:
-        return m.group(1).strip()
-    m = _RE_VERSION_ASSIGN.search(text)
-    if m:
-        return m.group(1).strip()
-    m = _RE_VERSION_CONST.search(text)
-    if m:
-        return m.group(1).strip()
-    return None
-
-
-def collect_deployments(
-    repo_root: Path, chain: str, deployments_root: Path
-) -> list[tuple[str, str, list[dict] | None]]:
-    """(contract_name, address, abi) for <deployments_root>/<chain>/*.json, sorted by name."""
-    base = repo_root / deployments_root / chain
-    if not base.exists():
-        return []
-    out: list[tuple[str, str, list[dict] | None]] = []
-    for j in base.glob("*.json"):
-        try:
-            data = json.loads(j.read_text(encoding="utf-8"))
-            addr = (data.get("address") or "").strip()
-            if isinstance(addr, str) and addr.startswith("0x") and len(addr) >= 42:
-                name = j.stem
-                if name.endswith(".sol"):
-                    name = name[:-4]
-                abi = data.get("abi")
-                out.append((name, addr.lower(), abi if isinstance(abi, list) else None))
-        except (json.JSONDecodeError, OSError):
-            continue
-    out.sort(key=lambda x: x[0])
-    return out
+def collect_deployments(repo_root: Path, chain: str, component: str) -> list[Deployment]:
+    """Indexed deployments of the component on chain, sorted by name."""
+    return load_index(repo_root).deployments(chain, [component])
 
 
 def get_silo_lens_address(repo_root: Path, chain: str) -> str | None:
     """SiloLens deployment address for chain, or None."""
-    base = repo_root / Path(COMPONENT_PATHS["core"]["deployments_root"]) / chain
-    j = base / "SiloLens.sol.json"
-    if not j.exists():
-        return None
-    try:
-        data = json.loads(j.read_text(encoding="utf-8"))
-        addr = (data.get("address") or "").strip()
-        if isinstance(addr, str) and addr.startswith("0x") and len(addr) >= 42:
-            return addr.lower()
-    except (json.JSONDecodeError, OSError):
-        pass
-    return None
-
-
-def _eth_call(rpc_url: str, to: str, data: str) -> str | None:
-    result, _ = _eth_call_with_error(rpc_url, to, data)
-    return result
-
-
-def _eth_call_with_error(rpc_url: str, to: str, data: str) -> tuple[str | None, str | None]:
-    """Like _eth_call but returns (result, error_message). error_message is set when RPC returns error."""
-    to = to if to.startswith("0x") else "0x" + to
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "eth_call",
-        "params": [{"to": to, "data": data}, "latest"],
-    }
-    try:
-        from urllib.request import Request, urlopen
-        from urllib.error import HTTPError, URLError
-
-        req = Request(
-            rpc_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=30) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-    except (HTTPError, URLError, OSError, json.JSONDecodeError, KeyError) as e:
-        return None, str(e)
-    err = body.get("error")
-    if err:
-        msg = err.get("message", err) if isinstance(err, dict) else str(err)
-        return None, msg
-    return (body.get("result") or "").strip() or None, None
-
-
-def _abi_decode_string_at(hex_data: str, byte_offset: int) -> str | None:
-    """Decode one ABI string at byte_offset in hex_data (full return hex). At offset: 32 bytes length, then utf8."""
-    start = byte_offset * 2
-    if start + 64 > len(hex_data):
-        return None
-    try:
-        length = int(hex_data[start : start + 64], 16)
-        if length == 0:
-            return ""
-        data_start = start + 64
-        if data_start + length * 2 > len(hex_data):
-            return None
-        data_hex = hex_data[data_start : data_start + length * 2]
-        return bytes.fromhex(data_hex).decode("utf-8")
-    except (ValueError, UnicodeDecodeError):
-        return None
-
-
-def _abi_decode_string_array(hex_result: str) -> list[str | None]:
-    """Decode ABI-encoded string[] (offset to array, then length, then per-element offsets, then strings)."""
-    if not hex_result or not hex_result.strip():
-        return []
-    hex_result = hex_result.strip()
-    if hex_result.startswith("0x"):
-        hex_result = hex_result[2:]
-    if len(hex_result) < 128:
-        return []
-    try:
-        array_offset = int(hex_result[0:64], 16)  # bytes from start
-        base = array_offset * 2
-        length = int(hex_result[base : base + 64], 16)
-    except ValueError:
-        return []
-    out: list[str | None] = []
-    for i in range(length):
-        elem_offset_hex = base + 64 + i * 64
-        if elem_offset_hex + 64 > len(hex_result):
-            out.append(None)
-            continue
-        # For dynamic arrays of dynamic types, element offsets are relative to
-        # the start of element-head section (right after array length).
-        elem_offset = int(hex_result[elem_offset_hex : elem_offset_hex + 64], 16)
-        elem_absolute_offset = array_offset + 32 + elem_offset
-        s = _abi_decode_string_at(hex_result, elem_absolute_offset)
-        out.append(s)
-    return out
-
-
-def _encode_address_array(addresses: list[str]) -> str:
-    """ABI-encode address[] for getVersions(address[]) calldata (after selector)."""
-    n = len(addresses)
-    # offset to array = 32 (one word) = 64 hex chars
-    offset_hex = "0" * 62 + "20"
-    length_hex = hex(n)[2:].zfill(64)
-    parts = [offset_hex, length_hex]
-    for a in addresses:
-        a = a.lower().replace("0x", "").zfill(64)
-        parts.append(a)
-    return "".join(parts)
-
-
-def _debug_decode_layout(hex_result: str) -> None:
-    """Print ABI layout hint for first words (offset, length, first elem offset) to stderr."""
-    h = hex_result.strip().removeprefix("0x")
-    if len(h) < 128:
-        print("[verbose] decode layout: result too short for ABI", file=sys.stderr)
-        return
-    try:
-        array_offset = int(h[0:64], 16)
-        base = array_offset * 2
-        length = int(h[base : base + 64], 16) if base + 64 <= len(h) else -1
-        print(f"[verbose] decode layout: array_offset={array_offset} (0x{array_offset:x}) length={length}", file=sys.stderr)
-        if length > 0 and base + 64 + 64 <= len(h):
-            first_elem_offset = int(h[base + 64 : base + 128], 16)
-            print(f"[verbose] decode layout: first elem offset={first_elem_offset} (0x{first_elem_offset:x})", file=sys.stderr)
-    except ValueError as e:
-        print(f"[verbose] decode layout parse error: {e}", file=sys.stderr)
-
-
-def abi_has_zero_arg_function(abi: list[dict] | None, function_name: str) -> bool:
-    if not abi:
-        return False
-    for item in abi:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "function":
-            continue
-        if item.get("name") != function_name:
-            continue
-        inputs = item.get("inputs")
-        if isinstance(inputs, list) and len(inputs) == 0:
-            return True
-    return False
+    lens = load_index(repo_root).get("core", chain, "SiloLens")
+    return lens.address if lens else None
 
 
 def get_versions_on_chain(
-    rpc_url: str, lens_address: str, addresses: list[str], *, verbose: bool = False
+    client: RpcClient,
+    lens_address: str,
+    addresses: list[str],
+    *,
+    verbose: bool = False,
+    max_per_call: int = DEFAULT_MAX_VERSIONS_PER_CALL,
+    log: TextIO | None = None,
 ) -> list[str | None]:
-    """Call SiloLens.getVersions(addresses), return list of decoded strings (same order as addresses)."""
+    """
+    SiloLens.getVersions for addresses, returns decoded strings in the same order.
+
+    Addresses go out in getVersions calls of at most max_per_call addresses; all calls of a
+    round share one JSON-RPC batch. A call that reverts (or returns undecodable data) is split
+    in halves for the next round, so a bad address is isolated in log2(max_per_call) rounds
+    and only its version is None. Transport errors are not bisected. Failures and verbose
+    lines go to log (default stderr).
+    """
+    log = log or sys.stderr
     if not addresses:
         return []
-    data = GET_VERSIONS_SELECTOR + _encode_address_array(addresses)
-    if verbose:
-        print(f"[verbose] getVersions: lens={lens_address} addresses={len(addresses)}", file=sys.stderr)
-        print(f"[verbose] first 2 addrs: {addresses[:2]}", file=sys.stderr)
-        result, err = _eth_call_with_error(rpc_url, lens_address, data)
-        if err:
-            print(f"[verbose] RPC error: {err}", file=sys.stderr)
-        print(f"[verbose] result: len={len(result) if result else 0}", file=sys.stderr)
-        if result:
-            cap = 1500
-            print(f"[verbose] raw hex (first {min(cap, len(result))} chars): {result[:cap]}", file=sys.stderr)
-    else:
-        result = _eth_call(rpc_url, lens_address, data)
-    if result is None:
-        if not verbose:
-            print("getVersions failed (RPC error or revert). Run with --verbose for details.", file=sys.stderr)
-        return [None] * len(addresses)
-    decoded = _abi_decode_string_array(result)
-    if verbose:
-        print(f"[verbose] decode: len(decoded)={len(decoded)} expected={len(addresses)}", file=sys.stderr)
-        if decoded:
-            for i, v in enumerate(decoded[:3]):
-                print(f"[verbose] decoded[{i}] = {repr(v)}", file=sys.stderr)
-        if len(decoded) != len(addresses) or all(v is None for v in decoded):
-            _debug_decode_layout(result)
-    if len(decoded) != len(addresses):
-        if not verbose:
-            print("getVersions returned data but decode length mismatch. Run with --verbose.", file=sys.stderr)
-        return [None] * len(addresses)
-    # getVersion always returns a string (e.g. "legacy" on catch); treat decode failure as "legacy"
-    return [v if v is not None and v != "" else "legacy" for v in decoded]
-
-
-def call_factory_irm(rpc_url: str, factory_address: str) -> str | None:
-    """Call DynamicKinkModelFactory.IRM(), return implementation address (DynamicKinkModel) or None."""
-    result = _eth_call(rpc_url, factory_address, IRM_SELECTOR)
-    if not result or len(result) < 64:
-        return None
-    h = result[2:] if result.startswith("0x") else result
-    return "0x" + h[-40:].lower()
+    out: list[str | None] = [None] * len(addresses)
+    step = max(1, max_per_call)
+    pending = [(start, min(start + step, len(addresses))) for start in range(0, len(addresses), step)]
+    round_no = 0
+    while pending:
+        round_no += 1
+        if verbose:
+            print(
+                f"[verbose] getVersions round {round_no}: lens={lens_address} calls={len(pending)} "
+                f"addresses={sum(end - start for start, end in pending)}",
+                file=log,
+            )
+        calls = [
+            (lens_address, encode_call(GET_VERSIONS_SELECTOR, ["address[]"], [addresses[s:e]])) for s, e in pending
+        ]
+        retry: list[tuple[int, int]] = []
+        for (start, end), (result, err) in zip(pending, client.eth_call_many(calls)):
+            decoded: list[str] = []
+            if result is not None:
+                try:
+                    (decoded,) = decode_hex(["string[]"], result)
+                except AbiDecodeError as e:
+                    err = f"decode error: {e}"
+            if result is not None and len(decoded) == end - start:
+                # getVersion always returns a string (e.g. "legacy" on catch); treat empty as "legacy"
+                out[start:end] = [v or "legacy" for v in decoded]
+                continue
+            reason = err or ("decode length mismatch" if result is not None else "RPC error or revert")
+            if verbose:
+                print(f"[verbose] getVersions [{start}:{end}] failed: {reason}", file=log)
+                if result:
+                    cap = 1500
+                    print(f"[verbose] raw hex (first {min(cap, len(result))} chars): {result[:cap]}", file=log)
+            if end - start > 1 and not is_transport_error(err):
+                mid = (start + end) // 2
+                retry.extend([(start, mid), (mid, end)])
+            elif end - start == 1:
+                print(f"getVersions failed for {addresses[start]}: {reason}", file=log)
+            else:
+                print(f"getVersions failed for {end - start} addresses: {reason}", file=log)
+        pending = retry
+    return out
 
 
-def call_zero_arg_address_getter(rpc_url: str, contract_address: str, selector: str) -> str | None:
-    result = _eth_call(rpc_url, contract_address, selector)
-    if not result or len(result) < 64:
+def _decode_address_result(result: str | None) -> str | None:
+    if not result:
         return None
-    h = result[2:] if result.startswith("0x") else result
-    return "0x" + h[-40:].lower()
-
-
-def find_oracle_impl_contract_name(factory_src: Path) -> str | None:
-    """Infer oracle implementation contract name from factory source."""
     try:
-        text = factory_src.read_text(encoding="utf-8")
-    except OSError:
+        (addr,) = decode_hex(["address"], result)
+    except AbiDecodeError:
         return None
-    m_new = _RE_ORACLE_FACTORY_NEW_IMPL.search(text)
-    if m_new:
-        return m_new.group(1)
-    m = _RE_ORACLE_IMPLEMENTATION_TYPE.search(text)
-    if m and m.group(1).lower() != "address":
-        return m.group(1)
-    return None
+    return addr
+
+
+def call_zero_arg_address_getters(client: RpcClient, calls: list[tuple[str, str]]) -> list[str | None]:
+    """Decoded address returned by each zero-arg getter call (contract_address, selector), batched, in input order."""
+    return [_decode_address_result(result) for result, _err in client.eth_call_many(calls)]
 
 
 def main() -> int:
@@ -395,38 +219,62 @@ def main() -> int:
         print(f"RPC URL not set. Use --rpc-url or set env {hint}", file=sys.stderr)
         return 2
 
+    return check_chain(
+        repo_root,
+        chain,
+        components,
+        rpc_url,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+        max_versions_per_call=args.max_versions_per_call,
+        resolve_proxies=args.resolve_proxies,
+    )
+
+
+def check_chain(
+    repo_root: Path,
+    chain: str,
+    components: list[str],
+    rpc_url: str | None,
+    *,
+    dry_run: bool = False,
+    verbose: bool = False,
+    max_versions_per_call: int = DEFAULT_MAX_VERSIONS_PER_CALL,
+    resolve_proxies: bool = False,
+    out: TextIO | None = None,
+) -> int:
+    """Run the version check for one chain. Report lines go to out (default stdout). Returns exit code."""
+    # Diagnostics go to out when it is a buffered per-chain report (all-chains run), else to stderr.
+    log = out or sys.stderr
+    out = out or sys.stdout
     all_deployments: list[tuple[str, str, str]] = []
     deployments_by_key: dict[tuple[str, str], str] = {}
-    abi_by_key: dict[tuple[str, str], list[dict] | None] = {}
+    indexed_by_key: dict[tuple[str, str], Deployment] = {}
     for component in components:
-        dep_root = Path(COMPONENT_PATHS[component]["deployments_root"])
-        deployments = collect_deployments(repo_root, chain, dep_root)
-        for name, addr, abi in deployments:
-            all_deployments.append((component, name, addr))
-            deployments_by_key[(component, name)] = addr
-            abi_by_key[(component, name)] = abi
+        for d in collect_deployments(repo_root, chain, component):
+            all_deployments.append((component, d.name, d.address))
+            deployments_by_key[(component, d.name)] = d.address
+            indexed_by_key[(component, d.name)] = d
 
     if not all_deployments:
-        print(f"No deployments found for chain={chain}, components={components}", file=sys.stderr)
+        print(f"No deployments found for chain={chain}, components={components}", file=log)
         return 0
 
     silo_lens = get_silo_lens_address(repo_root, chain)
-    if not args.dry_run and not silo_lens:
-        print(f"SiloLens not deployed for chain={chain}", file=sys.stderr)
+    if not dry_run and not silo_lens:
+        print(f"SiloLens not deployed for chain={chain}", file=log)
         return 2
-    if args.verbose and not args.dry_run:
+    if verbose and not dry_run:
         rpc_display = (rpc_url[:50] + "..." if rpc_url and len(rpc_url) > 50 else rpc_url) if rpc_url else "(none)"
-        print(f"[verbose] chain={chain} SiloLens={silo_lens} rpc={rpc_display}", file=sys.stderr)
+        print(f"[verbose] chain={chain} SiloLens={silo_lens} rpc={rpc_display}", file=log)
 
     # Build expected version per contract (only for those with VERSION in repo)
+    sources = load_source_index(repo_root)
     expected_by_key: dict[tuple[str, str], str] = {}
     for component, name, _addr in all_deployments:
-        contracts_root = Path(COMPONENT_PATHS[component]["contracts_root"])
-        src = find_contract_source(repo_root, name, contracts_root)
-        if src:
-            v = extract_version_from_sol(src)
-            if v is not None:
-                expected_by_key[(component, name)] = v
+        v = sources.version(component, name)
+        if v is not None:
+            expected_by_key[(component, name)] = v
 
     has_failure = False
     skip_count = 0
@@ -437,8 +285,7 @@ def main() -> int:
     dkm_impl_name = "DynamicKinkModel (via DynamicKinkModelFactory)"
     dkm_expected: str | None = None
     if ("core", "DynamicKinkModelFactory") in deployments_by_key:
-        dkm_src = find_contract_source(repo_root, "DynamicKinkModel", Path(COMPONENT_PATHS["core"]["contracts_root"]))
-        dkm_expected = extract_version_from_sol(dkm_src) if dkm_src else None
+        dkm_expected = sources.version("core", "DynamicKinkModel")
 
     # Oracle factory custom checks:
     # if ABI has ORACLE_IMPLEMENTATION(), call it and verify returned implementation contract version.
@@ -448,23 +295,16 @@ def main() -> int:
         component, factory_name = key
         if component != "oracle":
             continue
-        abi = abi_by_key.get(key)
-        if not abi_has_zero_arg_function(abi, "ORACLE_IMPLEMENTATION"):
+        if not indexed_by_key[key].has_function("ORACLE_IMPLEMENTATION()"):
             continue
 
-        contracts_root = Path(COMPONENT_PATHS["oracle"]["contracts_root"])
-        factory_src = find_contract_source(repo_root, factory_name, contracts_root)
-        impl_name = None
-        if factory_src:
-            impl_name = find_oracle_impl_contract_name(factory_src)
+        factory_src = sources.find("oracle", factory_name)
+        impl_name = factory_src.oracle_implementation if factory_src else None
         if not impl_name and factory_name.endswith("Factory"):
             impl_name = factory_name[:-7]  # fallback convention: FooFactory -> Foo
         if not impl_name:
             continue
-        impl_src = find_contract_source(repo_root, impl_name, contracts_root)
-        if not impl_src:
-            continue
-        impl_expected = extract_version_from_sol(impl_src)
+        impl_expected = sources.version("oracle", impl_name)
         if impl_expected is None:
             continue
         display_name = f"{impl_name} (via {factory_name}.ORACLE_IMPLEMENTATION)"
@@ -473,26 +313,46 @@ def main() -> int:
     # SiloDeployer immutable getters: check that each pointed-to contract has current version.
     silo_deployer_checks: list[tuple[str, str, str]] = []  # (display_name, expected_version, selector)
     if ("core", "SiloDeployer") in deployments_by_key:
-        core_contracts = Path(COMPONENT_PATHS["core"]["contracts_root"])
         for display_name, selector, contract_name in SILO_DEPLOYER_GETTERS:
-            src = find_contract_source(repo_root, contract_name, core_contracts)
-            if not src:
-                continue
-            expected = extract_version_from_sol(src)
+            expected = sources.version("core", contract_name)
             if expected is None:
                 continue
             silo_deployer_checks.append((display_name, expected, selector))
 
+    client = get_client(rpc_url) if not dry_run else None
+
+    # All immutable getters (SILO_VAULTS_FACTORY, IRM, ORACLE_IMPLEMENTATION, SiloDeployer getters) in one batch.
+    getter_calls: list[tuple[str, str]] = []
+    getter_tags: list[tuple[str, str]] = []  # (kind, display_name) paired with getter_calls
+    if not dry_run:
+        if ("vaults", "SiloVaultsFactory") in deployments_by_key and ("vaults", "SiloVaultDeployer") in deployments_by_key:
+            getter_calls.append((deployments_by_key[("vaults", "SiloVaultDeployer")], SILO_VAULTS_FACTORY_SELECTOR))
+            getter_tags.append(("vault_factory", ""))
+        if dkm_expected:
+            getter_calls.append((deployments_by_key[("core", "DynamicKinkModelFactory")], IRM_SELECTOR))
+            getter_tags.append(("irm", ""))
+        for display_name, factory_name, _impl_name, _expected in oracle_custom_checks:
+            factory_addr = deployments_by_key.get(("oracle", factory_name))
+            if factory_addr:
+                getter_calls.append((factory_addr, ORACLE_IMPLEMENTATION_SELECTOR))
+                getter_tags.append(("oracle", display_name))
+        deployer_addr = deployments_by_key.get(("core", "SiloDeployer"))
+        if deployer_addr:
+            for display_name, _expected, selector in silo_deployer_checks:
+                getter_calls.append((deployer_addr, selector))
+                getter_tags.append(("silo_deployer", display_name))
+    getter_results = dict(zip(getter_tags, call_zero_arg_address_getters(client, getter_calls))) if getter_calls else {}
+
     # When vaults SiloVaultsFactory address equals SiloVaultDeployer.SILO_VAULTS_FACTORY(), show "via SiloVaultDeployer" in output.
     display_name_override: dict[tuple[str, str], str] = {}
-    if not args.dry_run and ("vaults", "SiloVaultsFactory") in deployments_by_key and ("vaults", "SiloVaultDeployer") in deployments_by_key:
-        vault_deployer_addr = deployments_by_key[("vaults", "SiloVaultDeployer")]
-        factory_from_deployer = call_zero_arg_address_getter(rpc_url, vault_deployer_addr, SILO_VAULTS_FACTORY_SELECTOR)
+    factory_from_deployer = getter_results.get(("vault_factory", ""))
+    if factory_from_deployer:
         factory_deployed_addr = deployments_by_key[("vaults", "SiloVaultsFactory")]
-        if factory_from_deployer and factory_from_deployer.lower() == factory_deployed_addr.lower():
+        if factory_from_deployer.lower() == factory_deployed_addr.lower():
             display_name_override[("vaults", "SiloVaultsFactory")] = "SiloVaultsFactory (via SiloVaultDeployer)"
 
-    # One RPC call: getVersions(address[]) for all versioned contracts + IRM + oracle impls + SiloDeployer immutables.
+    # getVersions(address[]) for all versioned contracts + IRM + oracle impls + SiloDeployer immutables
+    # (chunked, one JSON-RPC batch per round, see get_versions_on_chain).
     # Build explicit (name, address) pairs in sorted order so name and result stay paired.
     versioned_keys = sorted(expected_by_key.keys(), key=lambda x: (x[0], x[1]))
     key_addr_pairs = [(k, deployments_by_key[k]) for k in versioned_keys]
@@ -500,29 +360,30 @@ def main() -> int:
     irm_addr: str | None = None
     oracle_impl_addr_by_display: dict[str, str | None] = {}
     silo_deployer_addr_by_display: dict[str, str | None] = {}
-    if not args.dry_run:
+    if not dry_run:
         addresses = [addr for _, addr in key_addr_pairs]
         if dkm_expected:
-            irm_addr = call_factory_irm(rpc_url, deployments_by_key[("core", "DynamicKinkModelFactory")])
+            irm_addr = getter_results.get(("irm", ""))
             if irm_addr:
                 addresses.append(irm_addr)
         for display_name, factory_name, _impl_name, _expected in oracle_custom_checks:
-            factory_addr = deployments_by_key.get(("oracle", factory_name))
-            if not factory_addr:
+            if ("oracle", display_name) not in getter_results:
                 continue
-            impl_addr = call_zero_arg_address_getter(rpc_url, factory_addr, ORACLE_IMPLEMENTATION_SELECTOR)
+            impl_addr = getter_results[("oracle", display_name)]
             oracle_impl_addr_by_display[display_name] = impl_addr
             if impl_addr:
                 addresses.append(impl_addr)
-        deployer_addr = deployments_by_key.get(("core", "SiloDeployer"))
-        if deployer_addr:
-            for display_name, _expected, selector in silo_deployer_checks:
-                addr = call_zero_arg_address_getter(rpc_url, deployer_addr, selector)
-                silo_deployer_addr_by_display[display_name] = addr
-                if addr:
-                    addresses.append(addr)
+        for display_name, _expected, _selector in silo_deployer_checks:
+            if ("silo_deployer", display_name) not in getter_results:
+                continue
+            addr = getter_results[("silo_deployer", display_name)]
+            silo_deployer_addr_by_display[display_name] = addr
+            if addr:
+                addresses.append(addr)
         if addresses:
-            on_chain_list = get_versions_on_chain(rpc_url, silo_lens, addresses, verbose=args.verbose)
+            on_chain_list = get_versions_on_chain(
+                client, silo_lens, addresses, verbose=verbose, max_per_call=max_versions_per_call, log=log
+            )
             n_versioned = len(key_addr_pairs)
             versions_for_versioned = on_chain_list[:n_versioned]
             for (key, _), version in zip(key_addr_pairs, versions_for_versioned):
@@ -549,53 +410,53 @@ def main() -> int:
         expected = expected_by_key.get((component, name))
 
         if expected is None:
-            if args.dry_run:
-                print(f"[dry-run] skip {component} {name} (no VERSION)")
+            if dry_run:
+                print(f"[dry-run] skip {component} {name} (no VERSION)", file=out)
             else:
-                print(f"[skip] {component} {name}")
+                print(f"[skip] {component} {name}", file=out)
                 skip_count += 1
             continue
 
-        if args.dry_run:
-            print(f"[dry-run] {component} {name} {expected}")
+        if dry_run:
+            print(f"[dry-run] {component} {name} {expected}", file=out)
             continue
 
         on_chain = on_chain_by_key.get((component, name))
         name_display = display_name_override.get((component, name), name)
         if on_chain is None:
-            print(f"[FAIL] {component} {name_display} expected {expected} on_chain (read failed) {addr}")
+            print(f"[FAIL] {component} {name_display} expected {expected} on_chain (read failed) {addr}", file=out)
             has_failure = True
             fail_count += 1
             failed_contracts.append((component, name_display, addr))
             continue
         if on_chain == expected:
-            print(f"[ ok ] {component} {name_display} {expected}")
+            print(f"[ ok ] {component} {name_display} {expected}", file=out)
             ok_count += 1
             continue
-        print(f"[FAIL] {component} {name_display} expected {expected} on_chain {on_chain} {addr}")
+        print(f"[FAIL] {component} {name_display} expected {expected} on_chain {on_chain} {addr}", file=out)
         has_failure = True
         fail_count += 1
         failed_contracts.append((component, name_display, addr))
 
     # Custom check: DynamicKinkModel version via DynamicKinkModelFactory.IRM() (version fetched in same batch above)
     if ("core", "DynamicKinkModelFactory") in deployments_by_key and dkm_expected is not None:
-        if args.dry_run:
-            print(f"[dry-run] core {dkm_impl_name} {dkm_expected}")
+        if dry_run:
+            print(f"[dry-run] core {dkm_impl_name} {dkm_expected}", file=out)
         else:
             dkm_on_chain = on_chain_by_key.get(("core", dkm_impl_name))
             if dkm_on_chain is None:
                 irm_addr_for_fail = irm_addr if irm_addr else "(IRM address unknown)"
-                print(f"[FAIL] core expected {dkm_expected} on_chain (read failed) {irm_addr_for_fail}")
+                print(f"[FAIL] core expected {dkm_expected} on_chain (read failed) {irm_addr_for_fail}", file=out)
                 has_failure = True
                 fail_count += 1
                 if irm_addr:
                     failed_contracts.append(("core", dkm_impl_name, irm_addr))
             elif dkm_on_chain == dkm_expected:
-                print(f"[ ok ] core {dkm_impl_name} {dkm_expected}")
+                print(f"[ ok ] core {dkm_impl_name} {dkm_expected}", file=out)
                 ok_count += 1
             else:
                 irm_addr_fail = irm_addr if irm_addr else "(IRM address unknown)"
-                print(f"[FAIL] core expected {dkm_expected} on_chain {dkm_on_chain} {irm_addr_fail}")
+                print(f"[FAIL] core expected {dkm_expected} on_chain {dkm_on_chain} {irm_addr_fail}", file=out)
                 has_failure = True
                 fail_count += 1
                 if irm_addr:
@@ -603,8 +464,8 @@ def main() -> int:
 
     # Custom checks: oracle implementations from factory ORACLE_IMPLEMENTATION()
     for display_name, factory_name, _impl_name, expected in oracle_custom_checks:
-        if args.dry_run:
-            print(f"[dry-run] oracle {display_name} {expected}")
+        if dry_run:
+            print(f"[dry-run] oracle {display_name} {expected}", file=out)
             continue
 
         impl_addr = oracle_impl_addr_by_display.get(display_name)
@@ -612,7 +473,8 @@ def main() -> int:
             factory_addr = deployments_by_key.get(("oracle", factory_name), "(factory address unknown)")
             print(
                 f"[FAIL] oracle expected {expected} on_chain (read failed) "
-                f"{factory_addr} (failed ORACLE_IMPLEMENTATION call)"
+                f"{factory_addr} (failed ORACLE_IMPLEMENTATION call)",
+                file=out,
             )
             has_failure = True
             fail_count += 1
@@ -620,65 +482,70 @@ def main() -> int:
 
         on_chain = on_chain_by_key.get(("oracle", display_name))
         if on_chain is None:
-            print(f"[FAIL] oracle expected {expected} on_chain (read failed) {impl_addr}")
+            print(f"[FAIL] oracle expected {expected} on_chain (read failed) {impl_addr}", file=out)
             has_failure = True
             fail_count += 1
             failed_contracts.append(("oracle", display_name, impl_addr))
             continue
         if on_chain == expected:
-            print(f"[ ok ] oracle {display_name} {expected}")
+            print(f"[ ok ] oracle {display_name} {expected}", file=out)
             ok_count += 1
             continue
-        print(f"[FAIL] oracle expected {expected} on_chain {on_chain} {impl_addr}")
+        print(f"[FAIL] oracle expected {expected} on_chain {on_chain} {impl_addr}", file=out)
         has_failure = True
         fail_count += 1
         failed_contracts.append(("oracle", display_name, impl_addr))
 
     # Custom checks: SiloDeployer immutable getters (SILO_IMPL, SILO_FACTORY, etc.)
     for display_name, expected, _selector in silo_deployer_checks:
-        if args.dry_run:
-            print(f"[dry-run] core {display_name} {expected}")
+        if dry_run:
+            print(f"[dry-run] core {display_name} {expected}", file=out)
             continue
         impl_addr = silo_deployer_addr_by_display.get(display_name)
         if not impl_addr:
             deployer_addr = deployments_by_key.get(("core", "SiloDeployer"), "(SiloDeployer address unknown)")
             print(
                 f"[FAIL] core expected {expected} on_chain (read failed) "
-                f"{deployer_addr} (failed getter for {display_name})"
+                f"{deployer_addr} (failed getter for {display_name})",
+                file=out,
             )
             has_failure = True
             fail_count += 1
             continue
         on_chain = on_chain_by_key.get(("core", display_name))
         if on_chain is None:
-            print(f"[FAIL] core {display_name} expected {expected} on_chain (read failed) {impl_addr}")
+            print(f"[FAIL] core {display_name} expected {expected} on_chain (read failed) {impl_addr}", file=out)
             has_failure = True
             fail_count += 1
             failed_contracts.append(("core", display_name, impl_addr))
             continue
         if on_chain == expected:
-            print(f"[ ok ] core {display_name} {expected}")
+            print(f"[ ok ] core {display_name} {expected}", file=out)
             ok_count += 1
             continue
-        print(f"[FAIL] core {display_name} expected {expected} on_chain {on_chain} {impl_addr}")
+        print(f"[FAIL] core {display_name} expected {expected} on_chain {on_chain} {impl_addr}", file=out)
         has_failure = True
         fail_count += 1
         failed_contracts.append(("core", display_name, impl_addr))
 
-    if args.dry_run:
-        print(f"Dry-run: {len(expected_by_key)} versioned, {len(all_deployments) - len(expected_by_key)} skipped.")
+    if dry_run:
+        print(f"Dry-run: {len(expected_by_key)} versioned, {len(all_deployments) - len(expected_by_key)} skipped.", file=out)
         return 0
 
-    print()
-    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}")
-    print()
+    print(file=out)
+    print(f"Summary: skipped={skip_count} ok={ok_count} fail={fail_count}", file=out)
+    print(file=out)
 
     if failed_contracts:
-        print()
-        print("Contracts with outdated versions (name, address):")
+        print(file=out)
+        print("Contracts with outdated versions (name, address):", file=out)
+        proxies = get_resolver(client).resolve_many([a for _c, _n, a in failed_contracts]) if resolve_proxies else {}
         for component, display_name, address in failed_contracts:
-            print(f"  - {component}/{display_name}, {address}")
-        print()
+            if address in proxies:
+                print(f"  - {component}/{display_name}, {address} ({proxies[address].describe()})", file=out)
+            else:
+                print(f"  - {component}/{display_name}, {address}", file=out)
+        print(file=out)
 
     return 1 if has_failure else 0
 
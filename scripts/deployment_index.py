@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Compact index of deployment artifacts, shared by the deployment checkers (stdlib only).
+
+Deployment artifacts (*/deployments/<chain>/*.json) embed ABI, bytecode and deployedBytecode,
+about 15 MB in total, and broadcast runs (*/broadcast/**/<chain_id>/run-latest.json) are
+another ~12 MB. The checkers only need name, address and which functions a contract has,
+so this module reads every file once (partially, see scripts/artifact_reader.py) and keeps:
+
+  deployments: component, chain, name, address, ABI function selectors, bytecode hash, source file
+               (+ interface tags derived from the selectors, see INTERFACES)
+  broadcast:   component, chain_id, contractName, contractAddress, source file
+
+The index is persisted to .cache/deployment-index.json keyed by each file's mtime and size.
+On load only new or changed files are parsed again and deleted files are dropped, so a
+warm start costs one directory walk plus one small JSON read.
+
+Usage:
+
+  index = load_index(repo_root)
+  for d in index.deployments("sonic", ["core", "oracle"]):
+      print(d.component, d.name, d.address, "Ownable" in d.interfaces)
+  owned = index.with_interface("Ownable", "sonic")
+
+  # rebuild / inspect from the command line
+  python3 scripts/deployment_index.py --rebuild
+  python3 scripts/deployment_index.py --chain sonic
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from artifact_reader import read_broadcast_transactions, read_deployment_artifact
+from json_cache import load_json_cache, save_json_cache
+from keccak import function_selector
+
+COMPONENT_DIRS: dict[str, str] = {
+    "core": "silo-core",
+    "oracle": "silo-oracles",
+    "vaults": "silo-vaults",
+}
+
+# Interface tag -> function signatures a deployment's ABI must contain.
+INTERFACES: dict[str, tuple[str, ...]] = {
+    "Ownable": ("owner()",),
+    "Ownable2Step": ("owner()", "pendingOwner()", "acceptOwnership()"),
+    "AccessControlEnumerable": ("getRoleMemberCount(bytes32)", "getRoleMember(bytes32,uint256)"),
+    "VERSION": ("VERSION()",),
+}
+
+INDEX_FILE_NAME = "deployment-index.json"
+# Bump when the record layout or parsing rules change; older index files are rebuilt.
+INDEX_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Deployment:
+    component: str
+    chain: str
+    name: str  # artifact name without .sol, e.g. "SiloFactory"
+    address: str  # lowercase
+    selectors: frozenset[str]  # 0x-prefixed 4-byte function selectors from the ABI
+    interfaces: frozenset[str]  # INTERFACES tags the ABI satisfies
+    bytecode_hash: str  # sha256 of deployedBytecode, "" if missing
+    source: str  # artifact path relative to repo root
+
+    def has_function(self, signature: str) -> bool:
+        """True if the ABI declares the function, e.g. has_function("ORACLE_IMPLEMENTATION()")."""
+        return function_selector(signature) in self.selectors
+
+
+@dataclass(frozen=True)
+class BroadcastContract:
+    component: str
+    chain_id: str
+    name: str
+    address: str  # lowercase
+    source: str  # run-latest.json path relative to repo root
+
+
+def _is_address(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("0x") and len(value) >= 42
+
+
+def canonical_type(param: dict[str, Any]) -> str:
+    """ABI param type as used in signatures; tuples expand to (t1,t2,...) plus array suffix."""
+    typ = str(param.get("type") or "")
+    if typ.startswith("tuple"):
+        inner = ",".join(canonical_type(c) for c in param.get("components") or [])
+        return f"({inner}){typ[len('tuple'):]}"
+    return typ
+
+
+def abi_function_selectors(abi: Any) -> list[str]:
+    """Sorted selectors of all function entries of an ABI array."""
+    if not isinstance(abi, list):
+        return []
+    selectors: set[str] = set()
+    for item in abi:
+        if not (isinstance(item, dict) and item.get("type") == "function" and item.get("name")):
+            continue
+        types = ",".join(canonical_type(p) for p in item.get("inputs") or [] if isinstance(p, dict))
+        selectors.add(function_selector(f"{item['name']}({types})"))
+    return sorted(selectors)
+
+
+_INTERFACE_SELECTORS: dict[str, frozenset[str]] = {
+    tag: frozenset(function_selector(sig) for sig in sigs) for tag, sigs in INTERFACES.items()
+}
+_INTERFACES_CACHE: dict[frozenset[str], frozenset[str]] = {}
+
+
+def interfaces_for(selectors: frozenset[str]) -> frozenset[str]:
+    """INTERFACES tags satisfied by a selector set (memoized: many deployments share one ABI)."""
+    tags = _INTERFACES_CACHE.get(selectors)
+    if tags is None:
+        tags = frozenset(tag for tag, required in _INTERFACE_SELECTORS.items() if required <= selectors)
+        _INTERFACES_CACHE[selectors] = tags
+    return tags
+
+
+def _read_deployment(path: Path) -> list[dict[str, Any]]:
+    """Index entries of one deployment artifact (0 or 1). Bytecode is hashed while streaming, never loaded."""
+    try:
+        artifact = read_deployment_artifact(path)
+    except (OSError, ValueError):
+        return []
+    addr = artifact.address.strip() if isinstance(artifact.address, str) else ""
+    if not _is_address(addr):
+        return []
+    return [
+        {
+            "address": addr.lower(),
+            "selectors": abi_function_selectors(artifact.abi),
+            "bytecode_hash": artifact.deployed_bytecode_hash,
+        }
+    ]
+
+
+def _collect_broadcast_entries(obj: Any, out: list[dict[str, Any]]) -> None:
+    if isinstance(obj, dict):
+        name = obj.get("contractName")
+        addr = obj.get("contractAddress")
+        if isinstance(name, str) and _is_address(addr):
+            out.append({"name": name.strip(), "address": addr.lower()})
+        for v in obj.values():
+            _collect_broadcast_entries(v, out)
+    elif isinstance(obj, list):
+        for item in obj:
+            _collect_broadcast_entries(item, out)
+
+
+def _read_broadcast(path: Path) -> list[dict[str, Any]]:
+    """(contractName, contractAddress) entries of one run-latest.json, including libraries."""
+    try:
+        data = read_broadcast_transactions(path)  # receipts etc. are skipped
+    except (OSError, ValueError):
+        return []
+    out: list[dict[str, Any]] = []
+    _collect_broadcast_entries(data, out)
+    return out
+
+
+def _artifact_files(repo_root: Path) -> list[tuple[str, str, Path]]:
+    """(kind, component, path) for every deployment artifact and broadcast run, sorted."""
+    files: list[tuple[str, str, Path]] = []
+    for component, comp_dir in COMPONENT_DIRS.items():
+        base = repo_root / comp_dir
+        files.extend(("deployment", component, p) for p in sorted((base / "deployments").glob("*/*.json")))
+        files.extend(("broadcast", component, p) for p in sorted((base / "broadcast").glob("**/run-latest.json")))
+    return files
+
+
+class DeploymentIndex:
+    """In-memory view of the index. Build with load_index()."""
+
+    def __init__(self, deployments: list[Deployment], broadcast: list[BroadcastContract]) -> None:
+        self._deployments = deployments
+        self._broadcast = broadcast
+        self._by_key = {(d.component, d.chain, d.name): d for d in deployments}
+        self._by_source = {d.source: d for d in deployments}
+        self._by_interface: dict[str, list[Deployment]] = {tag: [] for tag in INTERFACES}
+        for d in deployments:
+            for tag in d.interfaces:
+                self._by_interface[tag].append(d)
+
+    def __len__(self) -> int:
+        return len(self._deployments)
+
+    def all_broadcast_contracts(self) -> list[BroadcastContract]:
+        return list(self._broadcast)
+
+    def deployments(self, chain: str, components: list[str] | None = None) -> list[Deployment]:
+        """Deployments of chain (optionally only these components), sorted by (component order, name)."""
+        comps = list(COMPONENT_DIRS) if components is None else components
+        rank = {c: i for i, c in enumerate(comps)}
+        out = [d for d in self._deployments if d.chain == chain and d.component in rank]
+        out.sort(key=lambda d: (rank[d.component], d.name))
+        return out
+
+    def with_interface(self, tag: str, chain: str, components: list[str] | None = None) -> list[Deployment]:
+        """Deployments of chain whose ABI satisfies INTERFACES[tag], sorted like deployments()."""
+        comps = list(COMPONENT_DIRS) if components is None else components
+        rank = {c: i for i, c in enumerate(comps)}
+        out = [d for d in self._by_interface[tag] if d.chain == chain and d.component in rank]
+        out.sort(key=lambda d: (rank[d.component], d.name))
+        return out
+
+    def get(self, component: str, chain: str, name: str) -> Deployment | None:
+        return self._by_key.get((component, chain, name))
+
+    def by_source(self, source: str) -> Deployment | None:
+        """Deployment of an artifact path relative to repo root (e.g. silo-core/deployments/sonic/Silo.sol.json)."""
+        return self._by_source.get(source)
+
+    def broadcast_contracts(self, chain_id: str, components: list[str] | None = None) -> list[BroadcastContract]:
+        """Broadcast contracts for chain_id, in file order (sorted paths, entries as they appear)."""
+        comps = set(COMPONENT_DIRS if components is None else components)
+        return [b for b in self._broadcast if b.chain_id == chain_id and b.component in comps]
+
+
+def _load_cached_files(cache_path: Path) -> dict[str, Any]:
+    files = load_json_cache(cache_path, INDEX_FORMAT_VERSION).get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def build_index(repo_root: Path, cache_path: Path | None) -> tuple[DeploymentIndex, int]:
+    """Build the index, reusing cached entries of unchanged files. Returns (index, files_parsed)."""
+    cached = _load_cached_files(cache_path) if cache_path else {}
+    files: dict[str, Any] = {}
+    parsed = 0
+    deployments: list[Deployment] = []
+    broadcast: list[BroadcastContract] = []
+
+    for kind, component, path in _artifact_files(repo_root):
+        rel = path.relative_to(repo_root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        prev = cached.get(rel)
+        if prev and prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+            entries = prev["entries"]
+        else:
+            entries = _read_deployment(path) if kind == "deployment" else _read_broadcast(path)
+            parsed += 1
+        files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "entries": entries}
+
+        if kind == "deployment":
+            name = path.stem.removesuffix(".sol")
+            for e in entries:
+                selectors = frozenset(e["selectors"])
+                deployments.append(
+                    Deployment(
+                        component=component,
+                        chain=path.parent.name,
+                        name=name,
+                        address=e["address"],
+                        selectors=selectors,
+                        interfaces=interfaces_for(selectors),
+                        bytecode_hash=e["bytecode_hash"],
+                        source=rel,
+                    )
+                )
+        else:
+            for e in entries:
+                broadcast.append(
+                    BroadcastContract(
+                        component=component,
+                        chain_id=path.parent.name,
+                        name=e["name"],
+                        address=e["address"],
+                        source=rel,
+                    )
+                )
+
+    if cache_path and (parsed or files.keys() != cached.keys()):
+        save_json_cache(cache_path, INDEX_FORMAT_VERSION, {"files": files}, "deployment index")
+    return DeploymentIndex(deployments, broadcast), parsed
+
+
+_LOADED: dict[Path, DeploymentIndex] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+def default_cache_path(repo_root: Path) -> Path:
+    return repo_root / ".cache" / INDEX_FILE_NAME
+
+
+def load_index(repo_root: Path, *, use_cache: bool = True) -> DeploymentIndex:
+    """Index for repo_root, built once per process (thread-safe) and persisted between runs."""
+    repo_root = repo_root.resolve()
+    with _LOAD_LOCK:
+        index = _LOADED.get(repo_root)
+        if index is None:
+            index, _parsed = build_index(repo_root, default_cache_path(repo_root) if use_cache else None)
+            _LOADED[repo_root] = index
+        return index
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Build or inspect the deployment artifact index.")
+    p.add_argument("--rebuild", action="store_true", help="Ignore the persisted index and parse every file.")
+    p.add_argument("--chain", help="Print deployments of this chain.")
+    args = p.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    cache_path = default_cache_path(repo_root)
+    if args.rebuild:
+        cache_path.unlink(missing_ok=True)
+
+    t0 = time.perf_counter()
+    index, parsed = build_index(repo_root, cache_path)
+    elapsed = time.perf_counter() - t0
+    print(
+        f"Index: {len(index)} deployments, {len(index.all_broadcast_contracts())} broadcast contracts, "
+        f"{parsed} files parsed, {elapsed * 1000:.0f} ms ({cache_path.relative_to(repo_root)})"
+    )
+    if args.chain:
+        for d in index.deployments(args.chain):
+            tags = ",".join(sorted(d.interfaces))
+            print(f"  {d.component:<7} {d.name:<45} {d.address} {len(d.selectors):>3} functions  {tags}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Download the Standard JSON (Solidity standard-json input) of every deployed contract, for
+all chains and components, in one process.
+
+Requests run concurrently (--concurrency) and call fetch_source_code of get_standard_json.py
+directly, under one token bucket per explorer host with backoff on "Max rate limit reached"
+(scripts/explorer_scheduler.py; override rates with --rate-limit host=rps). Explorers and API
+keys per chain are the ones of check_deployments_verified_on_explorer.py (first explorer of
+a chain when it has several); `env` / `.env` is loaded once.
+
+Output keeps the layout of the committed files: <output-dir>/<chain>/<Contract>.standard.json
+for core, <output-dir>/silo_oracles/<chain>/ and <output-dir>/silo_vaults/<chain>/ for oracles
+and vaults. Each distinct Standard JSON is written once to the gitignored store
+.cache/standard-json/by-sha256/<sha256>.standard.json and the output files are hard links to it
+(copies where links are not supported), so contracts sharing one verified source (clones of an
+implementation, redeployments) take the space of one file. .cache/standard-json/manifest.json
+maps chain -> component/contract -> address, sha256, explorer ContractName.
+
+Usage:
+
+  python3 scripts/download_standard_jsons.py --chain all
+  python3 scripts/download_standard_jsons.py --chain arbitrum_one,sonic --components core --only Silo
+  python3 scripts/download_standard_jsons.py --chain all --dry-run
+
+Chains without an explorer API key are skipped with a warning (the others are still
+downloaded); --dry-run needs no key.
+
+Exit code: 0 all downloaded, 1 some downloads failed, 2 config error (including a skipped chain).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from check_deployments_verified_on_explorer import (
+    CHAIN_TO_CHAIN_ID,
+    parse_chain_selection,
+    parse_components,
+    resolve_api_config,
+)
+from deployment_index import Deployment, load_index
+from explorer_scheduler import ExplorerScheduler, parse_host_rates
+from get_standard_json import _safe_filename, fetch_source_code, load_repo_env
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 60
+# Content-addressed store and manifest, relative to the repo root (inside the gitignored /.cache/)
+STORE_DIR = Path(".cache") / "standard-json" / "by-sha256"
+MANIFEST_PATH = Path(".cache") / "standard-json" / "manifest.json"
+# Output subdirectory of each component, as in the committed flattened/ tree
+COMPONENT_OUTPUT_DIRS = {"core": "", "oracle": "silo_oracles", "vaults": "silo_vaults"}
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    chain: str
+    component: str
+    name: str  # stable output name (deployment artifact name), not the explorer ContractName
+    address: str
+    api_url: str
+    api_key: str
+    chainid: int | None
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    job: DownloadJob
+    sha256: str | None = None
+    path: Path | None = None  # content-addressed file
+    explorer_name: str = ""
+    error: str | None = None
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Download standard-json of all deployments, concurrently and deduplicated.")
+    p.add_argument("--chain", default="all", help="Comma-separated chain names, or 'all'. Default: all.")
+    p.add_argument("--components", default="core,oracle,vaults", help="Comma-separated: core, oracle, vaults.")
+    p.add_argument("--output-dir", default="flattened", help="Output directory. Default: flattened.")
+    p.add_argument("--only", default="", help="Optional substring filter for contract names (e.g. 'Tower').")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max concurrent explorer requests (all hosts together). Default: {DEFAULT_CONCURRENCY}.",
+    )
+    p.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="HOST=RPS",
+        help="Requests per second for an explorer host, e.g. api.etherscan.io=5. Repeatable.",
+    )
+    p.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"HTTP timeout in seconds. Default: {DEFAULT_TIMEOUT}.")
+    p.add_argument("--dry-run", action="store_true", help="Only list what would be downloaded.")
+    return p.parse_args()
+
+
+def store_content(store_dir: Path, text: str) -> tuple[str, Path]:
+    """Write text as <store_dir>/<sha256>.standard.json unless it is already there. Returns (sha256, path)."""
+    data = text.encode("utf-8")
+    sha256 = hashlib.sha256(data).hexdigest()
+    path = store_dir / f"{sha256}.standard.json"
+    if not path.exists():
+        # Same name means same content, so concurrent writers of one blob only need atomic replace.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    return sha256, path
+
+
+def link_named(blob: Path, named: Path) -> None:
+    """Point named at blob: hard link, or a copy where the filesystem has no hard links."""
+    named.parent.mkdir(parents=True, exist_ok=True)
+    named.unlink(missing_ok=True)
+    try:
+        os.link(blob, named)
+    except OSError:
+        shutil.copyfile(blob, named)
+
+
+def download_all(
+    jobs: list[DownloadJob],
+    store_dir: Path,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    host_rates: dict[str, float] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[DownloadResult]:
+    """
+    fetch_source_code for every job, concurrently under the per-host rate limits, each distinct
+    result stored once in store_dir. Results are in job order; a failed job has error set.
+    """
+    store_dir.mkdir(parents=True, exist_ok=True)
+    scheduler = ExplorerScheduler(host_rates)
+
+    def fetch(job: DownloadJob) -> tuple[dict[str, str] | None, str | None]:
+        try:
+            source, name = fetch_source_code(job.api_url, job.api_key, job.address, chainid=job.chainid, timeout=timeout)
+        except RuntimeError as e:
+            return None, str(e)
+        except OSError as e:  # socket timeout / reset while reading the body
+            return None, f"Network error while calling explorer API: {e}"
+        return {"source": source, "name": name}, None
+
+    def run(job: DownloadJob) -> DownloadResult:
+        payload, err = scheduler.call(job.api_url, lambda: fetch(job))
+        if payload is None:
+            return DownloadResult(job, error=err or "unknown error")
+        sha256, path = store_content(store_dir, payload["source"])
+        return DownloadResult(job, sha256=sha256, path=path, explorer_name=payload["name"])
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(run, jobs))
+
+
+def collect_deployments(repo_root: Path, chains: list[str], components: list[str], only: str) -> list[Deployment]:
+    """Every deployment artifact of chains, deduplicated by chain and address."""
+    index = load_index(repo_root)
+    found: dict[tuple[str, str], Deployment] = {}
+    for chain in chains:
+        for d in index.deployments(chain, components):
+            if not only or only in d.name:
+                found.setdefault((chain, d.address), d)
+    return list(found.values())
+
+
+def build_jobs(deployments: list[Deployment]) -> tuple[list[DownloadJob], list[str]]:
+    """
+    Download jobs for deployments, explorer and API key resolved once per chain. Chains whose
+    explorer cannot be resolved (e.g. no API key) are left out; returns (jobs, skipped chain messages).
+    """
+    explorers: dict[str, tuple[str, str] | None] = {}
+    skipped: list[str] = []
+    jobs: list[DownloadJob] = []
+    for d in deployments:
+        chain = d.chain
+        if chain not in explorers:
+            try:
+                configs, api_key = resolve_api_config(chain)
+            except ValueError as e:
+                explorers[chain] = None
+                skipped.append(str(e))
+            else:
+                explorers[chain] = (configs[0][1], api_key)
+        explorer = explorers[chain]
+        if explorer is not None:
+            api_url, api_key = explorer
+            jobs.append(DownloadJob(chain, d.component, d.name, d.address, api_url, api_key, int(CHAIN_TO_CHAIN_ID[chain])))
+    return jobs, skipped
+
+
+def output_path(output_dir: Path, job: DownloadJob) -> Path:
+    """<output_dir>[/silo_oracles|/silo_vaults]/<chain>/<Contract>.standard.json for job."""
+    name = _safe_filename(job.name) or job.address
+    return output_dir / COMPONENT_OUTPUT_DIRS.get(job.component, "") / job.chain / f"{name}.standard.json"
+
+
+def write_manifest(path: Path, results: list[DownloadResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, dict[str, dict[str, str]]] = {}
+    for r in results:
+        if r.sha256 is None:
+            continue
+        manifest.setdefault(r.job.chain, {})[f"{r.job.component}/{r.job.name}"] = {
+            "address": r.job.address,
+            "sha256": r.sha256,
+            "contract_name": r.explorer_name,
+        }
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(__file__).resolve().parents[1]
+    load_repo_env(repo_root, override_existing=False)
+
+    try:
+        chains = parse_chain_selection(args.chain)
+        components = parse_components(args.components)
+        host_rates = parse_host_rates(args.rate_limit)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    deployments = collect_deployments(repo_root, chains, components, args.only)
+    if not deployments:
+        print("No deployments found.", file=sys.stderr)
+        return 0
+
+    if args.dry_run:
+        for d in deployments:
+            print(f"[{d.chain}] {d.component}/{d.name} {d.address}")
+        print(f"Dry-run: {len(deployments)} contracts on {len(chains)} chain(s).")
+        return 0
+
+    # A chain without explorer config / API key is skipped, the others are still downloaded.
+    jobs, skipped = build_jobs(deployments)
+    for msg in skipped:
+        print(f"Skipping chain: {msg}", file=sys.stderr)
+    if not jobs:
+        return 2
+
+    output_dir = (repo_root / args.output_dir).resolve()
+    started = time.perf_counter()
+    results = download_all(
+        jobs, repo_root / STORE_DIR, concurrency=args.concurrency, host_rates=host_rates, timeout=args.timeout
+    )
+
+    failures: list[DownloadResult] = []
+    for r in results:
+        if r.path is None:
+            failures.append(r)
+            print(f"[FAIL] [{r.job.chain}] {r.job.component}/{r.job.name} {r.job.address}: {r.error}")
+            continue
+        link_named(r.path, output_path(output_dir, r.job))
+        print(f"[ ok ] [{r.job.chain}] {r.job.component}/{r.job.name} {r.sha256[:12]}")
+    write_manifest(repo_root / MANIFEST_PATH, results)
+
+    stored = len({r.sha256 for r in results if r.sha256})
+    print()
+    print(
+        f"Downloaded {len(results) - len(failures)}/{len(results)} standard json files "
+        f"({stored} distinct) in {time.perf_counter() - started:.2f}s -> {output_dir}"
+    )
+    if skipped:
+        print(f"Skipped {len(skipped)} chain(s) without explorer config.", file=sys.stderr)
+        return 2
+    if failures:
+        print(f"Failed for {len(failures)} contracts.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+"""
+Rate-limit-aware scheduling for explorer API requests (stdlib only).
+
+Explorer APIs limit requests per API key and host, not per chain: the Etherscan v2 host
+(api.etherscan.io) serves most of our chains with one key. This module keeps one token
+bucket per host, so concurrent workers together stay at the allowed rate, and retries
+with exponential backoff when the API still answers "Max rate limit reached".
+
+Usage:
+
+  scheduler = ExplorerScheduler()
+  payload, err = scheduler.call(api_url, lambda: fetch_getsourcecode(api_url, key, address, timeout=20))
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+# Requests per second per explorer host (free-tier API limits).
+DEFAULT_HOST_RATES: dict[str, float] = {
+    "api.etherscan.io": 5.0,
+    "api.routescan.io": 2.0,
+    "blockscout-api.injective.network": 5.0,
+    "www.oklink.com": 3.0,
+}
+DEFAULT_RATE = 2.0
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_SECONDS = 1.0
+
+# Substrings of explorer responses that mean "slow down", not "not verified".
+_RATE_LIMIT_MARKERS = ("rate limit", "too many requests", "429")
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second, at most `burst` tokens stored.
+    Default burst is 1 (evenly spaced requests): explorers count requests per sliding
+    second, so a full-rate burst at start plus refill would exceed the limit.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = max(rate, 0.001)
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def drain(self) -> None:
+        """Empty the bucket (after the server said we are over the limit)."""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+
+def is_rate_limited(payload: dict[str, Any] | None, err: str | None) -> bool:
+    """True if an explorer response/error says the request was rejected by rate limiting."""
+    if err is not None:
+        return any(m in err.lower() for m in _RATE_LIMIT_MARKERS)
+    if not isinstance(payload, dict) or str(payload.get("status")) != "0":
+        return False
+    text = f"{payload.get('message', '')} {payload.get('result', '')}".lower()
+    return any(m in text for m in _RATE_LIMIT_MARKERS)
+
+
+class ExplorerScheduler:
+    """Per-host token buckets plus retry with exponential backoff on rate-limit responses."""
+
+    def __init__(
+        self,
+        host_rates: dict[str, float] | None = None,
+        *,
+        default_rate: float = DEFAULT_RATE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+    ) -> None:
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.retries = 0
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = (urlsplit(url).hostname or url).lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.host_rates.get(host, self.default_rate))
+                self._buckets[host] = bucket
+            return bucket
+
+    def call(
+        self, url: str, fn: Callable[[], tuple[dict[str, Any] | None, str | None]]
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Run fn (one explorer request to url) under the host's rate limit; retry while rate limited."""
+        bucket = self.bucket_for(url)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            payload, err = fn()
+            if not is_rate_limited(payload, err) or attempt >= self.max_retries:
+                return payload, err
+            bucket.drain()
+            with self._lock:
+                self.retries += 1
+            time.sleep(self.backoff_seconds * (2**attempt) * (1 + random.random() * 0.25))
+            attempt += 1
+
+
+def parse_host_rates(raw: list[str]) -> dict[str, float]:
+    """Parse ['host=rate', ...] (CLI overrides) on top of DEFAULT_HOST_RATES."""
+    rates = dict(DEFAULT_HOST_RATES)
+    for item in raw:
+        host, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid rate limit {item!r}, expected host=requests_per_second")
+        rates[host.strip().lower()] = float(value)
+    return rates
@@ -8,8 +8,12 @@ This script scans deployment artifacts in:
 Each deployment json is expected to include:
   - "address": "0x..."
 
-For each address it runs:
-  python3 scripts/get_standard_json.py --network arbitrum_one --address <address>
+Addresses are fetched in this process, concurrently under the explorer rate limits
+(fetch_source_code of scripts/get_standard_json.py via scripts/download_standard_jsons.py).
+Each distinct Standard JSON is stored once under the gitignored .cache/standard-json/by-sha256/
+and <output-dir>/<Contract>.standard.json links to it.
+
+For every chain and component at once use scripts/download_standard_jsons.py.
 
 Example:
 
@@ -23,10 +27,13 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 
+from deployment_index import load_index
+from download_standard_jsons import DEFAULT_CONCURRENCY, STORE_DIR, DownloadJob, download_all, link_named
+from get_standard_json import EXPLORER_CONFIG, _safe_filename, load_repo_env, resolve_explorer
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
@@ -40,7 +47,8 @@ def parse_args() -> argparse.Namespace:
     p.add_argument(
         "--network",
         default="arbitrum_one",
-        help="Network passed to scripts/get_standard_json.py.",
+        choices=sorted(EXPLORER_CONFIG.keys()),
+        help="Network key of scripts/get_standard_json.py (explorer API and API key env).",
     )
     p.add_argument(
         "--output-dir",
@@ -52,10 +60,16 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional substring filter for deployment filenames (e.g. 'Tower').",
     )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max concurrent explorer requests. Default: {DEFAULT_CONCURRENCY}.",
+    )
     p.add_argument(
         "--dry-run",
         action="store_true",
-        help="Print commands without executing them.",
+        help="Print contracts and addresses without downloading.",
     )
     return p.parse_args()
 
@@ -86,39 +100,43 @@ def main() -> int:
         print("No deployment files found.", file=sys.stderr)
         return 0
 
-    script = repo_root / "scripts" / "get_standard_json.py"
-    if not script.exists():
-        print(f"Missing script: {script}", file=sys.stderr)
-        return 2
-
-    failures: list[str] = []
+    load_repo_env(repo_root, override_existing=False)
+    api_url, api_key, chainid, api_key_envs = resolve_explorer(args.network)
+    if not api_key:
+        print(
+            f"Warning: API key is empty. Set one of: {', '.join(api_key_envs)} if explorer requires it.",
+            file=sys.stderr,
+        )
 
+    jobs: list[DownloadJob] = []
+    index = load_index(repo_root)
     for deployment_file in deployment_files:
         contract_name = deployment_file.name.removesuffix(".sol.json")
-        address = _read_address(deployment_file)
-
-        cmd = [
-            sys.executable,
-            str(script),
-            "--network",
-            args.network,
-            "--address",
-            address,
-            "--output-dir",
-            args.output_dir,
-            # keep stable filenames even if explorer ContractName differs
-            "--contract",
-            contract_name,
-        ]
+        # Indexed artifacts (*/deployments/<chain>/) need no JSON parsing; other dirs are read directly.
+        try:
+            indexed = index.by_source(deployment_file.relative_to(repo_root).as_posix())
+        except ValueError:
+            indexed = None
+        address = indexed.address if indexed else _read_address(deployment_file)
 
         print(f"[{contract_name}] {address}")
-        print(" ".join(cmd))
-        if args.dry_run:
-            continue
+        # keep stable filenames even if explorer ContractName differs
+        jobs.append(DownloadJob(args.network, "", contract_name, address, api_url, api_key, chainid))
+
+    if args.dry_run:
+        return 0
+
+    output_dir = repo_root / args.output_dir
+    results = download_all(jobs, repo_root / STORE_DIR, concurrency=args.concurrency)
 
-        proc = subprocess.run(cmd, cwd=str(repo_root))
-        if proc.returncode != 0:
-            failures.append(contract_name)
+    failures: list[str] = []
+    for r in results:
+        if r.path is None:
+            print(f"[{r.job.name}] failed: {r.error}", file=sys.stderr)
+            failures.append(r.job.name)
+            continue
+        safe_name = _safe_filename(r.job.name) or _safe_filename(r.job.address) or "contract"
+        link_named(r.path, output_dir / f"{safe_name}.standard.json")
 
     if failures:
         print(
@@ -127,7 +145,8 @@ def main() -> int:
         )
         return 1
 
-    print(f"Done. Downloaded {len(deployment_files)} standard json files.")
+    distinct = len({r.sha256 for r in results})
+    print(f"Done. Downloaded {len(deployment_files)} standard json files ({distinct} distinct).")
     return 0
 
 
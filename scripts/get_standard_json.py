@@ -198,8 +198,21 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def resolve_explorer(network: str, *, api_key: str = "", chainid: int = 0) -> tuple[str, str, int | None, list[str]]:
+    """(api_url, api_key, chainid, api_key_envs) for network from EXPLORER_CONFIG and env overrides."""
+    cfg = EXPLORER_CONFIG[network]
+
+    # In this repo we always prefer the unified Etherscan V2-style URL override,
+    # regardless of chain.
+    api_url_override = os.getenv("VERIFIER_URL_ETHERSCAN_V2", "").strip()
+    api_url = api_url_override or os.getenv(cfg.get("api_url_env", ""), "") or cfg["api_url_default"]
+    api_key_envs = cfg.get("api_key_envs") or ([cfg["api_key_env"]] if "api_key_env" in cfg else [])
+    api_key = api_key or _get_first_env(*api_key_envs)
+    return api_url, api_key, chainid or int(cfg.get("chainid", 0) or 0) or None, api_key_envs
+
+
 def fetch_source_code(
-    api_url: str, api_key: str, address: str, *, chainid: int | None
+    api_url: str, api_key: str, address: str, *, chainid: int | None, timeout: float | None = None
 ) -> tuple[str, str]:
     def _redact_apikey(url: str) -> str:
         # Avoid leaking secrets in logs while still showing full request structure.
@@ -223,19 +236,21 @@ def fetch_source_code(
     # Etherscan V2 API requires `chainid` parameter.
     # It is safe to omit for V1, and safe to include only when V2 is detected.
     is_v2 = "/v2/" in api_url
-    if is_v2:
+    if is_v2 and "chainid=" not in api_url:
         if not chainid:
             raise RuntimeError(
                 "Missing chainid for Etherscan V2 API. "
                 "Pass --chainid or use a --network with configured chainid."
             )
         params["chainid"] = str(chainid)
-    url = f"{api_url}?{urlencode(params)}"
+    # api_url may already contain ?chainid=... (v2); append params with & not ?
+    separator = "&" if "?" in api_url else "?"
+    url = f"{api_url}{separator}{urlencode(params)}"
 
     try:
         # First thing: print the exact URL we are about to call (redacted).
         print(f"Explorer request URL: {_redact_apikey(url)}", file=sys.stderr, flush=True)
-        with urlopen(url) as response:
+        with urlopen(url, timeout=timeout) as response:
             payload = json.loads(response.read().decode("utf-8"))
     except HTTPError as exc:
         raise RuntimeError(f"HTTP error while calling explorer API: {exc}") from exc
@@ -295,15 +310,9 @@ def main() -> int:
     else:
         load_repo_env(repo_root, override_existing=False)
 
-    cfg = EXPLORER_CONFIG[args.network]
-
-    # In this repo we always prefer the unified Etherscan V2-style URL override,
-    # regardless of chain.
-    api_url_override = os.getenv("VERIFIER_URL_ETHERSCAN_V2", "").strip()
-    api_url = api_url_override or os.getenv(cfg.get("api_url_env", ""), "") or cfg["api_url_default"]
-    api_key_envs = cfg.get("api_key_envs") or ([cfg["api_key_env"]] if "api_key_env" in cfg else [])
-    api_key = args.api_key or _get_first_env(*api_key_envs)
-    chainid = args.chainid or int(cfg.get("chainid", 0) or 0) or None
+    api_url, api_key, chainid, api_key_envs = resolve_explorer(
+        args.network, api_key=args.api_key, chainid=args.chainid
+    )
     if not api_key:
         print(
             f"Warning: API key is empty. Set one of: {', '.join(api_key_envs)} "
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Versioned JSON cache files under <repo>/.cache (stdlib only).
+
+Shared by deployment_index.py, source_index.py and version_cache.py. A cache file is one JSON
+object {"version": <format version>, ...sections}; a file of another format version, or one
+that cannot be read, loads as empty so the caller rebuilds it. Writes go to a per-process
+temp file and are moved into place with os.replace, so concurrent runs never see a partial file.
+
+  data = load_json_cache(path, FORMAT_VERSION)             # {} when missing / stale
+  save_json_cache(path, FORMAT_VERSION, {"files": files}, "deployment index")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def load_json_cache(path: Path, format_version: int) -> dict[str, Any]:
+    """Sections of the cache file at path; {} if it is missing, unreadable or of another format version."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != format_version:
+        return {}
+    return raw
+
+
+def save_json_cache(path: Path, format_version: int, sections: dict[str, Any], label: str) -> None:
+    """Atomically write sections as the cache file at path; on failure only warn (label names the cache)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": format_version, **sections}, separators=(",", ":")))
+        os.replace(tmp, path)
+    except OSError as e:  # read-only checkout etc.: results are still correct, just not persisted
+        print(f"Could not write {label} {path}: {e}", file=sys.stderr)
@@ -0,0 +1,94 @@
+"""
+Pure-Python Keccak-256 (the pre-NIST padding used by Ethereum), stdlib only.
+
+hashlib.sha3_256 is the NIST variant and gives different digests, so function
+selectors need this. Fast enough for ABI signatures (a few thousand per run).
+
+  keccak256(b"owner()").hex()[:8] == "8da5cb5b"
+  function_selector("owner()") == "0x8da5cb5b"
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+_ROUND_CONSTANTS = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+]
+
+# Rotation offsets, indexed [x + 5 * y].
+_ROTATIONS = [
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+]
+
+_MASK = (1 << 64) - 1
+_RATE = 136  # bytes, for 256-bit output
+
+
+# (source lane, destination lane, rotation) for the combined rho + pi step.
+_RHO_PI = [(x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), _ROTATIONS[x + 5 * y]) for x in range(5) for y in range(5)]
+
+
+def _keccak_f(state: list[int]) -> None:
+    mask = _MASK
+    rho_pi = _RHO_PI
+    b = [0] * 25
+    for rc in _ROUND_CONSTANTS:
+        # theta
+        c0 = state[0] ^ state[5] ^ state[10] ^ state[15] ^ state[20]
+        c1 = state[1] ^ state[6] ^ state[11] ^ state[16] ^ state[21]
+        c2 = state[2] ^ state[7] ^ state[12] ^ state[17] ^ state[22]
+        c3 = state[3] ^ state[8] ^ state[13] ^ state[18] ^ state[23]
+        c4 = state[4] ^ state[9] ^ state[14] ^ state[19] ^ state[24]
+        d = (
+            c4 ^ (((c1 << 1) | (c1 >> 63)) & mask),
+            c0 ^ (((c2 << 1) | (c2 >> 63)) & mask),
+            c1 ^ (((c3 << 1) | (c3 >> 63)) & mask),
+            c2 ^ (((c4 << 1) | (c4 >> 63)) & mask),
+            c3 ^ (((c0 << 1) | (c0 >> 63)) & mask),
+        )
+        # rho + pi
+        for src, dst, rot in rho_pi:
+            v = state[src] ^ d[src % 5]
+            b[dst] = ((v << rot) | (v >> (64 - rot))) & mask if rot else v
+        # chi
+        for y in (0, 5, 10, 15, 20):
+            b0, b1, b2, b3, b4 = b[y], b[y + 1], b[y + 2], b[y + 3], b[y + 4]
+            state[y] = b0 ^ (~b1 & b2)
+            state[y + 1] = b1 ^ (~b2 & b3)
+            state[y + 2] = b2 ^ (~b3 & b4)
+            state[y + 3] = b3 ^ (~b4 & b0)
+            state[y + 4] = b4 ^ (~b0 & b1)
+        # iota
+        state[0] ^= rc
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 digest of data (32 bytes)."""
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _RATE))
+    padded[-1] |= 0x80
+
+    state = [0] * 25
+    for offset in range(0, len(padded), _RATE):
+        block = padded[offset : offset + _RATE]
+        for i in range(_RATE // 8):
+            state[i] ^= int.from_bytes(block[8 * i : 8 * i + 8], "little")
+        _keccak_f(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+@lru_cache(maxsize=None)
+def function_selector(signature: str) -> str:
+    """0x-prefixed 4-byte selector of a canonical signature, e.g. 'getRoleMember(bytes32,uint256)'."""
+    return "0x" + keccak256(signature.encode("ascii")).hex()[:8]
@@ -0,0 +1,119 @@
+"""
+Multicall3 aggregate3 helper for the deployment checkers (stdlib only).
+
+Packs many (target, calldata) calls into aggregate3(Call3[]) eth_calls against the
+canonical Multicall3 deployment, chunked by encoded calldata size. Each call keeps
+allowFailure=true, so one reverting contract comes back as (False, "0x") instead of
+reverting the whole batch.
+
+If an aggregate3 call itself fails (e.g. Multicall3 not deployed on the chain, RPC
+limit hit), the calls of that chunk are retried as plain batched eth_calls, so callers
+always get one (success, return_data) per call.
+
+Interface: silo-core/scripts/interfaces/IMulticall3.sol
+"""
+
+from __future__ import annotations
+
+from abi_codec import AbiDecodeError, decode_hex, encode_call, hex_to_bytes
+from rpc_client import RpcClient
+
+# Canonical Multicall3 address (same on all supported chains): https://www.multicall3.com
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3((address,bool,bytes)[]) selector
+AGGREGATE3_SELECTOR = "0x82ad56cb"
+CALL3_ARRAY_TYPE = "(address,bool,bytes)[]"  # Call3[]: target, allowFailure, callData
+RESULT_ARRAY_TYPE = "(bool,bytes)[]"  # Result[]: success, returnData
+
+# Max ABI-encoded calldata per aggregate3 eth_call. Keeps requests well under
+# provider body limits and the eth_call gas cap for simple view calls.
+DEFAULT_MAX_CALLDATA_BYTES = 32 * 1024
+
+
+def encode_aggregate3(calls: list[tuple[str, bool, str]]) -> str:
+    """Calldata for aggregate3(Call3[]) from (target, allow_failure, calldata) tuples."""
+    call3 = [(target, allow, hex_to_bytes(data)) for target, allow, data in calls]
+    return encode_call(AGGREGATE3_SELECTOR, [CALL3_ARRAY_TYPE], [call3])
+
+
+def decode_aggregate3_result(hex_result: str) -> list[tuple[bool, str]] | None:
+    """Decode Result[] = (bool success, bytes returnData)[]; None if the payload is malformed."""
+    try:
+        (results,) = decode_hex([RESULT_ARRAY_TYPE], hex_result)
+    except AbiDecodeError:
+        return None
+    return [(success, "0x" + data.hex()) for success, data in results]
+
+
+def chunk_calls(
+    calls: list[tuple[str, str]], max_calldata_bytes: int = DEFAULT_MAX_CALLDATA_BYTES
+) -> list[list[int]]:
+    """Split call indexes into chunks whose aggregate3 calldata stays under max_calldata_bytes."""
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    size = 4 + 64  # selector + array offset + length
+    for i, (_target, data) in enumerate(calls):
+        data_len = len(data.removeprefix("0x")) // 2
+        call_size = 32 + 128 + data_len + (-data_len % 32)  # head offset + tuple
+        if current and size + call_size > max_calldata_bytes:
+            chunks.append(current)
+            current = []
+            size = 4 + 64
+        current.append(i)
+        size += call_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def aggregate3(
+    client: RpcClient,
+    calls: list[tuple[str, str]],
+    *,
+    block: str = "latest",
+    max_calldata_bytes: int = DEFAULT_MAX_CALLDATA_BYTES,
+    multicall_address: str = MULTICALL3_ADDRESS,
+) -> list[tuple[bool, str]]:
+    """
+    Execute (target, calldata) calls through Multicall3.aggregate3 with allowFailure=true.
+    Returns (success, return_data_hex) per call, in input order. All chunks go out in one
+    JSON-RPC batch.
+    """
+    results = aggregate3_with_errors(
+        client, calls, block=block, max_calldata_bytes=max_calldata_bytes, multicall_address=multicall_address
+    )
+    return [(ok, data) for ok, data, _err in results]
+
+
+def aggregate3_with_errors(
+    client: RpcClient,
+    calls: list[tuple[str, str]],
+    *,
+    block: str = "latest",
+    max_calldata_bytes: int = DEFAULT_MAX_CALLDATA_BYTES,
+    multicall_address: str = MULTICALL3_ADDRESS,
+) -> list[tuple[bool, str, str | None]]:
+    """
+    aggregate3 returning (success, return_data_hex, error) per call. error is the eth_call
+    error of a call that went through the plain fallback (check it with is_transport_error to
+    tell an unreachable RPC from a revert); None for calls answered by aggregate3.
+    """
+    chunks = chunk_calls(calls, max_calldata_bytes)
+    payloads = [
+        (multicall_address, encode_aggregate3([(calls[i][0], True, calls[i][1]) for i in chunk])) for chunk in chunks
+    ]
+    results: list[tuple[bool, str, str | None]] = [(False, "0x", None)] * len(calls)
+    fallback: list[int] = []
+    for chunk, (raw, _err) in zip(chunks, client.eth_call_many(payloads, block)):
+        decoded = decode_aggregate3_result(raw) if raw else None
+        if decoded is None or len(decoded) != len(chunk):
+            fallback.extend(chunk)
+            continue
+        for i, (ok, data) in zip(chunk, decoded):
+            results[i] = (ok, data, None)
+    if fallback:
+        plain = client.eth_call_many([calls[i] for i in fallback], block)
+        for i, (raw, err) in zip(fallback, plain):
+            results[i] = (raw is not None, raw or "0x", err)
+    return results
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Oracle price sweep: quote every solvencyOracle / maxLtvOracle of every market on a chain.
+
+Markets are the SiloConfigs of silo-core/deploy/silo/_siloDeployments.json. All calls are
+pinned to one block (--block, default: the latest block at start) and batched:
+
+  1. getSilos() of all configs                 - Multicall3.aggregate3
+  2. getConfig(silo) of all silos              - Multicall3.aggregate3
+  3. decimals() of base tokens, quoteToken()   - Multicall3.aggregate3
+  4. decimals() of quote tokens                - Multicall3.aggregate3
+  5. quote(10**decimals, token) per oracle     - JSON-RPC batches of --batch-size, sent concurrently
+
+Each distinct (oracle, base token) is quoted once, however many markets use it. When the
+silo config has callBeforeQuote set, the quote goes through aggregate3 as
+[beforeQuote(token), quote(amount, token)], so quote() sees the state beforeQuote() left
+behind, as it does inside the Silo (msg.sender of beforeQuote() is Multicall3 here).
+
+Latency is the round trip of the JSON-RPC batch that carried the quote; use
+--batch-size 1 to time every oracle on its own.
+
+Usage:
+
+  export RPC_SONIC=https://...
+  python3 scripts/oracle_sweep.py --chain sonic
+  python3 scripts/oracle_sweep.py --chain sonic --block 41000000 --batch-size 1
+
+Exit code: 0 every oracle quoted, 1 some quotes failed, 2 config/RPC error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from abi_codec import decode_address, decode_config_data, decode_uint, encode_call
+from check_deployments_owner_is_dao import CHAIN_DISPLAY_NAMES, CHAIN_TO_RPC_ENV
+from multicall3 import MULTICALL3_ADDRESS, aggregate3, decode_aggregate3_result, encode_aggregate3
+from rpc_client import DEFAULT_MAX_CONNECTIONS, RpcClient, get_client, is_transport_error
+from silo_config_analyzer import (
+    DEFAULT_PUBLIC_RPC,
+    GET_SILOS_SELECTOR,
+    SILO_DEPLOYMENTS_FILE,
+    decode_silos,
+    load_silo_deployments,
+)
+
+GET_CONFIG_SELECTOR = "0xe48a5f7b"  # getConfig(address)
+QUOTE_SELECTOR = "0x13b0be33"  # quote(uint256,address)
+BEFORE_QUOTE_SELECTOR = "0xf9fa619a"  # beforeQuote(address)
+QUOTE_TOKEN_SELECTOR = "0x217a4b70"  # quoteToken()
+DECIMALS_SELECTOR = "0x313ce567"  # decimals()
+
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_DECIMALS = 18
+
+
+@dataclass
+class OracleQuote:
+    oracle: str
+    base_token: str
+    call_before_quote: bool
+    used_by: list[tuple[str, int, str]] = field(default_factory=list)  # (market, silo index, role)
+    base_decimals: int = DEFAULT_DECIMALS
+    quote_token: str | None = None
+    quote_decimals: int = DEFAULT_DECIMALS
+    quote: int | None = None
+    status: str = "not quoted"
+    latency_ms: float = 0.0
+
+    @property
+    def price(self) -> float | None:
+        """Quote of one whole base token in whole quote tokens."""
+        return None if self.quote is None else self.quote / 10**self.quote_decimals
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Quote every solvency / maxLtv oracle of every market on a chain.")
+    p.add_argument("--chain", required=True, help="Chain name from _siloDeployments.json (e.g. sonic).")
+    p.add_argument("--rpc-url", default=None, help="RPC URL. If not set, uses env from CHAIN_TO_RPC_ENV.")
+    p.add_argument("--block", default="latest", help="Block number to pin every call to. Default: latest block at start.")
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Oracle quotes per JSON-RPC batch (latency is measured per batch). Default: {DEFAULT_BATCH_SIZE}.",
+    )
+    p.add_argument(
+        "--max-rpc-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help=f"Max in-flight requests per RPC URL. Default: {DEFAULT_MAX_CONNECTIONS}.",
+    )
+    return p.parse_args()
+
+
+def resolve_block(client: RpcClient, block: str) -> tuple[str | None, str | None]:
+    """(hex block number, error); "latest" becomes the current block so every call sees the same state."""
+    if block != "latest":
+        try:
+            return hex(int(block, 0)), None
+        except ValueError:
+            return None, f"invalid --block {block!r}"
+    result, err = client.call("eth_blockNumber", [])
+    if err is not None or not isinstance(result, str):
+        return None, err or "eth_blockNumber returned no result"
+    return result, None
+
+
+def collect_oracles(
+    client: RpcClient, configs: dict[str, str], block: str
+) -> tuple[list[OracleQuote], list[str]]:
+    """Distinct (oracle, base token) entries of all configs, plus names of configs that failed to load."""
+    names = list(configs)
+    silos_results = aggregate3(client, [(configs[name], GET_SILOS_SELECTOR) for name in names], block=block)
+    failed: list[str] = []
+    silos: list[tuple[str, int, str, str]] = []  # (market, silo index, silo, config)
+    for name, (ok, data) in zip(names, silos_results):
+        pair = decode_silos(ok, data)
+        if pair is None:
+            failed.append(name)
+            continue
+        silo0, silo1 = pair
+        silos.append((name, 0, silo0, configs[name]))
+        silos.append((name, 1, silo1, configs[name]))
+
+    get_config = [(config, encode_call(GET_CONFIG_SELECTOR, ["address"], [silo])) for _n, _i, silo, config in silos]
+    entries: dict[tuple[str, str, bool], OracleQuote] = {}
+    for (name, index, _silo, _config), (ok, data) in zip(silos, aggregate3(client, get_config, block=block)):
+        try:
+            config_data = decode_config_data(data) if ok else None
+        except ValueError:
+            config_data = None
+        if config_data is None:
+            if name not in failed:
+                failed.append(name)
+            continue
+        roles: dict[str, list[str]] = {}
+        for role in ("solvencyOracle", "maxLtvOracle"):
+            oracle = config_data[role]
+            if oracle != "0x" + "0" * 40:  # no oracle: the Silo values the token 1:1
+                roles.setdefault(oracle, []).append(role.removesuffix("Oracle"))
+        for oracle, role_names in roles.items():
+            key = (oracle, config_data["token"], bool(config_data["callBeforeQuote"]))
+            entry = entries.setdefault(key, OracleQuote(*key))
+            entry.used_by.append((name, index, "+".join(role_names)))
+
+    quotes = list(entries.values())
+    load_decimals(client, quotes, block)
+    return quotes, failed
+
+
+def load_decimals(client: RpcClient, quotes: list[OracleQuote], block: str) -> None:
+    """Fill base_decimals, quote_token and quote_decimals (defaults stay where a call fails)."""
+    base_tokens = sorted({q.base_token for q in quotes})
+    oracles = sorted({q.oracle for q in quotes})
+    results = aggregate3(
+        client,
+        [(t, DECIMALS_SELECTOR) for t in base_tokens] + [(o, QUOTE_TOKEN_SELECTOR) for o in oracles],
+        block=block,
+    )
+    decimals: dict[str, int] = {}
+    for token, (ok, data) in zip(base_tokens, results):
+        value = decode_uint(data) if ok else None
+        if value is not None and value <= 77:  # 10**decimals must fit in uint256
+            decimals[token] = value
+    quote_token_of = {o: decode_address(data) if ok else None for o, (ok, data) in zip(oracles, results[len(base_tokens) :])}
+
+    quote_tokens = sorted({t for t in quote_token_of.values() if t and t not in decimals})
+    for token, (ok, data) in zip(quote_tokens, aggregate3(client, [(t, DECIMALS_SELECTOR) for t in quote_tokens], block=block)):
+        value = decode_uint(data) if ok else None
+        if value is not None and value <= 77:
+            decimals[token] = value
+
+    for q in quotes:
+        q.base_decimals = decimals.get(q.base_token, DEFAULT_DECIMALS)
+        q.quote_token = quote_token_of.get(q.oracle)
+        q.quote_decimals = decimals.get(q.quote_token or "", DEFAULT_DECIMALS)
+
+
+def quote_payload(q: OracleQuote) -> tuple[str, str]:
+    """(to, data) of the eth_call quoting q: plain quote(), or aggregate3 [beforeQuote, quote]."""
+    quote = encode_call(QUOTE_SELECTOR, ["uint256", "address"], [10**q.base_decimals, q.base_token])
+    if not q.call_before_quote:
+        return q.oracle, quote
+    before = encode_call(BEFORE_QUOTE_SELECTOR, ["address"], [q.base_token])
+    return MULTICALL3_ADDRESS, encode_aggregate3([(q.oracle, True, before), (q.oracle, True, quote)])
+
+
+def apply_quote_result(q: OracleQuote, raw: str | None, err: str | None) -> None:
+    if raw is None:
+        q.status = "rpc error" if is_transport_error(err) else "reverted"
+        return
+    if q.call_before_quote:
+        decoded = decode_aggregate3_result(raw)
+        if decoded is None or len(decoded) != 2:
+            q.status = "aggregate3 failed"
+            return
+        (before_ok, _), (ok, raw) = decoded
+        if not before_ok:
+            q.status = "beforeQuote reverted"
+            return
+        if not ok:
+            q.status = "reverted"
+            return
+    q.quote = decode_uint(raw)
+    if q.quote is None:
+        q.status = "bad response"
+    else:
+        q.status = "ok" if q.quote else "zero price"
+
+
+def quote_all(client: RpcClient, quotes: list[OracleQuote], block: str, batch_size: int, workers: int) -> None:
+    """Quote every oracle; batches go out concurrently, each quote gets its batch round trip as latency."""
+    batches = [quotes[i : i + batch_size] for i in range(0, len(quotes), batch_size)]
+
+    def run(batch: list[OracleQuote]) -> None:
+        started = time.perf_counter()
+        results = client.eth_call_many([quote_payload(q) for q in batch], block)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for q, (raw, err) in zip(batch, results):
+            q.latency_ms = elapsed_ms
+            apply_quote_result(q, raw, err)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="quote") as pool:
+        list(pool.map(run, batches))
+
+
+def print_table(quotes: list[OracleQuote]) -> None:
+    rows = sorted(
+        ((market, index, role, q) for q in quotes for market, index, role in q.used_by),
+        key=lambda r: (r[0], r[1], r[2]),
+    )
+    print(f"{'Market':<45} {'Silo':<4} {'Role':<16} {'Oracle':<42} {'Base Token':<42} {'Price':>18} {'Latency ms':>10} Status")
+    print("-" * 195)
+    for market, index, role, q in rows:
+        price = f"{q.price:.8g}" if q.price is not None else "-"
+        before = " (beforeQuote)" if q.call_before_quote and not q.status.startswith("beforeQuote") else ""
+        print(
+            f"{market:<45} {index:<4} {role:<16} {q.oracle:<42} {q.base_token:<42} {price:>18} {q.latency_ms:>10.1f} "
+            f"{q.status}{before}"
+        )
+    print("-" * 195)
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(__file__).resolve().parents[1]
+    chain = args.chain.strip()
+    try:
+        deployments = load_silo_deployments(repo_root)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error loading {SILO_DEPLOYMENTS_FILE}: {e}", file=sys.stderr)
+        return 2
+    if chain not in deployments:
+        print(f"Unknown chain: {chain}. Allowed: {sorted(deployments)}", file=sys.stderr)
+        return 2
+    if args.batch_size < 1:
+        print("--batch-size must be at least 1", file=sys.stderr)
+        return 2
+
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None) or DEFAULT_PUBLIC_RPC.get(chain)
+    if not rpc_url:
+        print(f"RPC URL not set. Use --rpc-url or set env {rpc_env or 'RPC_<chain>'}", file=sys.stderr)
+        return 2
+
+    client = get_client(rpc_url, max_connections=args.max_rpc_concurrency)
+    started = time.perf_counter()
+    block, err = resolve_block(client, args.block.strip())
+    if block is None:
+        print(f"RPC error: {err}", file=sys.stderr)
+        return 2
+
+    quotes, failed_markets = collect_oracles(client, deployments[chain], block)
+    quote_all(client, quotes, block, args.batch_size, args.max_rpc_concurrency)
+    elapsed = time.perf_counter() - started
+
+    print(f"{CHAIN_DISPLAY_NAMES.get(chain, chain).upper()} ORACLE SWEEP at block {int(block, 16)}")
+    print_table(quotes)
+    failed_quotes = [q for q in quotes if q.status != "ok"]
+    print(f"Markets: {len(deployments[chain])} (failed to load: {len(failed_markets)})")
+    for name in failed_markets:
+        print(f"  - {name}")
+    print(f"Oracles quoted: {len(quotes)} ok={len(quotes) - len(failed_quotes)} fail={len(failed_quotes)}")
+    slowest = sorted(quotes, key=lambda q: q.latency_ms, reverse=True)[:5]
+    if slowest:
+        print("Slowest quotes: " + ", ".join(f"{q.oracle} {q.latency_ms:.1f} ms" for q in slowest))
+    print(f"Wall time: {elapsed:.2f} s, HTTP requests: {client.http_requests}")
+    return 1 if failed_quotes or failed_markets else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
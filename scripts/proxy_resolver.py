@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Proxy classification for deployed contracts (stdlib only).
+
+Recognises:
+  - ERC-1167 minimal clones    implementation is embedded in the runtime code
+  - EIP-1967 proxies           implementation (and admin) read from the standard storage slots
+  - EIP-1967 beacon proxies    beacon read from its slot, implementation from beacon.implementation()
+
+Results are memoised by runtime code hash: every distinct code is classified once, so
+thousands of clones of one implementation cost one classification (the code itself is
+still fetched once per address, all in one JSON-RPC batch). Code whose proxy slots were
+empty is remembered as "not a proxy" and never costs storage reads again. Addresses and
+beacons are memoised too, so resolving the same address twice is free.
+
+Usage from a script:
+
+  from proxy_resolver import get_resolver
+
+  resolver = get_resolver(client)                       # one per RpcClient
+  infos = resolver.resolve_many([address, ...])         # {address: ProxyInfo}
+  infos[address].kind, infos[address].implementation
+
+  python3 scripts/proxy_resolver.py --chain sonic 0xabc... 0xdef...
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import threading
+from dataclasses import dataclass
+
+from abi_codec import decode_address
+from rpc_client import RpcClient, get_client
+
+# ERC-1167 minimal proxy runtime code: prefix + 20-byte implementation + suffix
+ERC1167_PREFIX = "363d3d373d3d3d363d73"
+ERC1167_SUFFIX = "5af43d82803e903d91602b57fd5bf3"
+
+# bytes32(uint256(keccak256("eip1967.proxy.implementation")) - 1) etc.
+EIP1967_IMPLEMENTATION_SLOT = "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+EIP1967_BEACON_SLOT = "0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50"
+EIP1967_ADMIN_SLOT = "0xb53127684a568b3173ae13b9f8a6016e243e63b6e8ee1178d6a717850b5d6103"
+
+# IBeacon.implementation()
+BEACON_IMPLEMENTATION_SELECTOR = "0x5c60da1b"
+
+# ProxyInfo.kind values
+NO_CODE = "no_code"
+ERC1167 = "erc1167"
+EIP1967 = "eip1967"
+BEACON = "beacon"
+NOT_A_PROXY = "none"
+UNKNOWN = "unknown"  # RPC failure, not memoised
+
+
+@dataclass(frozen=True)
+class ProxyInfo:
+    kind: str
+    implementation: str | None = None
+    beacon: str | None = None
+    admin: str | None = None
+    code_hash: str = ""
+
+    def describe(self) -> str:
+        """Short human-readable form for report lines."""
+        if self.kind == ERC1167:
+            return f"ERC-1167 clone of {self.implementation}"
+        if self.kind == EIP1967:
+            admin = f", admin {self.admin}" if self.admin else ""
+            return f"EIP-1967 proxy -> {self.implementation or 'no implementation'}{admin}"
+        if self.kind == BEACON:
+            return f"beacon proxy ({self.beacon}) -> {self.implementation or 'implementation() failed'}"
+        if self.kind == NO_CODE:
+            return "no code"
+        if self.kind == UNKNOWN:
+            return "proxy check failed"
+        return "not a proxy"
+
+
+def erc1167_implementation(code_hex: str) -> str | None:
+    """Implementation address of ERC-1167 runtime code, None for any other code."""
+    body = code_hex[2:].lower() if code_hex.startswith("0x") else code_hex.lower()
+    n = len(ERC1167_PREFIX)
+    if body.startswith(ERC1167_PREFIX) and body[n + 40 :].startswith(ERC1167_SUFFIX):
+        return decode_address("0x" + "0" * 24 + body[n : n + 40])
+    return None
+
+
+class ProxyResolver:
+    """Classifies addresses through one RpcClient; thread-safe, memoised by code hash."""
+
+    def __init__(self, client: RpcClient, block: str = "latest") -> None:
+        self.client = client
+        self.block = block
+        self._lock = threading.Lock()
+        self._by_address: dict[str, ProxyInfo] = {}
+        self._code_kind: dict[str, str] = {}  # code hash -> ERC1167 / NOT_A_PROXY / "slots"
+        self._beacon_impl: dict[str, str | None] = {}
+        self.code_fetches = 0
+        self.storage_reads = 0
+        self.memo_hits = 0
+
+    def resolve(self, address: str) -> ProxyInfo:
+        return self.resolve_many([address])[address]
+
+    def resolve_many(self, addresses: list[str]) -> dict[str, ProxyInfo]:
+        """{address: ProxyInfo} for every address (input spelling kept as key)."""
+        result: dict[str, ProxyInfo] = {}
+        todo: list[str] = []
+        with self._lock:
+            for address in dict.fromkeys(addresses):
+                known = self._by_address.get(address.lower())
+                if known is not None:
+                    result[address] = known
+                    self.memo_hits += 1
+                else:
+                    todo.append(address)
+        if not todo:
+            return result
+
+        codes = self.client.batch([("eth_getCode", [a, self.block]) for a in todo])
+        self.code_fetches += len(todo)
+
+        need_slots: list[tuple[str, str]] = []  # (address, code hash)
+        for address, (code, err) in zip(todo, codes):
+            if err is not None or not isinstance(code, str):
+                result[address] = ProxyInfo(UNKNOWN)
+                continue
+            if code in ("0x", ""):
+                result[address] = self._remember(address, ProxyInfo(NO_CODE))
+                continue
+            code_hash = hashlib.sha256(code.lower().encode("ascii")).hexdigest()
+            kind = self._code_kind.get(code_hash)
+            if kind is not None:
+                self.memo_hits += 1
+            if kind == NOT_A_PROXY:
+                result[address] = self._remember(address, ProxyInfo(NOT_A_PROXY, code_hash=code_hash))
+                continue
+            implementation = erc1167_implementation(code) if kind in (None, ERC1167) else None
+            if implementation is not None:
+                self._code_kind[code_hash] = ERC1167
+                result[address] = self._remember(address, ProxyInfo(ERC1167, implementation, code_hash=code_hash))
+                continue
+            need_slots.append((address, code_hash))
+
+        if need_slots:
+            result.update(self._resolve_slots(need_slots))
+        return result
+
+    def _resolve_slots(self, items: list[tuple[str, str]]) -> dict[str, ProxyInfo]:
+        """EIP-1967 implementation / beacon / admin slots of items, then implementation() of new beacons."""
+        slots = (EIP1967_IMPLEMENTATION_SLOT, EIP1967_BEACON_SLOT, EIP1967_ADMIN_SLOT)
+        reads = self.client.batch(
+            [("eth_getStorageAt", [address, slot, self.block]) for address, _ in items for slot in slots]
+        )
+        self.storage_reads += len(reads)
+
+        slot_values: list[tuple[str, str, str | None, str | None, str | None]] = []
+        failed: set[str] = set()
+        for i, (address, code_hash) in enumerate(items):
+            words = reads[3 * i : 3 * i + 3]
+            if any(err is not None for _value, err in words):
+                failed.add(address)
+                continue
+            implementation, beacon, admin = (decode_address(value) for value, _err in words)
+            slot_values.append((address, code_hash, implementation, beacon, admin))
+
+        new_beacons = sorted({b for _a, _h, _i, b, _ad in slot_values if b and b not in self._beacon_impl})
+        if new_beacons:
+            answers = self.client.eth_call_many([(b, BEACON_IMPLEMENTATION_SELECTOR) for b in new_beacons], self.block)
+            for beacon, (raw, _err) in zip(new_beacons, answers):
+                self._beacon_impl[beacon] = decode_address(raw)
+
+        result: dict[str, ProxyInfo] = {address: ProxyInfo(UNKNOWN) for address in failed}
+        for address, code_hash, implementation, beacon, admin in slot_values:
+            if beacon:
+                info = ProxyInfo(BEACON, self._beacon_impl.get(beacon), beacon, admin, code_hash)
+            elif implementation:
+                info = ProxyInfo(EIP1967, implementation, None, admin, code_hash)
+            else:
+                info = ProxyInfo(NOT_A_PROXY, code_hash=code_hash)
+            # Proxy code keeps needing per-address slot reads; plain code never does.
+            self._code_kind.setdefault(code_hash, NOT_A_PROXY if info.kind == NOT_A_PROXY else "slots")
+            result[address] = self._remember(address, info)
+        return result
+
+    def _remember(self, address: str, info: ProxyInfo) -> ProxyInfo:
+        with self._lock:
+            self._by_address[address.lower()] = info
+        return info
+
+
+_resolvers: dict[int, ProxyResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_resolver(client: RpcClient) -> ProxyResolver:
+    """Shared ProxyResolver for client (so scripts running in one process share the memo)."""
+    with _resolvers_lock:
+        resolver = _resolvers.get(id(client))
+        if resolver is None or resolver.client is not client:
+            resolver = _resolvers[id(client)] = ProxyResolver(client)
+        return resolver
+
+
+def main() -> int:
+    from check_deployments_owner_is_dao import CHAIN_TO_RPC_ENV
+
+    p = argparse.ArgumentParser(description="Classify addresses as ERC-1167 / EIP-1967 / beacon proxies.")
+    p.add_argument("addresses", nargs="+", help="Contract addresses.")
+    p.add_argument("--chain", default=None, help="Chain name (RPC URL from CHAIN_TO_RPC_ENV).")
+    p.add_argument("--rpc-url", default=None, help="RPC URL. If not set, uses env from CHAIN_TO_RPC_ENV.")
+    args = p.parse_args()
+    rpc_env = CHAIN_TO_RPC_ENV.get(args.chain or "")
+    rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None)
+    if not rpc_url:
+        print("RPC URL not set. Use --rpc-url or --chain with its RPC_* env var", file=sys.stderr)
+        return 2
+    resolver = get_resolver(get_client(rpc_url))
+    infos = resolver.resolve_many(args.addresses)
+    for address in args.addresses:
+        print(f"{address} {infos[address].describe()}")
+    return 1 if any(info.kind == UNKNOWN for info in infos.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Shared JSON-RPC client for the deployment checkers (stdlib only).
+
+The checkers used to build a fresh urllib Request per eth_call, which means one
+TCP+TLS handshake per contract. This module keeps HTTP/1.1 keep-alive connections
+in a small per-URL pool and supports JSON-RPC 2.0 array batching, so a chain with
+hundreds of deployments costs a handful of HTTP round trips.
+
+Usage from a checker:
+
+  from rpc_client import get_client
+
+  client = get_client(rpc_url)
+  result, err = client.eth_call(address, OWNER_SELECTOR)
+  results = client.eth_call_many([(address, OWNER_SELECTOR) for address in addresses])
+
+Benchmark against a local stand-in RPC server (no network needed):
+
+  python3 scripts/rpc_client.py --benchmark
+  python3 scripts/rpc_client.py --benchmark --calls 500 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import http.client
+import json
+import queue
+import socket
+import threading
+import time
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+# Max requests per JSON-RPC batch. Most providers accept 100+; some cap lower.
+DEFAULT_MAX_BATCH_SIZE = 100
+# Max open keep-alive connections (and concurrent in-flight requests) per RPC URL.
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 30
+
+USER_AGENT = "silo-deployment-checks/1.0"
+
+# Prefix of error messages caused by HTTP/network failures (as opposed to RPC errors / reverts).
+TRANSPORT_ERROR_PREFIX = "transport error: "
+# JSON-RPC "Invalid Request": what endpoints without batch support answer to an array.
+INVALID_REQUEST_CODE = -32600
+
+
+class RpcClient:
+    """
+    Pooled JSON-RPC client for a single endpoint.
+
+    Methods return (result, error_message) pairs, like the per-script _eth_call helpers did:
+    result is None when the call failed (transport error, RPC error or revert).
+    Thread-safe: up to max_connections requests are in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported RPC URL scheme: {parts.scheme!r}")
+        self.url = url
+        self.timeout = timeout
+        self.max_batch_size = max(1, max_batch_size)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": USER_AGENT,
+            "Connection": "keep-alive",
+        }
+        if parts.username:
+            token = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            self._headers["Authorization"] = "Basic " + base64.b64encode(token.encode()).decode()
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, max_connections))
+        self._id_lock = threading.Lock()
+        self._next_id = 1
+        # Set to False after the endpoint rejects an array payload; batches then go one by one.
+        self.supports_batch = True
+        self.http_requests = 0
+
+    # --- connection pool ---
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._https:
+            conn = http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+        conn.connect()
+        # http.client writes headers and body separately; without TCP_NODELAY a reused
+        # connection stalls on Nagle + delayed ACK (~40 ms per request).
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn
+
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON payload on a pooled connection; retry once on a stale keep-alive socket."""
+        body = json.dumps(payload).encode("utf-8")
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn = self._new_connection()
+                reused = False
+            try:
+                try:
+                    raw = self._roundtrip(conn, body)
+                except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                    conn.close()
+                    if not reused:
+                        raise
+                    conn = self._new_connection()
+                    raw = self._roundtrip(conn, body)
+            except BaseException:
+                conn.close()
+                raise
+            self._idle.put(conn)
+        return json.loads(raw.decode("utf-8"))
+
+    def _roundtrip(self, conn: http.client.HTTPConnection, body: bytes) -> bytes:
+        # One client is shared by all threads of a run; += is not atomic
+        with self._id_lock:
+            self.http_requests += 1
+        conn.request("POST", self._path, body=body, headers=self._headers)
+        resp = conn.getresponse()
+        raw = resp.read()
+        if resp.status >= 400 and not raw.strip().startswith((b"{", b"[")):
+            raise OSError(f"HTTP Error {resp.status}: {resp.reason}")
+        if resp.will_close:
+            conn.close()
+        return raw
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    # --- JSON-RPC ---
+
+    def _take_ids(self, n: int) -> int:
+        with self._id_lock:
+            first = self._next_id
+            self._next_id += n
+        return first
+
+    def call(self, method: str, params: list[Any]) -> tuple[Any, str | None]:
+        """Single JSON-RPC request. Returns (result, error_message)."""
+        payload = {"jsonrpc": "2.0", "id": self._take_ids(1), "method": method, "params": params}
+        try:
+            body = self._post(payload)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
+            return None, TRANSPORT_ERROR_PREFIX + str(e)
+        return _unwrap_response(body)
+
+    def batch(self, calls: list[tuple[str, list[Any]]]) -> list[tuple[Any, str | None]]:
+        """
+        Send many requests as JSON-RPC batches of up to max_batch_size.
+        Returns one (result, error_message) per call, in the same order as calls.
+        Falls back to one request per call if the endpoint does not accept batches.
+        """
+        out: list[tuple[Any, str | None]] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            chunk = calls[start : start + self.max_batch_size]
+            if len(chunk) == 1 or not self.supports_batch:
+                out.extend(self.call(method, params) for method, params in chunk)
+                continue
+            out.extend(self._send_batch(chunk))
+        return out
+
+    def _send_batch(self, chunk: list[tuple[str, list[Any]]]) -> list[tuple[Any, str | None]]:
+        first_id = self._take_ids(len(chunk))
+        payload = [
+            {"jsonrpc": "2.0", "id": first_id + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(chunk)
+        ]
+        try:
+            body = self._post(payload)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
+            return [(None, TRANSPORT_ERROR_PREFIX + str(e))] * len(chunk)
+        if not isinstance(body, list):
+            _result, err = _unwrap_response(body)
+            if _is_batch_unsupported(body, err):
+                # Endpoint rejected the array itself; retry call by call from now on.
+                self.supports_batch = False
+                return [self.call(method, params) for method, params in chunk]
+            # Whole batch refused (e.g. 429 rate limit): report it per call, keep batching.
+            return [(None, TRANSPORT_ERROR_PREFIX + (err or "batch rejected"))] * len(chunk)
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        out: list[tuple[Any, str | None]] = []
+        for i in range(len(chunk)):
+            item = by_id.get(first_id + i)
+            out.append(_unwrap_response(item) if item is not None else (None, "missing response in batch"))
+        return out
+
+    # --- eth helpers ---
+
+    def eth_call(self, to: str, data: str, block: str = "latest") -> tuple[str | None, str | None]:
+        """eth_call; returns (hex result or None, error_message)."""
+        result, err = self.call("eth_call", _eth_call_params(to, data, block))
+        return _hex_result(result, err)
+
+    def eth_call_many(
+        self, calls: list[tuple[str, str]], block: str = "latest"
+    ) -> list[tuple[str | None, str | None]]:
+        """Batched eth_call for (to, data) pairs; results in input order."""
+        raw = self.batch([("eth_call", _eth_call_params(to, data, block)) for to, data in calls])
+        return [_hex_result(result, err) for result, err in raw]
+
+
+def is_transport_error(err: str | None) -> bool:
+    """True if err came from HTTP/network failure rather than from the RPC (e.g. revert)."""
+    return bool(err) and err.startswith(TRANSPORT_ERROR_PREFIX)
+
+
+def _is_batch_unsupported(body: Any, err: str | None) -> bool:
+    """True if a single error object in reply to a batch says batch requests are not supported."""
+    error = body.get("error") if isinstance(body, dict) else None
+    code = error.get("code") if isinstance(error, dict) else None
+    return code == INVALID_REQUEST_CODE or "batch" in (err or "").lower()
+
+
+def _eth_call_params(to: str, data: str, block: str) -> list[Any]:
+    to = to if to.startswith("0x") else "0x" + to
+    return [{"to": to, "data": data}, block]
+
+
+def _unwrap_response(body: Any) -> tuple[Any, str | None]:
+    if not isinstance(body, dict):
+        return None, f"unexpected RPC response: {str(body)[:200]}"
+    err = body.get("error")
+    if err:
+        msg = err.get("message", err) if isinstance(err, dict) else str(err)
+        return None, str(msg)
+    return body.get("result"), None
+
+
+def _hex_result(result: Any, err: str | None) -> tuple[str | None, str | None]:
+    if err is not None:
+        return None, err
+    result = (result or "").strip() if isinstance(result, str) else ""
+    return result or None, None
+
+
+_CLIENTS: dict[str, RpcClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(url: str, **kwargs: Any) -> RpcClient:
+    """Shared client per RPC URL, so all checks in one process reuse the same connection pool."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(url)
+        if client is None:
+            client = RpcClient(url, **kwargs)
+            _CLIENTS[url] = client
+        return client
+
+
+# --- benchmark ---
+
+
+def _start_stand_in_server(latency_s: float) -> tuple[Any, str]:
+    """Local HTTP/1.1 JSON-RPC server answering eth_call with one ABI word; latency_s per HTTP request."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    word = "0x" + "00" * 12 + "11" * 20
+
+    def answer(req: dict[str, Any]) -> dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": req.get("id"), "result": word}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+            length = int(self.headers.get("Content-Length") or 0)
+            req = json.loads(self.rfile.read(length))
+            if latency_s:
+                time.sleep(latency_s)
+            resp = [answer(r) for r in req] if isinstance(req, list) else answer(req)
+            body = json.dumps(resp).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _legacy_eth_call(rpc_url: str, to: str, data: str) -> str | None:
+    """The per-call urllib pattern the checkers used before this module."""
+    from urllib.request import Request, urlopen
+
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_call", "params": [{"to": to, "data": data}, "latest"]}
+    req = Request(
+        rpc_url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urlopen(req, timeout=30) as resp:
+        body = json.loads(resp.read().decode("utf-8"))
+    return body.get("result")
+
+
+def run_benchmark(n_calls: int, latency_ms: float) -> None:
+    server, url = _start_stand_in_server(latency_ms / 1000)
+    calls = [("0x" + f"{i:040x}", "0x8da5cb5b") for i in range(n_calls)]
+    print(f"Stand-in RPC at {url}: {n_calls} eth_call, {latency_ms:g} ms per HTTP request")
+    try:
+        t0 = time.perf_counter()
+        for to, data in calls:
+            _legacy_eth_call(url, to, data)
+        legacy = time.perf_counter() - t0
+
+        client = RpcClient(url)
+        t0 = time.perf_counter()
+        for to, data in calls:
+            client.eth_call(to, data)
+        pooled = time.perf_counter() - t0
+        pooled_requests = client.http_requests
+        client.close()
+
+        client = RpcClient(url)
+        t0 = time.perf_counter()
+        results = client.eth_call_many(calls)
+        batched = time.perf_counter() - t0
+        batched_requests = client.http_requests
+        client.close()
+        assert all(r is not None for r, _ in results)
+    finally:
+        server.shutdown()
+
+    print(f"  urllib, new connection per call: {legacy:8.3f}s  ({n_calls} HTTP requests)")
+    print(f"  pooled keep-alive, one per call: {pooled:8.3f}s  ({pooled_requests} HTTP requests)")
+    print(f"  pooled keep-alive, batched:      {batched:8.3f}s  ({batched_requests} HTTP requests)")
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Shared JSON-RPC client; run with --benchmark to compare against urllib.")
+    p.add_argument("--benchmark", action="store_true", help="Benchmark against a local stand-in RPC server.")
+    p.add_argument("--calls", type=int, default=300, help="Number of eth_call in the benchmark. Default: 300.")
+    p.add_argument(
+        "--latency-ms", type=float, default=5.0, help="Simulated server latency per HTTP request. Default: 5."
+    )
+    args = p.parse_args()
+    if not args.benchmark:
+        p.print_help()
+        return 0
+    run_benchmark(args.calls, args.latency_ms)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Factory / implementation audit of every SiloConfig in silo-core/deploy/silo/_siloDeployments.json.
+
+For each SiloConfig: silo0, silo1 (getSilos()), the factory of silo0 (factory()) and the
+implementation behind silo0 (scripts/proxy_resolver.py: ERC-1167 clone or EIP-1967 proxy),
+so we can check what version was deployed. Per chain this is three round trips regardless
+of the number of markets (plus one storage batch if some silo0 is not a clone):
+
+  1. getSilos() of all configs   - Multicall3.aggregate3 (plain eth_calls if unavailable)
+  2. factory() of all silo0s     - Multicall3.aggregate3
+  3. eth_getCode of all silo0s   - one JSON-RPC batch, classified once per distinct code
+
+Chains run concurrently over the shared pooled client (scripts/rpc_client.py).
+Per-chain tables are followed by a summary of distinct (factory, implementation) pairs.
+
+Usage:
+
+  # every chain in _siloDeployments.json (RPC_* env vars as for the deployment checkers)
+  python3 scripts/silo_config_analyzer.py
+
+  # some chains
+  python3 scripts/silo_config_analyzer.py --chain avalanche,sonic
+
+Avalanche falls back to the public RPC when RPC_AVALANCHE is not set; other chains
+without an RPC URL are skipped.
+
+Exit code: 0 all configs resolved, 1 some configs failed, 2 config/RPC error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+from abi_codec import AbiDecodeError, decode_address, decode_hex
+from check_deployments_owner_is_dao import CHAIN_DISPLAY_NAMES, CHAIN_TO_RPC_ENV
+from multicall3 import aggregate3
+from proxy_resolver import NO_CODE, UNKNOWN, ProxyInfo, get_resolver
+from rpc_client import DEFAULT_MAX_CONNECTIONS, RpcClient, get_client
+
+SILO_DEPLOYMENTS_FILE = "silo-core/deploy/silo/_siloDeployments.json"
+
+# Public RPCs used when the chain's RPC env var is not set
+DEFAULT_PUBLIC_RPC: dict[str, str] = {
+    "avalanche": "https://api.avax.network/ext/bc/C/rpc",
+}
+
+# getSilos() / factory() selectors
+GET_SILOS_SELECTOR = "0xaecc90cb"
+FACTORY_SELECTOR = "0xc45a0155"
+
+ZERO_ADDRESS = "0x" + "0" * 40
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Print factory and implementation of every SiloConfig, for all chains.")
+    p.add_argument(
+        "--chain",
+        default="all",
+        help="Comma-separated chain names from _siloDeployments.json, or 'all'. Default: all.",
+    )
+    p.add_argument(
+        "--rpc-url",
+        default=None,
+        help="RPC URL (only with a single --chain). If not set, uses env from CHAIN_TO_RPC_ENV.",
+    )
+    p.add_argument(
+        "--max-rpc-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help=f"Max in-flight requests per RPC URL. Default: {DEFAULT_MAX_CONNECTIONS}.",
+    )
+    return p.parse_args()
+
+
+def load_silo_deployments(repo_root: Path) -> dict[str, dict[str, str]]:
+    """chain -> {SiloConfig name: address} from _siloDeployments.json."""
+    path = repo_root / SILO_DEPLOYMENTS_FILE
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {chain: dict(configs) for chain, configs in data.items() if isinstance(configs, dict)}
+
+
+def decode_silos(ok: bool, data: str) -> tuple[str, str] | None:
+    """(silo0, silo1) of a getSilos() aggregate3 result; None if the call failed, data is malformed or a silo is zero."""
+    if not ok:
+        return None
+    try:
+        silo0, silo1 = decode_hex(["address", "address"], data)
+    except AbiDecodeError:
+        return None
+    if ZERO_ADDRESS in (silo0, silo1):
+        return None
+    return silo0, silo1
+
+
+def implementation_label(info: ProxyInfo) -> str:
+    """Implementation address of a resolved silo0; NO_CODE / NO_IMPL / ERROR otherwise."""
+    if info.kind == UNKNOWN:
+        return "ERROR"
+    if info.kind == NO_CODE:
+        return "NO_CODE"
+    return info.implementation or "NO_IMPL"
+
+
+def analyze_chain(client: RpcClient, configs: dict[str, str]) -> list[tuple[str, str, str, str, str, str]]:
+    """(name, config, silo0, silo1, factory, implementation) per config; "" where getSilos failed."""
+    names = list(configs)
+    silos = aggregate3(client, [(configs[name], GET_SILOS_SELECTOR) for name in names])
+
+    rows: list[tuple[str, str, str, str, str, str]] = []
+    resolved: list[int] = []
+    for i, (name, (ok, data)) in enumerate(zip(names, silos)):
+        pair = decode_silos(ok, data)
+        if pair:
+            resolved.append(i)
+        silo0, silo1 = pair or ("", "")
+        rows.append((name, configs[name], silo0, silo1, "", ""))
+
+    if not resolved:
+        return rows
+
+    silo0s = [rows[i][2] for i in resolved]
+    factories = aggregate3(client, [(silo0, FACTORY_SELECTOR) for silo0 in silo0s])
+    proxies = get_resolver(client).resolve_many(silo0s)
+    for i, (ok, data) in zip(resolved, factories):
+        factory = (decode_address(data) or "ERROR") if ok else "ERROR"
+        name, config, silo0, silo1, _, _ = rows[i]
+        rows[i] = (name, config, silo0, silo1, factory, implementation_label(proxies[silo0]))
+    return rows
+
+
+def run_chain(
+    chain: str, configs: dict[str, str], rpc_url: str, max_rpc_concurrency: int, out: TextIO
+) -> tuple[int, list[tuple[str, str, str, str, str, str]]]:
+    """Analyze one chain, printing its table to out. Returns (exit code, rows)."""
+    client = get_client(rpc_url, max_connections=max_rpc_concurrency)
+    _block, err = client.call("eth_blockNumber", [])
+    if err is not None:
+        print(f"RPC error: {err}", file=out)
+        return 2, []
+
+    rows = analyze_chain(client, configs)
+    print(f"{'SiloConfig Name':<45} {'SiloConfig Address':<42} {'Silo0 Address':<42} {'Factory Address':<42} {'Implementation':<42}", file=out)
+    print("-" * 217, file=out)
+    failed = 0
+    for name, config, silo0, silo1, factory, implementation in rows:
+        if silo0 and silo1:
+            print(f"{name:<45} {config:<42} {silo0:<42} {factory:<42} {implementation:<42}", file=out)
+        else:
+            print(f"{name:<45} {config:<42} {'ERROR':<42} {'ERROR':<42} {'ERROR':<42}", file=out)
+            failed += 1
+    print("-" * 217, file=out)
+    print(f"Total SiloConfigs processed: {len(rows)}", file=out)
+    print(f"Successful calls: {len(rows) - failed}", file=out)
+    print(f"Failed calls: {failed}", file=out)
+    if client.http_requests:
+        print(f"HTTP requests: {client.http_requests}", file=out)
+    return (1 if failed else 0), rows
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(__file__).resolve().parents[1]
+    try:
+        deployments = load_silo_deployments(repo_root)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error loading {SILO_DEPLOYMENTS_FILE}: {e}", file=sys.stderr)
+        return 2
+
+    if args.chain.strip().lower() == "all":
+        chains = sorted(deployments)
+    else:
+        chains = [c.strip() for c in args.chain.split(",") if c.strip()]
+        unknown = [c for c in chains if c not in deployments]
+        if unknown:
+            print(f"Unknown chain(s): {unknown}. Allowed: {sorted(deployments)}", file=sys.stderr)
+            return 2
+    if args.rpc_url and len(chains) != 1:
+        print("--rpc-url needs exactly one --chain", file=sys.stderr)
+        return 2
+
+    explicit = args.chain.strip().lower() != "all"
+    rpc_urls: dict[str, str] = {}
+    exit_code = 0
+    for chain in chains:
+        rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+        rpc_url = args.rpc_url or (os.environ.get(rpc_env) if rpc_env else None) or DEFAULT_PUBLIC_RPC.get(chain)
+        if rpc_url:
+            rpc_urls[chain] = rpc_url
+        elif explicit:
+            print(f"[FAIL] {chain}: RPC URL not set. Set env {rpc_env or 'RPC_<chain>'}", file=sys.stderr)
+            exit_code = 2
+        else:
+            print(f"[skip] {chain}: RPC URL not set (env {rpc_env or 'RPC_<chain>'})", file=sys.stderr)
+
+    outputs: dict[str, tuple[int, str, list]] = {}
+
+    def run_one(chain: str) -> tuple[int, str, list]:
+        out = io.StringIO()
+        try:
+            code, rows = run_chain(chain, deployments[chain], rpc_urls[chain], args.max_rpc_concurrency, out)
+        except Exception as e:  # one broken chain must not hide the others
+            print(f"crashed: {type(e).__name__}: {e}", file=out)
+            code, rows = 2, []
+        return code, out.getvalue(), rows
+
+    if rpc_urls:
+        with ThreadPoolExecutor(max_workers=len(rpc_urls), thread_name_prefix="chain") as pool:
+            outputs = dict(zip(rpc_urls, pool.map(run_one, list(rpc_urls))))
+
+    pairs: Counter[tuple[str, str, str]] = Counter()
+    for chain in rpc_urls:
+        code, output, rows = outputs[chain]
+        exit_code = max(exit_code, code)
+        print("=" * 217)
+        print(f"{CHAIN_DISPLAY_NAMES.get(chain, chain).upper()} SILO CONFIG ANALYSIS")
+        print("=" * 217)
+        print(output.rstrip("\n"))
+        print()
+        for _name, _config, silo0, _silo1, factory, implementation in rows:
+            if silo0:
+                pairs[(chain, factory, implementation)] += 1
+
+    if pairs:
+        print("Summary (configs per factory / implementation):")
+        print(f"  {'chain':<14} {'factory':<42} {'implementation':<42} {'configs':>7}")
+        for (chain, factory, implementation), count in sorted(pairs.items()):
+            print(f"  {CHAIN_DISPLAY_NAMES.get(chain, chain):<14} {factory:<42} {implementation:<42} {count:>7}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
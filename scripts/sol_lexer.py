@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Comment- and string-aware Solidity tokenizer, and the one-pass source scan the version
+checks share (stdlib only).
+
+scan_source() walks the token stream once and collects:
+  - VERSION                 function VERSION() { return "X 1.2.3"; } / { version = "X 1.2.3"; }
+                            or VERSION = "X 1.2.3"; (in that order of preference)
+  - ORACLE_IMPLEMENTATION   type of `X public immutable ORACLE_IMPLEMENTATION`
+  - new X(                  every contract created with `new`, and the one passed to the
+                            OracleFactory constructor as OracleFactory(address(new X(...)))
+
+Text inside comments and string literals never matches, a VERSION() function body is
+delimited by counting braces outside of them, and no pattern can backtrack: the tokenizer
+is a single alternation of linear token regexes.
+
+Usage from a script:
+
+  from sol_lexer import scan_file
+
+  facts = scan_file(path)         # SourceFacts; all None/empty when the file is unreadable
+  facts.version, facts.oracle_implementation, facts.new_contracts
+
+  python3 scripts/sol_lexer.py silo-core/contracts/Silo.sol
+  python3 scripts/sol_lexer.py --benchmark
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+# Token kinds
+IDENT = "ident"
+STRING = "string"
+NUMBER = "number"
+PUNCT = "punct"
+
+# Whitespace and comments are consumed in front of each token, so every match is a token.
+_TOKEN_RE = re.compile(
+    r"""
+    (?:\s+|//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/)?)*
+    (?:
+    (?:unicode|hex)?(?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+  | (?P<ident>[A-Za-z_$][A-Za-z0-9_$]*)
+  | (?P<number>[0-9][0-9A-Za-z_.]*)
+  | (?P<punct>.)
+  | (?P<end>$)
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Keywords that may sit between a state variable's type and its name
+_DECLARATION_KEYWORDS = frozenset({"public", "internal", "private", "immutable", "constant", "override"})
+
+DEFAULT_BENCHMARK_ROOTS = ("silo-core/contracts", "silo-oracles/contracts", "silo-vaults/contracts")
+
+
+@dataclass
+class SourceFacts:
+    version_return: str | None = None
+    version_assign: str | None = None
+    version_constant: str | None = None
+    oracle_implementation_type: str | None = None
+    oracle_factory_implementation: str | None = None
+    new_contracts: list[str] = field(default_factory=list)
+
+    @property
+    def version(self) -> str | None:
+        """VERSION string: returned by function VERSION(), assigned in it, or the VERSION constant."""
+        return self.version_return or self.version_assign or self.version_constant
+
+    @property
+    def oracle_implementation(self) -> str | None:
+        """Oracle implementation contract of an OracleFactory: the `new X(` it passes, else the declared type."""
+        if self.oracle_factory_implementation:
+            return self.oracle_factory_implementation
+        if self.oracle_implementation_type and self.oracle_implementation_type != "address":
+            return self.oracle_implementation_type
+        return None
+
+
+def tokenize(text: str) -> Iterator[tuple[str, str]]:
+    """(kind, value) of every token outside comments; string values are unquoted."""
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "end":
+            return
+        if kind == STRING:
+            raw = m.group(STRING)
+            end = -1 if len(raw) > 1 and raw[-1] == raw[0] else None
+            yield STRING, raw[1:end]
+        else:
+            yield kind, m.group(kind)
+
+
+def scan_source(text: str) -> SourceFacts:
+    """Collect SourceFacts in one pass over the tokens of text."""
+    facts = SourceFacts()
+    window: deque[tuple[str, str]] = deque([(PUNCT, "")] * 6, maxlen=6)  # last significant tokens
+    depth = 0
+    version_fn_depth = None  # brace depth of the open VERSION() body
+    in_version_header = False
+
+    for token in tokenize(text):
+        kind, value = token
+        if kind == PUNCT:
+            if value == "{":
+                depth += 1
+                if in_version_header:
+                    in_version_header = False
+                    version_fn_depth = depth
+            elif value == "}":
+                if version_fn_depth == depth:
+                    version_fn_depth = None
+                depth -= 1
+            elif value == ";":
+                in_version_header = False  # interface declaration, no body
+                if window[-1][0] == STRING:
+                    literal = window[-1][1].strip()
+                    before = window[-2]
+                    if version_fn_depth is not None and before == (IDENT, "return"):
+                        facts.version_return = facts.version_return or literal
+                    elif before == (PUNCT, "="):
+                        if version_fn_depth is not None:
+                            facts.version_assign = facts.version_assign or literal
+                        if window[-3] == (IDENT, "VERSION"):
+                            facts.version_constant = facts.version_constant or literal
+            elif value == "(" and window[-1][0] == IDENT and window[-2] == (IDENT, "new"):
+                name = window[-1][1]
+                facts.new_contracts.append(name)
+                if [t[1] for t in list(window)[:4]] == ["OracleFactory", "(", "address", "("]:
+                    facts.oracle_factory_implementation = facts.oracle_factory_implementation or name
+        elif kind == IDENT:
+            if value == "VERSION" and window[-1] == (IDENT, "function"):
+                in_version_header = True
+            elif value == "ORACLE_IMPLEMENTATION" and facts.oracle_implementation_type is None:
+                i = len(window) - 1
+                while i > 0 and window[i][0] == IDENT and window[i][1] in _DECLARATION_KEYWORDS:
+                    i -= 1
+                if i < len(window) - 1 and window[i][0] == IDENT:
+                    facts.oracle_implementation_type = window[i][1]
+        window.append(token)
+    return facts
+
+
+def scan_file(path: Path) -> SourceFacts:
+    """scan_source of a .sol file; empty SourceFacts if it cannot be read."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return SourceFacts()
+    return scan_source(text)
+
+
+def benchmark(repo_root: Path, roots: list[str]) -> None:
+    """Time scan_source over every .sol under roots (files are read before timing)."""
+    sources = [(p, p.read_text(encoding="utf-8")) for root in roots for p in sorted((repo_root / root).rglob("*.sol"))]
+    size = sum(len(text) for _p, text in sources)
+    started = time.perf_counter()
+    results = [scan_source(text) for _p, text in sources]
+    elapsed = time.perf_counter() - started
+    versions = sum(1 for f in results if f.version)
+    creations = sum(len(f.new_contracts) for f in results)
+    print(f"{len(sources)} files, {size / 2**20:.2f} MB under {', '.join(roots)}")
+    print(f"scan: {elapsed * 1000:.0f} ms ({size / 2**20 / elapsed:.1f} MB/s), {versions} VERSION, {creations} `new X(`")
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Extract VERSION / ORACLE_IMPLEMENTATION / `new X(` from Solidity sources.")
+    p.add_argument("files", nargs="*", help="Solidity files to scan.")
+    p.add_argument("--benchmark", action="store_true", help=f"Time the scan over {', '.join(DEFAULT_BENCHMARK_ROOTS)}.")
+    args = p.parse_args()
+    repo_root = Path(__file__).resolve().parents[1]
+    if args.benchmark:
+        benchmark(repo_root, list(DEFAULT_BENCHMARK_ROOTS))
+        return 0
+    if not args.files:
+        print("Nothing to scan: pass .sol files or --benchmark", file=sys.stderr)
+        return 2
+    for name in args.files:
+        facts = scan_file(Path(name))
+        print(
+            f"{name}: version={facts.version!r} oracle_implementation={facts.oracle_implementation!r} "
+            f"new={facts.new_contracts}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
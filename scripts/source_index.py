@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Name -> source index of the Solidity contracts of every component (stdlib only).
+
+The version checks look up ContractName.sol for each deployed contract and read its VERSION.
+Walking the contracts tree once per lookup makes that O(deployments x files); this module
+walks it once and keeps, per .sol file under <component>/contracts:
+
+  component, name (file stem), path, sha256 of the content, VERSION and oracle implementation
+  (see scripts/sol_lexer.py)
+
+The index is persisted to .cache/source-index.json keyed by each file's mtime and size, like
+deployment_index.py. On load only new or changed files are read again; a changed file whose
+content hash is unchanged (touched, checked out again) is not rescanned.
+
+Usage:
+
+  sources = load_source_index(repo_root)
+  src = sources.find("core", "SiloFactory")            # SourceFile or None
+  src.version, src.path, src.sha256
+  sources.version("oracle", "DIAOracle")
+
+  # rebuild / inspect from the command line
+  python3 scripts/source_index.py --rebuild
+  python3 scripts/source_index.py --component oracle
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from deployment_index import COMPONENT_DIRS
+from json_cache import load_json_cache, save_json_cache
+from sol_lexer import scan_source
+
+INDEX_FILE_NAME = "source-index.json"
+# Bump when the record layout or sol_lexer extraction rules change; older index files are rebuilt.
+INDEX_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    component: str
+    name: str  # file stem, e.g. "SiloFactory"
+    path: str  # relative to repo root
+    sha256: str
+    version: str | None
+    oracle_implementation: str | None
+
+
+class SourceIndex:
+    def __init__(self, repo_root: Path, files: list[SourceFile]) -> None:
+        self.repo_root = repo_root
+        self._files = files
+        self._by_name: dict[tuple[str, str], list[SourceFile]] = {}
+        for f in files:
+            self._by_name.setdefault((f.component, f.name), []).append(f)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def all_files(self) -> list[SourceFile]:
+        return list(self._files)
+
+    def find_all(self, component: str, name: str) -> list[SourceFile]:
+        """Every <name>.sol of component, in path order."""
+        return list(self._by_name.get((component, name), ()))
+
+    def find(self, component: str, name: str) -> SourceFile | None:
+        """First <name>.sol of component (path order), None if there is none."""
+        found = self._by_name.get((component, name))
+        return found[0] if found else None
+
+    def version(self, component: str, name: str) -> str | None:
+        """VERSION of <name>.sol in component, None if the file or its VERSION is missing."""
+        src = self.find(component, name)
+        return src.version if src else None
+
+    def absolute_path(self, src: SourceFile) -> Path:
+        return self.repo_root / src.path
+
+
+def _source_files(repo_root: Path) -> list[tuple[str, Path]]:
+    """(component, path) of every .sol under <component>/contracts, sorted by path."""
+    out: list[tuple[str, Path]] = []
+    for component, directory in COMPONENT_DIRS.items():
+        root = repo_root / directory / "contracts"
+        if root.is_dir():
+            out.extend((component, p) for p in sorted(root.rglob("*.sol")))
+    return out
+
+
+def _load_cached_files(cache_path: Path) -> dict[str, Any]:
+    files = load_json_cache(cache_path, INDEX_FORMAT_VERSION).get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def build_source_index(repo_root: Path, cache_path: Path | None) -> tuple[SourceIndex, int]:
+    """Build the index, reusing cached entries of unchanged files. Returns (index, files_scanned)."""
+    cached = _load_cached_files(cache_path) if cache_path else {}
+    files: dict[str, Any] = {}
+    scanned = 0
+    read = 0
+    sources: list[SourceFile] = []
+
+    for component, path in _source_files(repo_root):
+        rel = path.relative_to(repo_root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        prev = cached.get(rel)
+        if prev and prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+            entry = prev
+        else:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            read += 1
+            sha256 = hashlib.sha256(data).hexdigest()
+            if prev and prev.get("sha256") == sha256:
+                entry = dict(prev)
+            else:
+                facts = scan_source(data.decode("utf-8", errors="replace"))
+                entry = {"sha256": sha256, "version": facts.version, "oracle_implementation": facts.oracle_implementation}
+                scanned += 1
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        files[rel] = entry
+        sources.append(
+            SourceFile(
+                component=component,
+                name=path.stem,
+                path=rel,
+                sha256=entry["sha256"],
+                version=entry["version"],
+                oracle_implementation=entry["oracle_implementation"],
+            )
+        )
+
+    if cache_path and (read or files.keys() != cached.keys()):
+        save_json_cache(cache_path, INDEX_FORMAT_VERSION, {"files": files}, "source index")
+    return SourceIndex(repo_root, sources), scanned
+
+
+_LOADED: dict[Path, SourceIndex] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+def default_cache_path(repo_root: Path) -> Path:
+    return repo_root / ".cache" / INDEX_FILE_NAME
+
+
+def load_source_index(repo_root: Path, *, use_cache: bool = True) -> SourceIndex:
+    """Index for repo_root, built once per process (thread-safe) and persisted between runs."""
+    repo_root = repo_root.resolve()
+    with _LOAD_LOCK:
+        index = _LOADED.get(repo_root)
+        if index is None:
+            index, _scanned = build_source_index(repo_root, default_cache_path(repo_root) if use_cache else None)
+            _LOADED[repo_root] = index
+        return index
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Build or inspect the Solidity source index.")
+    p.add_argument("--rebuild", action="store_true", help="Ignore the persisted index and scan every file.")
+    p.add_argument("--component", choices=sorted(COMPONENT_DIRS), help="Print the versioned sources of this component.")
+    args = p.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    cache_path = default_cache_path(repo_root)
+    if args.rebuild:
+        cache_path.unlink(missing_ok=True)
+
+    t0 = time.perf_counter()
+    index, scanned = build_source_index(repo_root, cache_path)
+    elapsed = time.perf_counter() - t0
+    versioned = sum(1 for f in index.all_files() if f.version)
+    print(
+        f"Index: {len(index)} sources, {versioned} with VERSION, {scanned} files scanned, "
+        f"{elapsed * 1000:.0f} ms ({cache_path.relative_to(repo_root)})"
+    )
+    if args.component:
+        for f in index.all_files():
+            if f.component == args.component and f.version:
+                print(f"  {f.name:<45} {f.version:<45} {f.sha256[:12]}  {f.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
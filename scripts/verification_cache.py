@@ -0,0 +1,61 @@
+"""
+Persistent cache of positive explorer verification results (stdlib sqlite3).
+
+Once a contract is verified on an explorer it stays verified, so the explorer checker
+only needs to query addresses it has not seen verified before. Entries are keyed by
+(explorer API URL, address, bytecode hash) and expire after a TTL, so every contract
+is still re-checked now and then. Negative results are never cached.
+
+Default location: <repo>/.cache/explorer-verification.sqlite (gitignored; CI keeps it
+between runs with actions/cache).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_TTL_DAYS = 30
+CACHE_FILE_NAME = "explorer-verification.sqlite"
+
+
+class VerificationCache:
+    """(explorer, address, bytecode_hash) -> verified_at; only positive results are stored."""
+
+    def __init__(self, path: Path, ttl_seconds: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verified ("
+            " explorer TEXT NOT NULL,"
+            " address TEXT NOT NULL,"
+            " bytecode_hash TEXT NOT NULL,"
+            " verified_at REAL NOT NULL,"
+            " PRIMARY KEY (explorer, address, bytecode_hash))"
+        )
+        self.hits = 0
+
+    def is_verified(self, explorer: str, address: str, bytecode_hash: str) -> bool:
+        row = self._db.execute(
+            "SELECT verified_at FROM verified WHERE explorer = ? AND address = ? AND bytecode_hash = ?",
+            (explorer, address.lower(), bytecode_hash),
+        ).fetchone()
+        if row is None or time.time() - row[0] > self.ttl_seconds:
+            return False
+        self.hits += 1
+        return True
+
+    def mark_verified(self, explorer: str, address: str, bytecode_hash: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO verified (explorer, address, bytecode_hash, verified_at) VALUES (?, ?, ?, ?)",
+            (explorer, address.lower(), bytecode_hash, time.time()),
+        )
+
+    def close(self) -> None:
+        """Drop expired rows and commit."""
+        self._db.execute("DELETE FROM verified WHERE verified_at < ?", (time.time() - self.ttl_seconds,))
+        self._db.commit()
+        self._db.close()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Persistent git blob hash -> VERSION cache for check-version-constants.py --incremental (stdlib only).
+
+A blob hash names file content, so the VERSION parsed from a blob (scripts/sol_lexer.py)
+never changes and is stored forever. Changed files come from one `git diff --raw`, which
+already carries each file's new blob hash; only blobs not seen before are read, all of them
+through one `git cat-file --batch`. The VERSION map of a tag (path -> VERSION of every
+contracts/*.sol at that tag) is computed once per tag from `git ls-tree` and kept too.
+
+Default location: <repo>/.cache/version-constants.json (gitignored; CI can keep it between
+runs with actions/cache).
+
+  cache = VersionCache(default_cache_path(repo_root))
+  changed = diff_raw(["origin/master...HEAD"])          # [(path, blob)] or None
+  versions = cache.versions(dict(changed).values())     # {blob: VERSION or None}
+  previous = cache.tag_versions("v4.1.0")               # {path: VERSION or None}
+  cache.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import subprocess
+from pathlib import Path
+
+from json_cache import load_json_cache, save_json_cache
+from sol_lexer import scan_source
+
+CACHE_FILE_NAME = "version-constants.json"
+# Bump when sol_lexer extraction rules change; older cache files are dropped.
+CACHE_FORMAT_VERSION = 1
+
+ZERO_BLOB = "0" * 40
+
+
+def default_cache_path(repo_root: Path) -> Path:
+    return repo_root / ".cache" / CACHE_FILE_NAME
+
+
+def git_blob_hash(data: bytes) -> str:
+    """Blob id git gives data (`git hash-object`), computed without spawning git."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def is_contract_source(path: str) -> bool:
+    return path.endswith(".sol") and "/contracts/" in path
+
+
+def _git(args: list[str], stdin: bytes | None = None) -> bytes | None:
+    try:
+        result = subprocess.run(["git", *args], input=stdin, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def diff_raw(ranges: list[str]) -> list[tuple[str, str]] | None:
+    """
+    (path, new blob) of added/modified contract sources for the first range git can diff with a
+    non-empty result. The blob is ZERO_BLOB for files diffed against the working tree.
+    None if no range worked.
+    """
+    for diff_range in ranges:
+        out = _git(["diff", "--raw", "-z", "--no-abbrev", "--diff-filter=AM", diff_range])
+        if not out:
+            continue
+        fields = out.decode("utf-8", errors="replace").split("\0")
+        changed: list[tuple[str, str]] = []
+        # -z --raw: ":<old mode> <new mode> <old blob> <new blob> <status>" NUL "<path>" NUL
+        for meta, path in zip(fields[0::2], fields[1::2]):
+            parts = meta.split()
+            if len(parts) >= 5 and is_contract_source(path):
+                changed.append((path, parts[3]))
+        return changed
+    return None
+
+
+def read_blobs(blobs: list[str]) -> dict[str, bytes]:
+    """Content of every blob, read with one `git cat-file --batch`."""
+    if not blobs:
+        return {}
+    out = _git(["cat-file", "--batch"], stdin="".join(f"{b}\n" for b in blobs).encode("ascii"))
+    contents: dict[str, bytes] = {}
+    pos = 0
+    while out and pos < len(out):
+        eol = out.index(b"\n", pos)
+        header = out[pos:eol].split()
+        pos = eol + 1
+        if len(header) < 3 or header[1] == b"missing":
+            continue
+        size = int(header[2])
+        contents[header[0].decode("ascii")] = out[pos : pos + size]
+        pos += size + 1  # content is followed by a newline
+    return contents
+
+
+class VersionCache:
+    """blob -> VERSION (None: no VERSION) and tag -> {path: blob}, persisted as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._blobs: dict[str, str | None] = {}
+        self._tags: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        raw = load_json_cache(path, CACHE_FORMAT_VERSION)
+        self._blobs = raw.get("blobs") or {}
+        self._tags = raw.get("tags") or {}
+
+    def add_content(self, data: bytes) -> str:
+        """Blob id of data, with its VERSION cached (for working-tree files with no blob yet)."""
+        blob = git_blob_hash(data)
+        if blob not in self._blobs:
+            self._blobs[blob] = scan_source(data.decode("utf-8", errors="replace")).version
+            self._dirty = True
+        return blob
+
+    def versions(self, blobs) -> dict[str, str | None]:
+        """{blob: VERSION or None}; blobs never seen before are read in one git call, unreadable ones left out."""
+        wanted = list(dict.fromkeys(blobs))
+        missing = [b for b in wanted if b not in self._blobs]
+        self.hits += len(wanted) - len(missing)
+        self.misses += len(missing)
+        for blob, data in read_blobs(missing).items():
+            self._blobs[blob] = scan_source(data.decode("utf-8", errors="replace")).version
+            self._dirty = True
+        return {b: self._blobs[b] for b in wanted if b in self._blobs}
+
+    def tag_versions(self, tag: str) -> dict[str, str | None]:
+        """{path: VERSION or None} of every contract source at tag (listed once per tag)."""
+        tree = self._tags.get(tag)
+        if tree is None:
+            out = _git(["ls-tree", "-r", "-z", "--full-tree", tag])
+            if out is None:
+                return {}
+            tree = {}
+            # "<mode> blob <blob>" TAB "<path>" NUL
+            for line in out.decode("utf-8", errors="replace").split("\0"):
+                meta, _tab, path = line.partition("\t")
+                parts = meta.split()
+                if len(parts) == 3 and parts[1] == "blob" and is_contract_source(path):
+                    tree[path] = parts[2]
+            self._tags[tag] = tree
+            self._dirty = True
+        versions = self.versions(tree.values())
+        return {path: versions.get(blob) for path, blob in tree.items()}
+
+    def save(self) -> None:
+        if self._dirty:
+            save_json_cache(self.path, CACHE_FORMAT_VERSION, {"blobs": self._blobs, "tags": self._tags}, "version cache")
+            self._dirty = False
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+VERSION matrix of every versioned contract x every chain: source VERSION, deployed address
+and the version the deployment returns on-chain, in one run.
+
+Rows are (component, contract) pairs that have a VERSION in the repo (scripts/source_index.py)
+and a deployment on at least one chain (scripts/deployment_index.py). Each chain is read in
+its own thread: all of its addresses go through SiloLens.getVersions(address[]) in chunked,
+JSON-RPC batched calls (get_versions_on_chain of check_deployments_version_on_chain.py), so
+wall time is roughly the slowest chain. Chains without an RPC URL are left unchecked.
+
+Cell status: ok, drift (on-chain differs from source), read_failed, unchecked (no RPC or
+--dry-run) or absent (not deployed on that chain). Contracts reached only through factory
+getters (DynamicKinkModel via IRM(), oracle implementations, SiloDeployer immutables) are not
+rows; check_deployments_version_on_chain.py covers those per chain.
+
+Usage:
+
+  # all chains with RPC_* set, Markdown to stdout
+  python3 scripts/version_matrix.py
+
+  # compact JSON for tooling, subset of chains
+  python3 scripts/version_matrix.py --chain mainnet,sonic --format json --output versions.json
+
+  # sources and addresses only
+  python3 scripts/version_matrix.py --dry-run
+
+Exit code: 0 no drift, 1 some cell drifted or could not be read, 2 config error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from check_deployments_on_all_chains import parse_list
+from check_deployments_owner_is_dao import CHAIN_DISPLAY_NAMES
+from check_deployments_version_on_chain import (
+    CHAIN_TO_RPC_ENV,
+    COMPONENT_PATHS,
+    DEFAULT_MAX_VERSIONS_PER_CALL,
+    get_silo_lens_address,
+    get_versions_on_chain,
+)
+from deployment_index import load_index
+from rpc_client import DEFAULT_MAX_CONNECTIONS, get_client
+from source_index import load_source_index
+
+OK = "ok"
+DRIFT = "drift"
+READ_FAILED = "read_failed"
+UNCHECKED = "unchecked"
+ABSENT = "absent"
+
+# Markdown cell for each status; drifted cells show the on-chain version instead
+_MARKDOWN_MARKS = {OK: "ok", READ_FAILED: "?", UNCHECKED: "·", ABSENT: ""}
+
+
+@dataclass
+class Cell:
+    address: str
+    on_chain: str | None = None
+    status: str = UNCHECKED
+
+
+@dataclass
+class Row:
+    component: str
+    name: str
+    source_version: str
+    cells: dict[str, Cell] = field(default_factory=dict)  # chain -> deployment, absent chains left out
+
+    def status(self, chain: str) -> str:
+        cell = self.cells.get(chain)
+        return cell.status if cell else ABSENT
+
+
+@dataclass
+class ChainResult:
+    checked: bool
+    note: str = ""  # why the chain was not checked, or its wall time
+    seconds: float = 0.0
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Matrix of source VERSION vs on-chain version for every contract and chain.")
+    p.add_argument(
+        "--chain",
+        default="all",
+        help="Comma-separated chain names, or 'all' for every chain in CHAIN_TO_RPC_ENV. Default: all.",
+    )
+    p.add_argument("--components", default="core,oracle,vaults", help="Comma-separated: core, oracle, vaults.")
+    p.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format. Default: markdown.")
+    p.add_argument("--output", default=None, help="Write the matrix to this file instead of stdout.")
+    p.add_argument("--dry-run", action="store_true", help="Only sources and deployed addresses, no RPC.")
+    p.add_argument(
+        "--max-versions-per-call",
+        type=int,
+        default=DEFAULT_MAX_VERSIONS_PER_CALL,
+        help=f"Max addresses per SiloLens.getVersions call. Default: {DEFAULT_MAX_VERSIONS_PER_CALL}.",
+    )
+    p.add_argument(
+        "--max-rpc-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help=f"Max in-flight requests per RPC URL. Default: {DEFAULT_MAX_CONNECTIONS}.",
+    )
+    return p.parse_args()
+
+
+def build_rows(repo_root: Path, chains: list[str], components: list[str]) -> list[Row]:
+    """Rows of every versioned contract deployed on at least one of chains, sorted by (component, name)."""
+    deployments = load_index(repo_root)
+    sources = load_source_index(repo_root)
+    rows: dict[tuple[str, str], Row] = {}
+    for chain in chains:
+        for d in deployments.deployments(chain, components):
+            row = rows.get((d.component, d.name))
+            if row is None:
+                version = sources.version(d.component, d.name)
+                if version is None:
+                    continue
+                row = rows[(d.component, d.name)] = Row(d.component, d.name, version)
+            row.cells[chain] = Cell(d.address)
+    rank = {c: i for i, c in enumerate(components)}
+    return sorted(rows.values(), key=lambda r: (rank[r.component], r.name))
+
+
+def read_chain(
+    repo_root: Path,
+    chain: str,
+    rows: list[Row],
+    *,
+    dry_run: bool,
+    max_per_call: int,
+    max_rpc_concurrency: int,
+) -> ChainResult:
+    """Fill the cells of chain with on-chain versions (one getVersions run for all of its addresses)."""
+    pairs = [(row, row.cells[chain]) for row in rows if chain in row.cells]
+    if dry_run or not pairs:
+        return ChainResult(checked=False, note="dry-run" if dry_run else "no deployments")
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = os.environ.get(rpc_env) if rpc_env else None
+    if not rpc_url:
+        return ChainResult(checked=False, note=f"{rpc_env or 'RPC_<chain>'} not set")
+    lens = get_silo_lens_address(repo_root, chain)
+    if not lens:
+        return ChainResult(checked=False, note="SiloLens not deployed")
+
+    started = time.perf_counter()
+    client = get_client(rpc_url, max_connections=max_rpc_concurrency)
+    log = io.StringIO()
+    versions = get_versions_on_chain(
+        client, lens, [cell.address for _row, cell in pairs], max_per_call=max_per_call, log=log
+    )
+    # Chains run concurrently: tag their getVersions diagnostics with the chain
+    for line in log.getvalue().splitlines():
+        print(f"[{chain}] {line}", file=sys.stderr)
+    # Each thread only touches the cells of its own chain
+    for (row, cell), on_chain in zip(pairs, versions):
+        cell.on_chain = on_chain
+        if on_chain is None:
+            cell.status = READ_FAILED
+        else:
+            cell.status = OK if on_chain == row.source_version else DRIFT
+    seconds = time.perf_counter() - started
+    return ChainResult(checked=True, note=f"{seconds:.2f}s", seconds=seconds)
+
+
+def _short_version(row: Row, version: str) -> str:
+    """'Silo 3.10.0' -> '3.10.0' for the Silo row; other strings are kept whole."""
+    prefix = f"{row.name} "
+    return version[len(prefix) :] if version.startswith(prefix) else version
+
+
+def render_markdown(rows: list[Row], chains: list[str], results: dict[str, ChainResult]) -> str:
+    headers = ["component", "contract", "source"] + [CHAIN_DISPLAY_NAMES.get(c, c) for c in chains]
+    lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+    for row in rows:
+        marks = []
+        for chain in chains:
+            cell = row.cells.get(chain)
+            if cell is not None and cell.status == DRIFT:
+                marks.append(f"**{_short_version(row, cell.on_chain or '')}**")
+            else:
+                marks.append(_MARKDOWN_MARKS[row.status(chain)])
+        lines.append(f"| {row.component} | {row.name} | {_short_version(row, row.source_version)} | " + " | ".join(marks) + " |")
+    lines.append("")
+    lines.append(
+        "ok: on-chain equals source, **x.y.z**: on-chain version differs, ?: read failed, "
+        "·: not checked, empty: not deployed."
+    )
+    unchecked = [f"{CHAIN_DISPLAY_NAMES.get(c, c)} ({results[c].note})" for c in chains if not results[c].checked]
+    if unchecked:
+        lines.append(f"Not checked: {', '.join(unchecked)}.")
+    return "\n".join(lines) + "\n"
+
+
+def render_json(rows: list[Row], chains: list[str], results: dict[str, ChainResult]) -> str:
+    payload = {
+        "chains": {c: {"checked": results[c].checked, "note": results[c].note} for c in chains},
+        "contracts": [
+            {
+                "component": row.component,
+                "name": row.name,
+                "source": row.source_version,
+                "chains": {
+                    chain: {"address": cell.address, "on_chain": cell.on_chain, "status": cell.status}
+                    for chain, cell in sorted(row.cells.items())
+                },
+            }
+            for row in rows
+        ],
+        "summary": summarize(rows, chains),
+    }
+    return json.dumps(payload, separators=(",", ":")) + "\n"
+
+
+def summarize(rows: list[Row], chains: list[str]) -> dict[str, int]:
+    counts = {OK: 0, DRIFT: 0, READ_FAILED: 0, UNCHECKED: 0}
+    for row in rows:
+        for chain in chains:
+            status = row.status(chain)
+            if status in counts:
+                counts[status] += 1
+    return counts
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        chains = parse_list(args.chain, sorted(CHAIN_TO_RPC_ENV.keys()), "chain(s)")
+        components = parse_list(args.components, list(COMPONENT_PATHS.keys()), "component(s)")
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    if not chains:
+        return 0
+
+    repo_root = Path(__file__).resolve().parents[1]
+    started = time.perf_counter()
+    rows = build_rows(repo_root, chains, components)
+
+    with ThreadPoolExecutor(max_workers=len(chains), thread_name_prefix="chain") as pool:
+        futures = {
+            chain: pool.submit(
+                read_chain,
+                repo_root,
+                chain,
+                rows,
+                dry_run=args.dry_run,
+                max_per_call=args.max_versions_per_call,
+                max_rpc_concurrency=args.max_rpc_concurrency,
+            )
+            for chain in chains
+        }
+        results = {chain: f.result() for chain, f in futures.items()}
+
+    if not args.dry_run and not any(r.checked for r in results.values()):
+        notes = ", ".join(f"{c}: {results[c].note}" for c in chains)
+        print(f"No chain could be checked ({notes})", file=sys.stderr)
+        return 2
+
+    render = render_json if args.format == "json" else render_markdown
+    text = render(rows, chains, results)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+    counts = summarize(rows, chains)
+    print(
+        f"{len(rows)} contracts x {len(chains)} chains: ok={counts[OK]} drift={counts[DRIFT]} "
+        f"read_failed={counts[READ_FAILED]} unchecked={counts[UNCHECKED]} "
+        f"({time.perf_counter() - started:.2f}s)",
+        file=sys.stderr,
+    )
+    return 1 if counts[DRIFT] or counts[READ_FAILED] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Off-chain model of InterestRateModelV2 (silo-core/contracts/interestRateModel/InterestRateModelV2.sol).
+
+calculate_compound_interest_rate / calculate_current_interest_rate repeat the Solidity
+arithmetic step by step on NumPy object arrays of Python ints, so results are bit-exact
+(int256 division truncating towards zero, PRBMathSD59x18.exp, the uint256 overflow guard of
+_calculateRComp, both caps) while one call evaluates a whole grid: every argument, config
+fields included, may be a scalar or an array, and they broadcast together.
+
+Checked-arithmetic reverts (SafeCast, int256 overflow) are not modelled: inputs are assumed
+to be ones the contract accepts.
+
+The reference vectors in silo-core/test/foundry/data/Rcomptest.json and Rcurtest.json come
+from a high-precision model; --validate applies the same tolerances as
+InterestRateModelV2Rcomp.t.sol / InterestRateModelV2Rcur.t.sol (25 bps for rcomp, ri and
+Tcrit, 1 bp for rcur, exact overflow flag).
+
+Usage:
+    # check against Rcomptest.json / Rcurtest.json
+    python3 irm_v2.py --validate
+
+    # vectorised vs per-case throughput
+    python3 irm_v2.py --benchmark --cases 100000
+
+    # every config of InterestRateModelConfigs.json over random utilisation paths
+    python3 irm_v2.py --sweep --paths 500 --steps 52 --step-seconds 604800
+    python3 irm_v2.py --sweep --configs defaultAsset,stableHighCap --paths 2000
+
+    # in analysis code
+    from irm_v2 import load_configs, calculate_compound_interest_rate
+    config = load_configs()['defaultAsset']
+    result = calculate_compound_interest_rate(config, deposits, borrows, t0, t1)
+    result.rcomp, result.ri, result.tcrit, result.overflow
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, NamedTuple
+
+import numpy as np
+
+SILO_CORE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+CONFIGS_FILE = os.path.join(SILO_CORE_DIR, 'deploy', 'input', 'irmConfigs', 'InterestRateModelConfigs.json')
+RCOMP_TEST_FILE = os.path.join(SILO_CORE_DIR, 'test', 'foundry', 'data', 'Rcomptest.json')
+RCUR_TEST_FILE = os.path.join(SILO_CORE_DIR, 'test', 'foundry', 'data', 'Rcurtest.json')
+
+# IInterestRateModelV2.Config
+CONFIG_FIELDS = ('uopt', 'ucrit', 'ulow', 'ki', 'kcrit', 'klow', 'klin', 'beta', 'ri', 'Tcrit')
+
+DP = 10**18
+YEAR = 365 * 24 * 3600
+RCOMP_MAX = 2**16 * DP
+X_MAX = 11090370147631773313
+UINT256_MAX = 2**256 - 1
+ASSET_DATA_OVERFLOW_LIMIT = UINT256_MAX // RCOMP_MAX
+RCOMP_CAP_PER_SECOND = 3170979198376  # _compoundInterestRateCAP
+RCUR_CAP = 10**20  # _currentInterestRateCAP
+INT112_MAX = 2**111 - 1
+INT112_MIN = -2**111
+
+# PRBMathSD59x18
+LOG2_E = 1442695040888963407
+HALF_SCALE = 5 * 10**17
+EXP_MIN = -41446531673892822322  # exp(x) == 0 below
+EXP2_MIN = -59794705707972522261  # exp2(x) == 0 below
+
+# PRBMathCommon.exp2: factor applied when bit 127 - i of the 128.128 input is set
+_EXP2_FACTORS = (
+    0x16A09E667F3BCC908B2FB1366EA957D3E,
+    0x1306FE0A31B7152DE8D5A46305C85EDED,
+    0x1172B83C7D517ADCDF7C8C50EB14A7920,
+    0x10B5586CF9890F6298B92B71842A98364,
+    0x1059B0D31585743AE7C548EB68CA417FE,
+    0x102C9A3E778060EE6F7CACA4F7A29BDE9,
+    0x10163DA9FB33356D84A66AE336DCDFA40,
+    0x100B1AFA5ABCBED6129AB13EC11DC9544,
+    0x10058C86DA1C09EA1FF19D294CF2F679C,
+    0x1002C605E2E8CEC506D21BFC89A23A011,
+    0x100162F3904051FA128BCA9C55C31E5E0,
+    0x1000B175EFFDC76BA38E31671CA939726,
+    0x100058BA01FB9F96D6CACD4B180917C3E,
+    0x10002C5CC37DA9491D0985C348C68E7B4,
+    0x1000162E525EE054754457D5995292027,
+    0x10000B17255775C040618BF4A4ADE83FD,
+    0x1000058B91B5BC9AE2EED81E9B7D4CFAC,
+    0x100002C5C89D5EC6CA4D7C8ACC017B7CA,
+    0x10000162E43F4F831060E02D839A9D16D,
+    0x100000B1721BCFC99D9F890EA06911763,
+    0x10000058B90CF1E6D97F9CA14DBCC1629,
+    0x1000002C5C863B73F016468F6BAC5CA2C,
+    0x100000162E430E5A18F6119E3C02282A6,
+    0x1000000B1721835514B86E6D96EFD1BFF,
+    0x100000058B90C0B48C6BE5DF846C5B2F0,
+    0x10000002C5C8601CC6B9E94213C72737B,
+    0x1000000162E42FFF037DF38AA2B219F07,
+    0x10000000B17217FBA9C739AA5819F44FA,
+    0x1000000058B90BFCDEE5ACD3C1CEDC824,
+    0x100000002C5C85FE31F35A6A30DA1BE51,
+    0x10000000162E42FF0999CE3541B9FFFD0,
+    0x100000000B17217F80F4EF5AADDA45554,
+    0x10000000058B90BFBF8479BD5A81B51AE,
+    0x1000000002C5C85FDF84BD62AE30A74CD,
+    0x100000000162E42FEFB2FED257559BDAA,
+    0x1000000000B17217F7D5A7716BBA4A9AF,
+    0x100000000058B90BFBE9DDBAC5E109CCF,
+    0x10000000002C5C85FDF4B15DE6F17EB0E,
+    0x1000000000162E42FEFA494F1478FDE05,
+    0x10000000000B17217F7D20CF927C8E94D,
+    0x1000000000058B90BFBE8F71CB4E4B33E,
+    0x100000000002C5C85FDF477B662B26946,
+    0x10000000000162E42FEFA3AE53369388D,
+    0x100000000000B17217F7D1D351A389D41,
+    0x10000000000058B90BFBE8E8B2D3D4EDF,
+    0x1000000000002C5C85FDF4741BEA6E77F,
+    0x100000000000162E42FEFA39FE95583C3,
+    0x1000000000000B17217F7D1CFB72B45E3,
+    0x100000000000058B90BFBE8E7CC35C3F2,
+    0x10000000000002C5C85FDF473E242EA39,
+    0x1000000000000162E42FEFA39F02B772C,
+    0x10000000000000B17217F7D1CF7D83C1A,
+    0x1000000000000058B90BFBE8E7BDCBE2E,
+    0x100000000000002C5C85FDF473DEA871F,
+    0x10000000000000162E42FEFA39EF44D92,
+    0x100000000000000B17217F7D1CF79E949,
+    0x10000000000000058B90BFBE8E7BCE545,
+    0x1000000000000002C5C85FDF473DE6ECA,
+    0x100000000000000162E42FEFA39EF366F,
+    0x1000000000000000B17217F7D1CF79AFA,
+    0x100000000000000058B90BFBE8E7BCD6E,
+    0x10000000000000002C5C85FDF473DE6B3,
+    0x1000000000000000162E42FEFA39EF359,
+    0x10000000000000000B17217F7D1CF79AC,
+)
+
+class RComp(NamedTuple):
+    """calculateCompoundInterestRateWithOverflowDetection outputs, plus whether the rcomp cap hit."""
+    rcomp: Any
+    ri: Any
+    tcrit: Any
+    overflow: Any
+    cap_applied: Any
+
+def as_int_array(values: Any) -> Any:
+    """Object array (at least 1-d) of Python ints; numpy integer arrays are converted exactly."""
+    # lists go straight to object: numpy would turn a mix of negative and >2**63 ints into float64
+    array = np.atleast_1d(values if isinstance(values, np.ndarray) else np.array(values, dtype=object))
+    if array.dtype != object and array.dtype.kind not in 'iub':
+        raise TypeError(f"integer values expected, got {array.dtype}")
+    return array.astype(object)
+
+def _tdiv(a: Any, b: Any) -> Any:
+    """Solidity int256 division (truncates towards zero); Python // floors."""
+    q = a // b
+    return q + ((q < 0) & (q * b != a))
+
+def _max(a: Any, b: Any) -> Any:
+    return np.where(a > b, a, b)
+
+def _min(a: Any, b: Any) -> Any:
+    return np.where(a < b, a, b)
+
+def _exp2_x128(x: Any) -> Any:
+    """PRBMathCommon.exp2 of non-negative 128.128 fixed-point values, as 18-decimals."""
+    result = np.full(x.shape, 1 << 127, dtype=object)
+    for i, factor in enumerate(_EXP2_FACTORS):
+        hit = (x & (1 << (127 - i))) != 0
+        if hit.any():
+            result[hit] = (result[hit] * factor) >> 128
+    result = result << ((x >> 128) + 1)
+    return (result * DP) >> 128  # mulDiv(result, 1e18, 2**128)
+
+def prb_exp2(x: Any) -> Any:
+    """PRBMathSD59x18.exp2 (18-decimals signed input)."""
+    negative = x < 0
+    result = _exp2_x128((np.where(negative, -x, x) << 128) // DP)
+    inverse = 10**36 // np.where(result == 0, 1, result)
+    return np.where(negative, np.where(x < EXP2_MIN, 0, inverse), result)
+
+def prb_exp(x: Any) -> Any:
+    """PRBMathSD59x18.exp (18-decimals signed input; x must be below its 88.72e18 limit)."""
+    result = prb_exp2(_tdiv(x * LOG2_E + HALF_SCALE, DP))
+    return np.where(x < EXP_MIN, 0, result)
+
+def calculate_utilization(total_deposits: Any, total_borrow_amount: Any) -> Any:
+    """SiloMathLib.calculateUtilization with 18 decimals (rounded down, capped at 100%)."""
+    empty = (total_deposits == 0) | (total_borrow_amount == 0)
+    u = total_borrow_amount * DP // np.where(empty, 1, total_deposits)
+    return np.where(empty, 0, _min(u, DP))
+
+def _calculate_rcomp(total_deposits: Any, total_borrow_amount: Any, x: Any):
+    """_calculateRComp: (rcomp, overflow)."""
+    over = x >= X_MAX
+    e = prb_exp(np.where(over, 0, x)) - DP
+    rcomp = np.where(over, RCOMP_MAX, _max(e, 0))
+    overflow = over
+
+    max_amount = _max(total_deposits, total_borrow_amount)
+    headroom = ASSET_DATA_OVERFLOW_LIMIT - max_amount
+    product = (rcomp * total_borrow_amount) & UINT256_MAX  # unchecked uint256 multiplication
+    guard = (product != 0) & (
+        (product // np.where(rcomp == 0, 1, rcomp) != total_borrow_amount) | (product // DP > headroom)
+    )
+    rcomp = np.where(guard, headroom * DP // np.where(total_borrow_amount == 0, 1, total_borrow_amount), rcomp)
+    overflow = overflow | guard
+
+    too_big = max_amount >= ASSET_DATA_OVERFLOW_LIMIT
+    return np.where(too_big, 0, rcomp), overflow | too_big
+
+def _inputs(config: Dict[str, Any], total_deposits: Any, total_borrow_amount: Any, interest_rate_timestamp: Any, block_timestamp: Any):
+    names = CONFIG_FIELDS + ('total_deposits', 'total_borrow_amount', 't0', 't1')
+    values = [as_int_array(config[k]) for k in CONFIG_FIELDS]
+    values += [as_int_array(v) for v in (total_deposits, total_borrow_amount, interest_rate_timestamp, block_timestamp)]
+    v = dict(zip(names, np.broadcast_arrays(*values)))
+    if np.any(v['t0'] > v['t1']):
+        raise ValueError("InvalidTimestamps: interest rate timestamp after block timestamp")
+    return v
+
+def calculate_compound_interest_rate(
+    config: Dict[str, Any],
+    total_deposits: Any,
+    total_borrow_amount: Any,
+    interest_rate_timestamp: Any,
+    block_timestamp: Any,
+) -> RComp:
+    """calculateCompoundInterestRateWithOverflowDetection over broadcast arrays."""
+    v = _inputs(config, total_deposits, total_borrow_amount, interest_rate_timestamp, block_timestamp)
+    T = v['t1'] - v['t0']
+    u = calculate_utilization(v['total_deposits'], v['total_borrow_amount'])
+
+    slopei = _tdiv(v['ki'] * (u - v['uopt']), DP)
+    critical = u > v['ucrit']
+    rp = np.where(
+        critical,
+        _tdiv(_tdiv(v['kcrit'] * (DP + v['Tcrit']), DP) * (u - v['ucrit']), DP),
+        _min(0, _tdiv(v['klow'] * (u - v['ulow']), DP)),
+    )
+    slope = np.where(critical, slopei + _tdiv(_tdiv(v['kcrit'] * v['beta'], DP) * (u - v['ucrit']), DP), slopei)
+    tcrit = np.where(critical, v['Tcrit'] + v['beta'] * T, _max(0, v['Tcrit'] - v['beta'] * T))
+
+    rlin = _tdiv(v['klin'] * u, DP)
+    ri = _max(v['ri'], rlin)
+    r0 = ri + rp
+    r1 = r0 + slope * T
+
+    # integral of max(r, rlin) over [0, T] for r going linearly from r0 to r1
+    above0 = r0 >= rlin
+    above1 = r1 >= rlin
+    safe_slope = np.where(slope == 0, 1, slope)  # slope != 0 wherever the line crosses rlin
+    x = np.where(
+        above0 & above1,
+        _tdiv((r0 + r1) * T, 2),
+        np.where(
+            ~above0 & ~above1,
+            rlin * T,
+            np.where(
+                above0,
+                rlin * T - _tdiv(_tdiv((r0 - rlin) ** 2, safe_slope), 2),
+                rlin * T + _tdiv(_tdiv((r1 - rlin) ** 2, safe_slope), 2),
+            ),
+        ),
+    )
+
+    ri = _max(ri + slopei * T, rlin)
+    rcomp, overflow = _calculate_rcomp(v['total_deposits'], v['total_borrow_amount'], x)
+
+    cap = RCOMP_CAP_PER_SECOND * T
+    cap_applied = rcomp > cap
+    rcomp = np.where(cap_applied, cap, rcomp)
+    reset = overflow | cap_applied
+    return RComp(rcomp, np.where(reset, 0, ri), np.where(reset, 0, tcrit), overflow, cap_applied)
+
+def calculate_current_interest_rate(
+    config: Dict[str, Any],
+    total_deposits: Any,
+    total_borrow_amount: Any,
+    interest_rate_timestamp: Any,
+    block_timestamp: Any,
+) -> Any:
+    """calculateCurrentInterestRate over broadcast arrays (annual rate, 18 decimals)."""
+    overflow = calculate_compound_interest_rate(
+        config, total_deposits, total_borrow_amount, interest_rate_timestamp, block_timestamp
+    ).overflow
+    v = _inputs(config, total_deposits, total_borrow_amount, interest_rate_timestamp, block_timestamp)
+    T = v['t1'] - v['t0']
+    u = calculate_utilization(v['total_deposits'], v['total_borrow_amount'])
+
+    rp = np.where(
+        u > v['ucrit'],
+        _tdiv(_tdiv(v['kcrit'] * (DP + v['Tcrit'] + v['beta'] * T), DP) * (u - v['ucrit']), DP),
+        _min(0, _tdiv(v['klow'] * (u - v['ulow']), DP)),
+    )
+    rlin = _tdiv(v['klin'] * u, DP)
+    ri = _max(v['ri'], rlin)
+    ri = _max(ri + _tdiv(v['ki'] * (u - v['uopt']) * T, DP), rlin)
+    rcur = _min(_max(ri + rp, rlin) * YEAR, RCUR_CAP)
+    return np.where(overflow, 0, rcur)
+
+def load_configs(path: str = CONFIGS_FILE) -> Dict[str, Dict[str, int]]:
+    """{name: config} from InterestRateModelConfigs.json."""
+    with open(path) as f:
+        return {entry['name']: entry['config'] for entry in json.load(f)}
+
+def stack_configs(configs: List[Dict[str, int]]) -> Dict[str, Any]:
+    """One config of (n,) object arrays, to broadcast n configs against other inputs."""
+    return {k: as_int_array([c[k] for c in configs]) for k in CONFIG_FIELDS}
+
+def simulate_paths(config: Dict[str, Any], utilization_paths: Any, step_seconds: int, total_deposits: int = 10**24):
+    """
+    Accrue interest along utilisation paths (18 decimals, shape (..., steps)), carrying ri / Tcrit
+    from step to step as getCompoundInterestRateAndUpdate stores them (clamped to int112).
+    Config fields broadcast against the leading dimensions.
+
+    Returns (growth, overflow): growth is the 18-decimals factor debt grew by over the whole path,
+    overflow marks paths where any step overflowed or hit the rcomp cap.
+    """
+    paths = as_int_array(utilization_paths)
+    state = dict(config)
+    growth = None
+    overflow = None
+    for step in range(paths.shape[-1]):
+        borrows = paths[..., step] * total_deposits // DP
+        result = calculate_compound_interest_rate(state, total_deposits, borrows, 0, step_seconds)
+        growth = np.full(result.rcomp.shape, DP, dtype=object) if growth is None else growth
+        overflow = np.zeros(result.rcomp.shape, dtype=bool) if overflow is None else overflow
+        growth = growth + growth * result.rcomp // DP
+        overflow = overflow | result.overflow | result.cap_applied
+        state['ri'] = np.clip(result.ri, INT112_MIN, INT112_MAX)
+        state['Tcrit'] = np.clip(result.tcrit, INT112_MIN, INT112_MAX)
+    return growth, overflow
+
+def _bps_diff(actual: Any, expected: Any) -> Any:
+    """|actual * 10000 / expected| vs 10000, as the _diff helpers of the Foundry tests compute it."""
+    deviation = abs(_tdiv(actual * 10000, np.where(expected == 0, 1, expected)))
+    return abs(deviation - 10000)
+
+def _failures(actual: Any, expected: Any, max_bps: int) -> Any:
+    """Mask of cases outside tolerance: exact match when expected is 0, else max_bps."""
+    return np.where(expected == 0, actual != 0, _bps_diff(actual, expected) > max_bps)
+
+def _test_inputs(cases: List[Dict[str, Any]]):
+    config = {k: as_int_array([c['constants'][k] for c in cases]) for k in CONFIG_FIELDS if k not in ('ri', 'Tcrit')}
+    config['ri'] = as_int_array([c['input']['integratorState'] for c in cases])
+    config['Tcrit'] = as_int_array([c['input']['Tcrit'] for c in cases])
+    args = [as_int_array([c['input'][k] for c in cases]) for k in ('totalDeposits', 'totalBorrowAmount', 'lastTransactionTime', 'currentTime')]
+    return config, args
+
+def validate(rcomp_file: str = RCOMP_TEST_FILE, rcur_file: str = RCUR_TEST_FILE) -> int:
+    """Evaluate all reference vectors in one pass each; returns the number of failing cases."""
+    failed = 0
+    with open(rcomp_file) as f:
+        cases = json.load(f)
+    config, args = _test_inputs(cases)
+    started = time.perf_counter()
+    result = calculate_compound_interest_rate(config, *args)
+    elapsed = time.perf_counter() - started
+    expected = {k: as_int_array([c['expected'][k] for c in cases]) for k in cases[0]['expected']}
+    checks = {
+        'compoundInterest': _failures(result.rcomp, expected['compoundInterest'], 25),
+        'newIntegratorState': _failures(result.ri, expected['newIntegratorState'], 25),
+        'newTcrit': _failures(result.tcrit, expected['newTcrit'], 25),
+        'didOverflow': result.overflow != (expected['didOverflow'] == 1),
+    }
+    bad = np.zeros(len(cases), dtype=bool)
+    for name, mask in checks.items():
+        bad |= mask.astype(bool)
+        for i in np.flatnonzero(mask)[:5]:
+            print(f"  [FAIL] rcomp id {cases[i]['id']} {name}")
+    cap_mismatch = int(np.count_nonzero(result.cap_applied != (expected['didCap'] == 1)))
+    print(f"Rcomptest.json: {len(cases)} cases in {elapsed * 1000:.0f} ms, fail={int(bad.sum())} (didCap differs: {cap_mismatch}, not asserted)")
+    failed += int(bad.sum())
+
+    with open(rcur_file) as f:
+        cases = json.load(f)
+    config, args = _test_inputs(cases)
+    started = time.perf_counter()
+    rcur = calculate_current_interest_rate(config, *args)
+    elapsed = time.perf_counter() - started
+    bad = _failures(rcur, as_int_array([c['expected']['currentAnnualInterest'] for c in cases]), 1).astype(bool)
+    for i in np.flatnonzero(bad)[:5]:
+        print(f"  [FAIL] rcur id {cases[i]['id']} currentAnnualInterest")
+    print(f"Rcurtest.json: {len(cases)} cases in {elapsed * 1000:.0f} ms, fail={int(bad.sum())}")
+    failed += int(bad.sum())
+    return failed
+
+def benchmark(n_cases: int, loop_cases: int = 500) -> None:
+    """Throughput of one vectorised call vs calling per case, on tiled Rcomptest.json inputs."""
+    with open(RCOMP_TEST_FILE) as f:
+        cases = json.load(f)
+    config, args = _test_inputs(cases)
+    reps = -(-n_cases // len(cases))
+    config = {k: np.tile(v, reps)[:n_cases] for k, v in config.items()}
+    args = [np.tile(a, reps)[:n_cases] for a in args]
+
+    started = time.perf_counter()
+    calculate_compound_interest_rate(config, *args)
+    vectorised = time.perf_counter() - started
+
+    n_loop = min(loop_cases, n_cases)
+    started = time.perf_counter()
+    for i in range(n_loop):
+        calculate_compound_interest_rate({k: v[i] for k, v in config.items()}, *(a[i] for a in args))
+    per_case = (time.perf_counter() - started) / n_loop
+
+    print(f"vectorised: {n_cases} cases in {vectorised:.2f} s ({n_cases / vectorised:,.0f} cases/s)")
+    print(f"per case:   {n_loop} cases in {per_case * n_loop:.2f} s ({1 / per_case:,.0f} cases/s)")
+    print(f"speedup:    {per_case * n_cases / vectorised:.1f}x")
+
+def sweep(names: List[str], n_paths: int, n_steps: int, step_seconds: int, volatility: float, seed: int) -> None:
+    """
+    Print percentiles of the average borrow rate of every config over the same random utilisation
+    paths (ln(growth) / years: the time average of the rate the debt compounded at).
+    """
+    configs = load_configs()
+    unknown = [n for n in names if n not in configs]
+    if unknown:
+        raise ValueError(f"unknown config(s) {unknown}")
+    names = names or list(configs)
+
+    rng = np.random.default_rng(seed)
+    start = rng.uniform(0.3, 0.95, size=(n_paths, 1))
+    walk = np.clip(start + np.cumsum(rng.normal(0.0, volatility, size=(n_paths, n_steps)), axis=1), 0.0, 1.0)
+    paths = (walk * DP).astype(np.int64)
+
+    stacked = stack_configs([configs[n] for n in names])
+    grid = {k: v.reshape(-1, 1) for k, v in stacked.items()}  # (configs, 1) x (paths,)
+
+    started = time.perf_counter()
+    growth, overflow = simulate_paths(grid, paths[np.newaxis, :, :], step_seconds)
+    elapsed = time.perf_counter() - started
+
+    years = n_steps * step_seconds / YEAR
+    apr = np.log(growth.astype(np.float64) / DP) / years
+    print(f"{'config':<28} {'p5 rate':>9} {'p50 rate':>9} {'p95 rate':>9} {'max rate':>9} {'capped':>7}")
+    for i, name in enumerate(names):
+        p5, p50, p95 = np.percentile(apr[i], [5, 50, 95])
+        print(f"{name:<28} {p5:>9.2%} {p50:>9.2%} {p95:>9.2%} {apr[i].max():>9.2%} {int(overflow[i].sum()):>7}")
+    print(f"{len(names)} configs x {n_paths} paths x {n_steps} steps of {step_seconds} s in {elapsed:.1f} s")
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Vectorised InterestRateModelV2 model: validate, benchmark, sweep configs.")
+    action = p.add_mutually_exclusive_group(required=True)
+    action.add_argument("--validate", action="store_true", help="Check against Rcomptest.json / Rcurtest.json.")
+    action.add_argument("--benchmark", action="store_true", help="Vectorised vs per-case throughput.")
+    action.add_argument("--sweep", action="store_true", help="Simulate InterestRateModelConfigs.json configs over random utilisation paths.")
+    p.add_argument("--cases", type=int, default=100_000, help="--benchmark: number of cases (default: 100000).")
+    p.add_argument("--configs", default="", help="--sweep: comma-separated config names (default: all).")
+    p.add_argument("--paths", type=int, default=500, help="--sweep: utilisation paths (default: 500).")
+    p.add_argument("--steps", type=int, default=52, help="--sweep: steps per path (default: 52).")
+    p.add_argument("--step-seconds", type=int, default=7 * 24 * 3600, help="--sweep: seconds per step (default: 1 week).")
+    p.add_argument("--volatility", type=float, default=0.03, help="--sweep: std dev of the utilisation change per step (default: 0.03).")
+    p.add_argument("--seed", type=int, default=0, help="--sweep: random seed (default: 0).")
+    args = p.parse_args()
+
+    if args.validate:
+        return 1 if validate() else 0
+    if args.benchmark:
+        benchmark(args.cases)
+        return 0
+    names = [n.strip() for n in args.configs.split(',') if n.strip()]
+    try:
+        sweep(names, args.paths, args.steps, args.step_seconds, args.volatility, args.seed)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
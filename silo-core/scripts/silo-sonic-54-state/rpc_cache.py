@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of RPC responses for calls pinned to a historical block (stdlib sqlite3).
+
+eth_call / eth_getCode at a fixed block number always return the same result, so a
+rerun of a snapshot (same block, same or more users) only needs the network for calls it
+has not made before. Entries are keyed by sha256 of (method, chain id, block, to, calldata);
+calls at "latest"/"pending"/... and error responses are never cached. The cache is bounded
+by size: once it grows past max_bytes the least recently used entries are dropped.
+
+The chain id of each RPC URL is kept in the cache too, and eth_chainId (which web3's
+validation middleware sends before every eth_call) is answered from it, so a rerun of
+cached calls sends no HTTP request at all.
+
+CachingHTTPProvider plugs it into web3 at the provider level:
+
+    cache = RpcCache(Path(".cache/rpc-cache.sqlite"), max_bytes=512 * 2**20)
+    w3 = Web3(CachingHTTPProvider(cache, rpc_url, session=session))
+    ...
+    cache.close()
+
+Default location used by silo_data_collector.py: <repo>/.cache/rpc-cache.sqlite (gitignored).
+
+Usage:
+    python3 rpc_cache.py --stats [CACHE_FILE]
+    python3 rpc_cache.py --clear [CACHE_FILE]
+    python3 rpc_cache.py --self-check      # warm rerun against a local fake RPC sends 0 requests
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from web3 import Web3
+
+CACHE_FILE_NAME = "rpc-cache.sqlite"
+DEFAULT_MAX_MB = 512
+
+# Methods whose result is fixed once the block is: (position of the block param)
+CACHEABLE_METHODS = {
+    "eth_call": 1,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+}
+
+def default_cache_path() -> str:
+    """<repo>/.cache/rpc-cache.sqlite."""
+    repo_root = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+    return os.path.join(repo_root, '.cache', CACHE_FILE_NAME)
+
+def pinned_block(method: str, params: Any) -> Optional[int]:
+    """Block number a cacheable request is pinned to, None if it is not cacheable."""
+    position = CACHEABLE_METHODS.get(method)
+    if position is None or not isinstance(params, (list, tuple)) or len(params) <= position:
+        return None
+    block = params[position]
+    if isinstance(block, int):
+        return block
+    if isinstance(block, str) and block.startswith('0x'):
+        try:
+            return int(block, 16)
+        except ValueError:
+            return None
+    return None  # "latest", "pending", a block hash object, ...
+
+class RpcCache:
+    """(method, chain id, block, to, calldata) -> JSON result, LRU-evicted above max_bytes."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_MB * 2**20) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key BLOB PRIMARY KEY,"
+            " result TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def chain_id_key(endpoint_uri: str) -> bytes:
+        """Key of the chain id answered by an RPC URL."""
+        return hashlib.sha256(json.dumps(["eth_chainId", endpoint_uri]).encode('utf-8')).digest()
+
+    @staticmethod
+    def make_key(method: str, chain_id: int, block: int, params: Any) -> bytes:
+        """sha256 of the request identity; params minus the block carry `to` and calldata."""
+        position = CACHEABLE_METHODS[method]
+        rest = list(params[:position]) + list(params[position + 1:])
+        identity = json.dumps([method, chain_id, block, rest], sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(identity.lower().encode('utf-8')).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        with self._lock:
+            row = self._db.execute("SELECT result FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: bytes, result: Any) -> None:
+        text = json.dumps(result, separators=(',', ':'))
+        size = len(text) + len(key)
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, result, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time()),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries down to 90% of max_bytes (caller holds the lock)."""
+        target = self.max_bytes * 0.9
+        freed = 0
+        cutoff = None
+        for size, last_used in self._db.execute("SELECT size, last_used FROM responses ORDER BY last_used"):
+            if self._total_bytes - freed <= target:
+                break
+            freed += size
+            cutoff = last_used
+        if cutoff is not None:
+            self._db.execute("DELETE FROM responses WHERE last_used <= ?", (cutoff,))
+            self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {'entries': entries, 'bytes': self._total_bytes, 'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._db.close()
+
+class CachingHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider that answers block-pinned eth_call / eth_getCode / eth_getStorageAt from an RpcCache."""
+
+    def __init__(self, cache: RpcCache, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self._chain_id: Optional[int] = None
+
+    def chain_id(self) -> int:
+        """Chain id of the endpoint: memoised, persisted in the cache, fetched once per RPC URL."""
+        if self._chain_id is None:
+            key = self.cache.chain_id_key(str(self.endpoint_uri))
+            cached = self.cache.get(key)
+            if cached is None:
+                response = super().make_request("eth_chainId", [])
+                cached = int(response["result"], 16)
+                self.cache.put(key, cached)
+            self._chain_id = cached
+        return self._chain_id
+
+    def make_request(self, method: Any, params: Any) -> Any:
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 0, "result": hex(self.chain_id())}
+
+        block = pinned_block(method, params)
+        if block is None:
+            return super().make_request(method, params)
+
+        key = self.cache.make_key(method, self.chain_id(), block, params)
+        result = self.cache.get(key)
+        if result is not None:
+            return {"jsonrpc": "2.0", "id": 0, "result": result}
+
+        response = super().make_request(method, params)
+        if "error" not in response and response.get("result") is not None:
+            self.cache.put(key, response["result"])
+        return response
+
+def self_check() -> int:
+    """
+    Run the same block-pinned eth_calls twice through CachingHTTPProvider against a local fake
+    RPC; the second (warm) run, with a new provider on the same cache file, must send no HTTP request.
+    """
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    received = []
+
+    class FakeRpc(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            received.append(request['method'])
+            result = hex(146) if request['method'] == 'eth_chainId' else '0x' + '00' * 31 + '2a'
+            body = json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': result}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeRpc)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    calls = [{'to': Web3.to_checksum_address('0x' + f'{i:040x}'), 'data': '0xa2c4bb3b'} for i in range(1, 4)]
+    counts = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _run in ('cold', 'warm'):
+            cache = RpcCache(os.path.join(tmp, CACHE_FILE_NAME))
+            w3 = Web3(CachingHTTPProvider(cache, url))
+            before = len(received)
+            for call in calls:
+                w3.eth.call(call, block_identifier=1000)
+            counts.append(len(received) - before)
+            cache.close()
+    server.shutdown()
+    print(f"cold run: {counts[0]} HTTP requests, warm run: {counts[1]} HTTP requests")
+    return 0 if counts[1] == 0 else 1
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Inspect or clear the block-pinned RPC response cache.")
+    action = p.add_mutually_exclusive_group(required=True)
+    action.add_argument("--stats", action="store_true", help="Print entry count and size.")
+    action.add_argument("--clear", action="store_true", help="Delete every entry.")
+    action.add_argument("--self-check", action="store_true", help="Check that a warm rerun sends no HTTP request.")
+    p.add_argument("cache_file", nargs="?", default=default_cache_path(), help="Cache file (default: <repo>/.cache/rpc-cache.sqlite).")
+    args = p.parse_args()
+    if args.self_check:
+        return self_check()
+    if not os.path.exists(args.cache_file):
+        print(f"No cache at {args.cache_file}")
+        return 0
+    cache = RpcCache(args.cache_file)
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {args.cache_file}")
+    else:
+        stats = cache.stats()
+        print(f"{args.cache_file}: {stats['entries']} entries, {stats['bytes'] / 2**20:.1f} MB")
+    cache.close()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -70,19 +70,17 @@ if [ -z "$RPC_SONIC" ]; then
 fi
 
 # Check command line arguments
-if [ $# -ne 1 ]; then
-    print_error "Usage: $0 <silo_address>"
-    print_status "Example: $0 0x435Ab368F5fCCcc71554f4A8ac5F5b922bC4Dc06"
+if [ $# -gt 2 ]; then
+    print_error "Usage: $0 [users_file] [output_file]"
+    print_status "Example: $0 users-54-unique.json silo-54-results.csv"
+    print_status "Snapshots the hardcoded silo-54 market on sonic; for other markets run"
+    print_status "python3 silo_data_collector.py --markets <name|SiloConfig> (see --help)"
     print_status "Make sure to set RPC_SONIC environment variable"
     exit 1
 fi
 
-SILO_ADDRESS=$1
-
-# Generate expected file names
-SILO_SHORT=${SILO_ADDRESS#0x}
-INPUT_FILE="silo_0x${SILO_SHORT}_users.json"
-OUTPUT_FILE="silo_0x${SILO_SHORT}_results.csv"
+INPUT_FILE=${1:-users-54-unique.json}
+OUTPUT_FILE=${2:-silo-54-results.csv}
 
 # Check if input file exists
 if [ ! -f "$INPUT_FILE" ]; then
@@ -91,8 +89,8 @@ if [ ! -f "$INPUT_FILE" ]; then
     exit 1
 fi
 
-# Check if ABI file exists
-ABI_FILE="../../contracts/interfaces/ISilo.json"
+# Check if ABI file exists (the collector loads ABIs from the sonic deployments)
+ABI_FILE="../../deployments/sonic/Silo.sol.json"
 if [ ! -f "$ABI_FILE" ]; then
     print_error "ABI file '$ABI_FILE' does not exist."
     exit 1
@@ -100,15 +98,12 @@ fi
 
 print_status "Starting Silo Data Collection..."
 print_status "RPC URL: $RPC_SONIC"
-print_status "Silo address: $SILO_ADDRESS"
 print_status "Input file: $INPUT_FILE"
 print_status "Output file: $OUTPUT_FILE"
 print_status "ABI file: $ABI_FILE"
 
 # Run the Python script
-python3 silo_data_collector.py "$SILO_ADDRESS"
-
-if [ $? -eq 0 ]; then
+if python3 silo_data_collector.py --chain sonic --users "$INPUT_FILE" --output "$OUTPUT_FILE"; then
     print_status "Data collection completed successfully!"
     print_status "Results saved to: $OUTPUT_FILE"
 else
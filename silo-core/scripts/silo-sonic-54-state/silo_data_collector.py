@@ -5,23 +5,61 @@ Silo Data Collector Script
 This script reads blockchain addresses from a JSON file, calls ISilo contract methods
 for each address, and saves the results to a CSV file.
 
+Without market arguments it snapshots the hardcoded market (SILO0_ADDRESS / SILO1_ADDRESS
+on sonic at BLOCK_NUMBER). With --markets / --all-markets it snapshots SiloConfigs from
+silo-core/deploy/silo/_siloDeployments.json on any chain: silos are resolved with
+SiloConfig.getSilos(), every market is pinned to the same block and markets run in
+parallel over one pooled RPC connection.
+
+Users are collected in batches of --batch-size: all per-user views of a batch go into one
+Multicall3.aggregate3 eth_call and LTVs come from SiloLens.getUsersHealth (one sub-call
+per batch) when the lens at the snapshot block has it. Without Multicall3 at that block
+the script falls back to one call per user and method.
+
+Batches run on a small worker pool and rows are appended to the CSV as batches complete
+(so rows are not in input order). Processed addresses are recorded in
+<output>.checkpoint; if the script is interrupted, rerunning it skips them and appends
+the rest. The checkpoint is removed after a complete run.
+
+--format npz streams fixed-width binary records instead of CSV rows and writes NumPy .npz
+columns at the end (uint256 values as 32-byte big-endian arrays); see snapshot_columns.py.
+
+Responses of block-pinned calls are cached in <repo>/.cache/rpc-cache.sqlite (see
+rpc_cache.py), so reruns at the same block only hit the RPC for new users / markets.
+Use a block a few confirmations deep: a cached response at a reorged block is not refreshed.
+
 Environment variables required:
-- RPC_SONIC: RPC endpoint URL
+- RPC_<CHAIN>: RPC endpoint URL (RPC_SONIC, RPC_MAINNET, ... see CHAIN_TO_RPC_ENV), or --rpc-url
 
 Usage:
+    # hardcoded market, users-54-unique.json -> silo-54-results.csv
     python3 silo_data_collector.py
 
+    # some sonic markets at a given block (users: JSON array, or {market name: [addresses]})
+    python3 silo_data_collector.py --chain sonic --block 42802010 \
+        --markets Silo_EGGS_USDC.e,Silo_EURC.e_USDC.e --users users.json --output-dir snapshots
+
+    # every market of a chain at the latest block
+    python3 silo_data_collector.py --chain mainnet --all-markets --users users.json
+
 """
 
+import argparse
 import json
 import csv
 import os
 import sys
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.exceptions import ContractLogicError
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from decimal import Decimal
+from rpc_cache import DEFAULT_MAX_MB, CachingHTTPProvider, RpcCache, default_cache_path
+from snapshot_columns import RECORDS_SUFFIX, RecordsWriter, iter_record_addresses, records_to_npz
 
 # Minimal ABI for ISiloOracle
 ISILO_ORACLE_ABI = [
@@ -88,6 +126,48 @@ ISILO_CONFIG_ABI = [
         ],
         "stateMutability": "view",
         "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getSilos",
+        "outputs": [
+            {"internalType": "address", "name": "silo0", "type": "address"},
+            {"internalType": "address", "name": "silo1", "type": "address"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# Minimal ABI for Multicall3
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
     }
 ]
 
@@ -107,6 +187,52 @@ SILO_LENS_ADDRESS = "0xB95AD415b0fcE49f84FbD5B26b14ec7cf4822c69"
 SILO0_ADDRESS = "0x04f124bF435545a3c79A8EE3Ffb6C51213CF5175"
 SILO1_ADDRESS = "0xbE0D3c8801206CC9f35A6626f90ef9F4f2983A3D"
 
+# Chain of the hardcoded market
+DEFAULT_CHAIN = "sonic"
+
+# Multicall3 (same address on every chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Users per Multicall3 batch (7 sub-calls per user)
+BATCH_SIZE = 100
+
+# Batches in flight at once (per market)
+WORKERS = 4
+
+# Markets snapshotted at once
+PARALLEL_MARKETS = 4
+
+CSV_FIELDNAMES = ['user_address', 'total_underlying_collateral', 'maxWithdraw_collateral', 'maxRepay', 'silo1_total_collateral', 'silo1_max_withdraw', 'silo0_maxRepay', 'user_ltv']
+
+CHAIN_TO_RPC_ENV = {
+    "arbitrum_one": "RPC_ARBITRUM",
+    "avalanche": "RPC_AVALANCHE",
+    "base": "RPC_BASE",
+    "bnb": "RPC_BNB",
+    "injective": "RPC_INJECTIVE",
+    "ink": "RPC_INK",
+    "mainnet": "RPC_MAINNET",
+    "okx": "RPC_OKX",
+    "optimism": "RPC_OPTIMISM",
+    "sonic": "RPC_SONIC",
+}
+
+SILO_CORE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+DEPLOYMENTS_DIR = os.path.join(SILO_CORE_DIR, 'deployments')
+SILO_DEPLOYMENTS_FILE = os.path.join(SILO_CORE_DIR, 'deploy', 'silo', '_siloDeployments.json')
+
+@dataclass
+class Market:
+    """Everything needed to snapshot one market at one block."""
+    name: str
+    w3: Web3
+    block: int
+    silo0: Any  # Silo contract
+    silo1: Any  # Silo contract
+    silo_lens: Any  # SiloLens contract
+    multicall: Any = None  # Multicall3 contract, None: one call per user and method
+    use_users_health: bool = False
+
 def handle_uint256(value) -> int:
     """Handle uint256 values properly, ensuring they fit in Python int."""
     if value is None:
@@ -153,25 +279,37 @@ def get_file_names() -> tuple[str, str]:
     
     return input_file, output_file
 
-def load_addresses_from_json(file_path: str) -> List[str]:
-    """Load addresses from JSON file (array of strings)."""
+def validate_addresses(addresses: List[Any], source: str) -> List[str]:
+    """Checksummed valid addresses, warning about the rest."""
+    valid_addresses = []
+    for addr in addresses:
+        if isinstance(addr, str) and Web3.is_address(addr):
+            valid_addresses.append(Web3.to_checksum_address(addr))
+        else:
+            logger.warning(f"Invalid address format in {source}: {addr}")
+    return valid_addresses
+
+def load_users_from_json(file_path: str) -> Any:
+    """Load users from JSON file: an array of addresses, or {market name: [addresses]}."""
     try:
         with open(file_path, 'r') as f:
-            addresses = json.load(f)
+            users = json.load(f)
         
-        if not isinstance(addresses, list):
-            raise ValueError("JSON file must contain an array of addresses")
+        if isinstance(users, list):
+            valid_addresses = validate_addresses(users, file_path)
+            logger.info(f"Loaded {len(valid_addresses)} valid addresses from {file_path}")
+            return valid_addresses
         
-        # Validate addresses
-        valid_addresses = []
-        for addr in addresses:
-            if Web3.is_address(addr):
-                valid_addresses.append(Web3.to_checksum_address(addr))
-            else:
-                logger.warning(f"Invalid address format: {addr}")
+        if isinstance(users, dict):
+            per_market = {}
+            for market_name, addresses in users.items():
+                if not isinstance(addresses, list):
+                    raise ValueError(f"users of {market_name} must be an array of addresses")
+                per_market[market_name] = validate_addresses(addresses, f"{file_path} ({market_name})")
+            logger.info(f"Loaded users of {len(per_market)} markets from {file_path}")
+            return per_market
         
-        logger.info(f"Loaded {len(valid_addresses)} valid addresses from {file_path}")
-        return valid_addresses
+        raise ValueError("JSON file must contain an array of addresses or an object of arrays per market")
     
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
@@ -183,15 +321,69 @@ def load_addresses_from_json(file_path: str) -> List[str]:
         logger.error(f"Error loading addresses: {e}")
         sys.exit(1)
 
-def setup_web3() -> Web3:
-    """Setup Web3 connection."""
-    rpc_url = os.getenv('RPC_SONIC')
+def load_addresses_from_json(file_path: str) -> List[str]:
+    """Load addresses from JSON file (array of strings)."""
+    users = load_users_from_json(file_path)
+    if not isinstance(users, list):
+        logger.error(f"{file_path} must contain an array of addresses")
+        sys.exit(1)
+    return users
+
+def load_silo_deployments(chain: str) -> Dict[str, str]:
+    """SiloConfig addresses of a chain from _siloDeployments.json ({market name: config address})."""
+    try:
+        with open(SILO_DEPLOYMENTS_FILE, 'r') as f:
+            deployments = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Error loading {SILO_DEPLOYMENTS_FILE}: {e}")
+        sys.exit(1)
+    
+    if chain not in deployments:
+        logger.error(f"No {chain!r} section in {SILO_DEPLOYMENTS_FILE}")
+        sys.exit(1)
+    
+    return deployments[chain]
+
+def select_markets(chain: str, markets_arg: Optional[str], all_markets: bool) -> Dict[str, str]:
+    """{market name: SiloConfig address} from --markets (names or config addresses) or --all-markets."""
+    deployed = load_silo_deployments(chain)
+    if all_markets:
+        return dict(deployed)
+    
+    by_address = {address.lower(): name for name, address in deployed.items()}
+    selected = {}
+    for item in markets_arg.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        if item in deployed:
+            selected[item] = deployed[item]
+        elif Web3.is_address(item):
+            selected[by_address.get(item.lower(), item)] = Web3.to_checksum_address(item)
+        else:
+            logger.error(f"Unknown market {item!r} on {chain} (not in {SILO_DEPLOYMENTS_FILE})")
+            sys.exit(2)
+    return selected
+
+def setup_web3(rpc_url: str, pool_size: int = WORKERS, cache: Optional[RpcCache] = None) -> Web3:
+    """
+    Setup Web3 connection; one HTTP session with pool_size keep-alive connections shared by all threads.
+    With a cache, block-pinned eth_call / eth_getCode responses are served from disk when seen before.
+    """
     if not rpc_url:
-        logger.error("RPC_SONIC environment variable not set")
+        logger.error("RPC URL not set")
         sys.exit(1)
     
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if cache is not None:
+            provider = CachingHTTPProvider(cache, rpc_url, session=session, request_kwargs={'timeout': 60})
+        else:
+            provider = Web3.HTTPProvider(rpc_url, session=session, request_kwargs={'timeout': 60})
+        w3 = Web3(provider)
         if not w3.is_connected():
             logger.error("Failed to connect to RPC endpoint")
             sys.exit(1)
@@ -213,10 +405,10 @@ def get_silo_contract(w3: Web3, silo_address: str, abi: List[Dict]) -> Any:
         logger.error(f"Error initializing Silo contract: {e}")
         sys.exit(1)
 
-def get_silo_lens_contract(w3: Web3, silo_lens_abi: List[Dict]) -> Any:
+def get_silo_lens_contract(w3: Web3, silo_lens_abi: List[Dict], silo_lens_address: str = SILO_LENS_ADDRESS) -> Any:
     """Get SiloLens contract instance."""
     try:
-        silo_lens_address = Web3.to_checksum_address(SILO_LENS_ADDRESS)
+        silo_lens_address = Web3.to_checksum_address(silo_lens_address)
         contract = w3.eth.contract(address=silo_lens_address, abi=silo_lens_abi)
         logger.info(f"SiloLens contract initialized at: {silo_lens_address}")
         return contract
@@ -224,10 +416,20 @@ def get_silo_lens_contract(w3: Web3, silo_lens_abi: List[Dict]) -> Any:
         logger.error(f"Error initializing SiloLens contract: {e}")
         sys.exit(1)
 
-def get_silo_liquidity(contract: Any, silo_name: str) -> int:
+def get_silos_from_config(w3: Web3, config_address: str, block: int) -> tuple[str, str]:
+    """silo0, silo1 of a SiloConfig at block ("", "" on failure)."""
+    try:
+        config_contract = w3.eth.contract(address=Web3.to_checksum_address(config_address), abi=ISILO_CONFIG_ABI)
+        silo0, silo1 = config_contract.functions.getSilos().call(block_identifier=block)
+        return silo0, silo1
+    except Exception as e:
+        logger.warning(f"getSilos failed for {config_address}: {e}")
+        return "", ""
+
+def get_silo_liquidity(contract: Any, silo_name: str, block: int = BLOCK_NUMBER) -> int:
     """Get liquidity from Silo contract."""
     try:
-        liquidity = contract.functions.getLiquidity().call(block_identifier=BLOCK_NUMBER)
+        liquidity = contract.functions.getLiquidity().call(block_identifier=block)
         liquidity_handled = handle_uint256(liquidity)
         logger.info(f"{silo_name} liquidity: {liquidity_handled}")
         return liquidity_handled
@@ -238,10 +440,10 @@ def get_silo_liquidity(contract: Any, silo_name: str) -> int:
         logger.warning(f"getLiquidity error for {silo_name}: {e}")
         return 0
 
-def get_silo_asset(contract: Any, silo_name: str) -> str:
+def get_silo_asset(contract: Any, silo_name: str, block: int = BLOCK_NUMBER) -> str:
     """Get asset address from a Silo contract."""
     try:
-        asset = contract.functions.asset().call(block_identifier=BLOCK_NUMBER)
+        asset = contract.functions.asset().call(block_identifier=block)
         logger.info(f"{silo_name} asset: {asset}")
         return asset
     except ContractLogicError as e:
@@ -251,10 +453,10 @@ def get_silo_asset(contract: Any, silo_name: str) -> str:
         logger.warning(f"asset() error for {silo_name}: {e}")
         return ""
 
-def get_silo_config(contract: Any, silo_name: str) -> str:
+def get_silo_config(contract: Any, silo_name: str, block: int = BLOCK_NUMBER) -> str:
     """Get config address from a Silo contract."""
     try:
-        config = contract.functions.config().call(block_identifier=BLOCK_NUMBER)
+        config = contract.functions.config().call(block_identifier=block)
         logger.info(f"{silo_name} config: {config}")
         return config
     except ContractLogicError as e:
@@ -264,12 +466,12 @@ def get_silo_config(contract: Any, silo_name: str) -> str:
         logger.warning(f"config() error for {silo_name}: {e}")
         return ""
 
-def get_silo_config_data(w3: Web3, config_address: str, silo_address: str) -> Dict[str, Any]:
+def get_silo_config_data(w3: Web3, config_address: str, silo_address: str, block: int = BLOCK_NUMBER) -> Dict[str, Any]:
     """Get config data from SiloConfig contract."""
     try:
         config_contract = w3.eth.contract(address=config_address, abi=ISILO_CONFIG_ABI)
         
-        config_data_tuple = config_contract.functions.getConfig(silo_address).call(block_identifier=BLOCK_NUMBER)
+        config_data_tuple = config_contract.functions.getConfig(silo_address).call(block_identifier=block)
         logger.info(f"Config data for {silo_address}: {config_data_tuple}")
         
         # Convert tuple to dictionary using the ConfigData struct field names
@@ -298,7 +500,7 @@ def get_silo_config_data(w3: Web3, config_address: str, silo_address: str) -> Di
         logger.warning(f"getConfig failed for {silo_address}: {e}")
         return {}
 
-def get_oracle_price(w3: Web3, oracle_address: str, asset_address: str) -> int:
+def get_oracle_price(w3: Web3, oracle_address: str, asset_address: str, block: int = BLOCK_NUMBER) -> int:
     """Get price from oracle for 1e18 of asset."""
     if not oracle_address or oracle_address == "0x0000000000000000000000000000000000000000":
         logger.info(f"No oracle configured for asset {asset_address}, assuming price of 1e18")
@@ -308,7 +510,7 @@ def get_oracle_price(w3: Web3, oracle_address: str, asset_address: str) -> int:
         oracle_contract = w3.eth.contract(address=oracle_address, abi=ISILO_ORACLE_ABI)
         
         # Get price for 1e18 of asset
-        price = oracle_contract.functions.quote(10**18, asset_address).call(block_identifier=BLOCK_NUMBER)
+        price = oracle_contract.functions.quote(10**18, asset_address).call(block_identifier=block)
         logger.info(f"Oracle price for {asset_address}: {price}")
         return handle_uint256(price)
     except ContractLogicError as e:
@@ -318,24 +520,24 @@ def get_oracle_price(w3: Web3, oracle_address: str, asset_address: str) -> int:
         logger.warning(f"Oracle quote error for {asset_address}: {e}")
         return 10**18  # Default to 1e18
 
-def fetch_silo_price(w3: Web3, silo_contract: Any, silo_name: str, silo_address: str) -> tuple[str, int]:
+def fetch_silo_price(w3: Web3, silo_contract: Any, silo_name: str, silo_address: str, block: int = BLOCK_NUMBER) -> tuple[str, int]:
     """Fetch and print price for a single silo."""
     logger.info(f"=== Fetching {silo_name} Price ===")
     
     # Get asset
-    asset = get_silo_asset(silo_contract, silo_name)
+    asset = get_silo_asset(silo_contract, silo_name, block)
     if not asset:
         logger.error(f"Failed to get asset address for {silo_name}")
         return "", 0
     
     # Get config
-    config = get_silo_config(silo_contract, silo_name)
+    config = get_silo_config(silo_contract, silo_name, block)
     if not config:
         logger.error(f"Failed to get config address for {silo_name}")
         return "", 0
     
     # Get config data
-    config_data = get_silo_config_data(w3, config, silo_address)
+    config_data = get_silo_config_data(w3, config, silo_address, block)
     if not config_data:
         logger.error(f"Failed to get config data for {silo_name}")
         return "", 0
@@ -344,7 +546,7 @@ def fetch_silo_price(w3: Web3, silo_contract: Any, silo_name: str, silo_address:
     solvency_oracle = config_data.get('solvencyOracle', '')
     
     # Get price
-    price = get_oracle_price(w3, solvency_oracle, asset)
+    price = get_oracle_price(w3, solvency_oracle, asset, block)
     
     # Print result
     print(f"{silo_name} Asset: {asset}")
@@ -352,18 +554,19 @@ def fetch_silo_price(w3: Web3, silo_contract: Any, silo_name: str, silo_address:
     
     return asset, price
 
-def fetch_silo_prices(w3: Web3, silo0_contract: Any, silo1_contract: Any):
+def fetch_silo_prices(market: Market):
     """Fetch and print prices for both silos."""
-    logger.info("=== Fetching Silo Prices ===")
+    logger.info(f"=== Fetching {market.name} Silo Prices ===")
     
     # Fetch prices for both silos
-    silo0_asset, silo0_price = fetch_silo_price(w3, silo0_contract, "Silo0", SILO0_ADDRESS)
-    silo1_asset, silo1_price = fetch_silo_price(w3, silo1_contract, "Silo1", SILO1_ADDRESS)
+    fetch_silo_price(market.w3, market.silo0, f"{market.name} Silo0", market.silo0.address, market.block)
+    fetch_silo_price(market.w3, market.silo1, f"{market.name} Silo1", market.silo1.address, market.block)
     
     print(f"==================\n")
 
-def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_contract: Any, user_address: str, w3: Web3) -> Dict[str, Any]:
+def call_contract_methods(market: Market, user_address: str) -> Dict[str, Any]:
     """Call methods for a user address using silo0 for collateral and silo1 for maxRepay."""
+    silo0_contract, silo1_contract, silo_lens_contract, block = market.silo0, market.silo1, market.silo_lens, market.block
     results = {
         'user_address': user_address,
         'total_underlying_collateral': 0,
@@ -381,7 +584,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
             total_collateral = silo_lens_contract.functions.collateralBalanceOfUnderlying(
                 silo0_contract.address, 
                 user_address
-            ).call(block_identifier=BLOCK_NUMBER)
+            ).call(block_identifier=block)
             results['total_underlying_collateral'] = handle_uint256(total_collateral)
         except ContractLogicError as e:
             logger.warning(f"collateralBalanceOfUnderlying failed for {user_address}: {e}")
@@ -392,7 +595,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         try:
             max_withdraw_collateral = silo0_contract.functions.maxWithdraw(
                 user_address
-            ).call(block_identifier=BLOCK_NUMBER)
+            ).call(block_identifier=block)
             results['maxWithdraw_collateral'] = handle_uint256(max_withdraw_collateral)
         except ContractLogicError as e:
             logger.warning(f"maxWithdraw (Collateral) failed for {user_address}: {e}")
@@ -403,7 +606,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         
         # Call getUserLTV (silo1)
         try:
-            user_ltv = silo_lens_contract.functions.getUserLTV(silo1_contract.address, user_address).call(block_identifier=BLOCK_NUMBER)
+            user_ltv = silo_lens_contract.functions.getUserLTV(silo1_contract.address, user_address).call(block_identifier=block)
             results['user_ltv'] = handle_uint256(user_ltv)
         except ContractLogicError as e:
             logger.warning(f"getUserLTV failed for {user_address}: {e}")
@@ -412,7 +615,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         
         # Call maxRepay (silo1)
         try:
-            max_repay = silo1_contract.functions.maxRepay(user_address).call(block_identifier=BLOCK_NUMBER)
+            max_repay = silo1_contract.functions.maxRepay(user_address).call(block_identifier=block)
             results['maxRepay'] = handle_uint256(max_repay)
         except ContractLogicError as e:
             logger.warning(f"maxRepay failed for {user_address}: {e}")
@@ -424,7 +627,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
             silo1_total_collateral = silo_lens_contract.functions.collateralBalanceOfUnderlying(
                 silo1_contract.address, 
                 user_address
-            ).call(block_identifier=BLOCK_NUMBER)
+            ).call(block_identifier=block)
             results['silo1_total_collateral'] = handle_uint256(silo1_total_collateral)
         except ContractLogicError as e:
             logger.warning(f"silo1 collateralBalanceOfUnderlying failed for {user_address}: {e}")
@@ -433,7 +636,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         
         # Call maxWithdraw for Collateral type (silo1)
         try:
-            silo1_max_withdraw = silo1_contract.functions.maxWithdraw(user_address).call(block_identifier=BLOCK_NUMBER)
+            silo1_max_withdraw = silo1_contract.functions.maxWithdraw(user_address).call(block_identifier=block)
             results['silo1_max_withdraw'] = handle_uint256(silo1_max_withdraw)
         except ContractLogicError as e:
             logger.warning(f"silo1 maxWithdraw failed for {user_address}: {e}")
@@ -442,7 +645,7 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         
         # Call maxRepay (silo0)
         try:
-            silo0_max_repay = silo0_contract.functions.maxRepay(user_address).call(block_identifier=BLOCK_NUMBER)
+            silo0_max_repay = silo0_contract.functions.maxRepay(user_address).call(block_identifier=block)
             results['silo0_maxRepay'] = handle_uint256(silo0_max_repay)
         except ContractLogicError as e:
             logger.warning(f"silo0 maxRepay failed for {user_address}: {e}")
@@ -456,87 +659,411 @@ def call_contract_methods(silo0_contract: Any, silo1_contract: Any, silo_lens_co
         logger.error(f"Error processing user {user_address}: {e}")
         return results
 
-def save_to_csv(results: List[Dict[str, Any]], output_file: str, silo0_liquidity: int, silo1_liquidity: int):
-    """Save results to CSV file."""
+def encode_call(contract: Any, fn_name: str, args: List[Any]) -> str:
+    """ABI-encoded calldata for contract.fn_name(*args)."""
+    # web3 v7 renamed encodeABI to encode_abi
+    encode = getattr(contract, 'encode_abi', None) or contract.encodeABI
+    return encode(fn_name, args=args)
+
+def get_multicall_contract(w3: Web3, block: int = BLOCK_NUMBER) -> Any:
+    """Multicall3 contract instance, or None if it has no code at block."""
+    try:
+        multicall_address = Web3.to_checksum_address(MULTICALL3_ADDRESS)
+        if not w3.eth.get_code(multicall_address, block_identifier=block):
+            logger.warning(f"Multicall3 not deployed at block {block}, falling back to per-user calls")
+            return None
+        return w3.eth.contract(address=multicall_address, abi=MULTICALL3_ABI)
+    except Exception as e:
+        logger.warning(f"Multicall3 check failed: {e}, falling back to per-user calls")
+        return None
+
+def supports_users_health(silo_lens_contract: Any, block: int = BLOCK_NUMBER) -> bool:
+    """True if the SiloLens at block implements getUsersHealth(Borrower[])."""
+    try:
+        silo_lens_contract.functions.getUsersHealth([]).call(block_identifier=block)
+        return True
+    except Exception as e:
+        logger.info(f"SiloLens.getUsersHealth not available ({e}), using getUserLTV per user")
+        return False
+
+def build_user_calls(market: Market, user_address: str, with_ltv: bool) -> List[tuple]:
+    """(result column, target, calldata) for every per-user view, same methods as call_contract_methods."""
+    silo0_contract, silo1_contract, silo_lens_contract = market.silo0, market.silo1, market.silo_lens
+    lens = silo_lens_contract.address
+    calls = [
+        ('total_underlying_collateral', lens, encode_call(silo_lens_contract, 'collateralBalanceOfUnderlying', [silo0_contract.address, user_address])),
+        ('maxWithdraw_collateral', silo0_contract.address, encode_call(silo0_contract, 'maxWithdraw', [user_address])),
+        ('maxRepay', silo1_contract.address, encode_call(silo1_contract, 'maxRepay', [user_address])),
+        ('silo1_total_collateral', lens, encode_call(silo_lens_contract, 'collateralBalanceOfUnderlying', [silo1_contract.address, user_address])),
+        ('silo1_max_withdraw', silo1_contract.address, encode_call(silo1_contract, 'maxWithdraw', [user_address])),
+        ('silo0_maxRepay', silo0_contract.address, encode_call(silo0_contract, 'maxRepay', [user_address])),
+    ]
+    if with_ltv:
+        calls.append(('user_ltv', lens, encode_call(silo_lens_contract, 'getUserLTV', [silo1_contract.address, user_address])))
+    return calls
+
+def run_aggregate3(market: Market, calls: List[tuple]) -> List[tuple]:
+    """One aggregate3 eth_call at the market block; (success, returnData) per (target, calldata)."""
+    call3 = [(target, True, data) for target, data in calls]
+    return market.multicall.functions.aggregate3(call3).call(block_identifier=market.block)
+
+def collect_users_batch(market: Market, users: List[str]) -> List[Dict[str, Any]]:
+    """Results for a batch of users in one RPC (the LTVs via one getUsersHealth sub-call when available)."""
+    w3, silo1_contract, silo_lens_contract = market.w3, market.silo1, market.silo_lens
+    results = []
+    flat_calls = []  # (result index, column, target, calldata)
+    for user_address in users:
+        results.append({
+            'user_address': user_address,
+            'total_underlying_collateral': 0,
+            'maxWithdraw_collateral': 0,
+            'maxRepay': 0,
+            'silo1_total_collateral': 0,
+            'silo1_max_withdraw': 0,
+            'silo0_maxRepay': 0,
+            'user_ltv': 0
+        })
+        for column, target, data in build_user_calls(market, user_address, not market.use_users_health):
+            flat_calls.append((len(results) - 1, column, target, data))
+
+    calls = [(target, data) for _, _, target, data in flat_calls]
+    if market.use_users_health:
+        borrowers = [(silo1_contract.address, user_address) for user_address in users]
+        calls.append((silo_lens_contract.address, encode_call(silo_lens_contract, 'getUsersHealth', [borrowers])))
+
+    returned = run_aggregate3(market, calls)
+
+    for (index, column, _, _), (success, return_data) in zip(flat_calls, returned):
+        if success:
+            results[index][column] = handle_uint256(w3.codec.decode(['uint256'], return_data)[0])
+        else:
+            logger.warning(f"{column} failed for {results[index]['user_address']}")
+
+    if market.use_users_health:
+        success, return_data = returned[-1]
+        if success:
+            healths = w3.codec.decode(['(uint256,uint256)[]'], return_data)[0]
+            for result, (_lt, ltv) in zip(results, healths):
+                result['user_ltv'] = handle_uint256(ltv)
+        else:
+            # One reverting borrower reverts the whole getUsersHealth; get the LTVs one by one instead
+            logger.warning(f"getUsersHealth failed for batch starting at {users[0]}, using getUserLTV per user")
+            ltv_calls = [
+                (silo_lens_contract.address, encode_call(silo_lens_contract, 'getUserLTV', [silo1_contract.address, user_address]))
+                for user_address in users
+            ]
+            for result, (ok, data) in zip(results, run_aggregate3(market, ltv_calls)):
+                if ok:
+                    result['user_ltv'] = handle_uint256(w3.codec.decode(['uint256'], data)[0])
+                else:
+                    logger.warning(f"getUserLTV failed for {result['user_address']}")
+
+    return results
+
+def collect_batch(market: Market, batch: List[str]) -> List[Dict[str, Any]]:
+    """Results for one batch; per-user calls if Multicall3 is unavailable, split in half when a batch call fails."""
+    if market.multicall is None:
+        return [call_contract_methods(market, address) for address in batch]
+    try:
+        return collect_users_batch(market, batch)
+    except Exception as e:
+        if len(batch) == 1:
+            # Last resort for a single user: the original one call per method
+            logger.warning(f"Batch call failed for {batch[0]}: {e}, calling methods one by one")
+            return [call_contract_methods(market, batch[0])]
+        # Too large for the node (gas / response size) or a transient error: split and retry
+        mid = len(batch) // 2
+        logger.warning(f"Batch of {len(batch)} users failed: {e}, splitting")
+        return collect_batch(market, batch[:mid]) + collect_batch(market, batch[mid:])
+
+def get_checkpoint_file(output_file: str) -> str:
+    """Checkpoint file next to the output: one processed user address per line."""
+    return output_file + ".checkpoint"
+
+def load_processed_addresses(output_file: str, checkpoint_file: str, output_format: str = 'csv') -> set:
+    """Lowercased addresses already in the output of an interrupted run (empty set for a fresh run)."""
+    if not os.path.exists(checkpoint_file) or not os.path.exists(output_file):
+        return set()
+
+    with open(checkpoint_file, 'r') as f:
+        processed = {line.strip().lower() for line in f if line.strip()}
+
+    # Rows written just before a crash may be missing from the checkpoint; don't collect them twice
+    if output_format == 'npz':
+        processed.update(iter_record_addresses(output_file))
+    else:
+        with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                address = row.get('user_address', '')
+                if Web3.is_address(address):
+                    processed.add(address.lower())
+
+    return processed
+
+def open_output(output_file: str, resume: bool, silo0_liquidity: int, silo1_liquidity: int, output_format: str = 'csv', meta: Optional[Dict[str, Any]] = None) -> tuple:
+    """
+    (file, writer) to append result rows to. A fresh CSV starts with the header and liquidity row;
+    for npz, output_file is a records file (snapshot_columns.RecordsWriter) with the liquidity in its meta.
+    """
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['user_address', 'total_underlying_collateral', 'maxWithdraw_collateral', 'maxRepay', 'silo1_total_collateral', 'silo1_max_withdraw', 'silo0_maxRepay', 'user_ltv']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
+        if output_format == 'npz':
+            meta = dict(meta or {}, silo0_liquidity=str(silo0_liquidity), silo1_liquidity=str(silo1_liquidity))
+            writer = RecordsWriter(output_file, CSV_FIELDNAMES[1:], meta, resume=resume)
+            return writer, writer
+
+        csvfile = open(output_file, 'a' if resume else 'w', newline='', encoding='utf-8')
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+
+        if not resume:
             writer.writeheader()
-            
+
             # Write liquidity info as first row
-            liquidity_row = {
-                'user_address': f'silo0_liquidity:{silo0_liquidity},silo1_liquidity:{silo1_liquidity}',
-                'total_underlying_collateral': '',
-                'maxWithdraw_collateral': '',
-                'maxRepay': '',
-                'silo1_total_collateral': '',
-                'silo1_max_withdraw': '',
-                'silo0_maxRepay': '',
-                'user_ltv': ''
-            }
+            liquidity_row = {field: '' for field in CSV_FIELDNAMES}
+            liquidity_row['user_address'] = f'silo0_liquidity:{silo0_liquidity},silo1_liquidity:{silo1_liquidity}'
             writer.writerow(liquidity_row)
-            
-            for result in results:
-                writer.writerow(result)
-        
-        logger.info(f"Results saved to: {output_file}")
+            csvfile.flush()
+
+        return csvfile, writer
     except Exception as e:
-        logger.error(f"Error saving to CSV: {e}")
+        logger.error(f"Error opening output {output_file}: {e}")
         sys.exit(1)
 
+def collect_users(market: Market, addresses: List[str], output_file: str, silo0_liquidity: int, silo1_liquidity: int, batch_size: int = BATCH_SIZE, workers: int = WORKERS, output_format: str = 'csv') -> int:
+    """
+    Collect all addresses with up to `workers` batches in flight and append rows to output_file as
+    batches complete. Processed addresses go to a checkpoint file, so a rerun after a crash resumes
+    where it stopped; the checkpoint is removed once every address is done. Returns rows written.
+
+    With output_format 'npz' rows are streamed to <output_file>.records and converted to the
+    .npz columns at the end (the records file is kept if numpy is not installed).
+    """
+    stream_file = output_file + RECORDS_SUFFIX if output_format == 'npz' else output_file
+    checkpoint_file = get_checkpoint_file(stream_file)
+    processed = load_processed_addresses(stream_file, checkpoint_file, output_format)
+    resume = bool(processed)
+    if resume:
+        logger.info(f"Resuming from {checkpoint_file}: {len(processed)} users already processed")
+
+    pending = [address for address in addresses if address.lower() not in processed]
+    total = len(pending)
+    processed.clear()
+    batches = iter([pending[i:i + batch_size] for i in range(0, total, batch_size)])
+
+    meta = {'market': market.name, 'block': market.block, 'silo0': market.silo0.address, 'silo1': market.silo1.address}
+    csvfile, writer = open_output(stream_file, resume, silo0_liquidity, silo1_liquidity, output_format, meta)
+    written = 0
+    try:
+        with open(checkpoint_file, 'a' if resume else 'w') as checkpoint, ThreadPoolExecutor(max_workers=workers) as pool:
+            def submit_next(in_flight: set) -> None:
+                batch = next(batches, None)
+                if batch is not None:
+                    in_flight.add(pool.submit(collect_batch, market, batch))
+
+            # At most `workers` batches are queued or running, so memory does not grow with the user count
+            in_flight = set()
+            for _ in range(workers):
+                submit_next(in_flight)
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rows = future.result()
+                    writer.writerows(rows)
+                    csvfile.flush()
+                    # Checkpoint only after the rows are on disk
+                    checkpoint.write(''.join(row['user_address'] + '\n' for row in rows))
+                    checkpoint.flush()
+                    written += len(rows)
+                    logger.info(f"{market.name}: processed {written}/{total} users")
+                    submit_next(in_flight)
+    finally:
+        csvfile.close()
+
+    os.remove(checkpoint_file)
+
+    if output_format == 'npz':
+        try:
+            records_to_npz(stream_file, output_file)
+        except RuntimeError as e:
+            logger.warning(f"{e}; rows kept in {stream_file} (convert later with snapshot_columns.py --to-npz)")
+            return written
+        os.remove(stream_file)
+
+    logger.info(f"Results saved to: {output_file}")
+    return written
+
+def snapshot_market(market: Market, addresses: List[str], output_file: str, batch_size: int = BATCH_SIZE, workers: int = WORKERS, output_format: str = 'csv') -> int:
+    """Liquidity, prices and every user's state of one market at market.block. Returns rows written."""
+    # Get liquidity from both Silo contracts
+    silo0_liquidity = get_silo_liquidity(market.silo0, f"{market.name} Silo0", market.block)
+    silo1_liquidity = get_silo_liquidity(market.silo1, f"{market.name} Silo1", market.block)
+    
+    # Fetch and print prices for both silos
+    fetch_silo_prices(market)
+    
+    # Process addresses in batches, appending rows to the output as they complete
+    return collect_users(market, addresses, output_file, silo0_liquidity, silo1_liquidity, batch_size, workers, output_format)
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Snapshot user positions of Silo markets at one block.")
+    p.add_argument("--chain", default=DEFAULT_CHAIN, help=f"Chain name as in _siloDeployments.json (default: {DEFAULT_CHAIN}).")
+    p.add_argument("--rpc-url", default=None, help="RPC URL. If not set, uses env from CHAIN_TO_RPC_ENV.")
+    p.add_argument(
+        "--block",
+        type=int,
+        default=None,
+        help="Block to snapshot (default: BLOCK_NUMBER for the hardcoded market, latest block otherwise).",
+    )
+    markets = p.add_mutually_exclusive_group()
+    markets.add_argument("--markets", default=None, help="Comma-separated market names from _siloDeployments.json or SiloConfig addresses.")
+    markets.add_argument("--all-markets", action="store_true", help="Every market of --chain in _siloDeployments.json.")
+    p.add_argument("--users", default=None, help="Users JSON: array of addresses, or {market name: [addresses]} (default: users-54-unique.json).")
+    p.add_argument("--output", default=None, help="Output file of the hardcoded market (default: silo-54-results.csv / .npz).")
+    p.add_argument("--output-dir", default=".", help="Directory for <market>.csv / .npz files with --markets/--all-markets (default: .).")
+    p.add_argument(
+        "--format",
+        choices=("csv", "npz"),
+        default="csv",
+        help="csv, or npz: uint256 columns as fixed-width 32-byte arrays (see snapshot_columns.py; needs numpy).",
+    )
+    p.add_argument("--lens", default=None, help="SiloLens address (default: SILO_LENS_ADDRESS, or the chain's SiloLens deployment with --markets/--all-markets).")
+    p.add_argument("--cache-file", default=default_cache_path(), help="Block-pinned RPC response cache (default: <repo>/.cache/rpc-cache.sqlite).")
+    p.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_MB, help=f"Evict least recently used responses above this size (default: {DEFAULT_MAX_MB}).")
+    p.add_argument("--no-cache", action="store_true", help="Always fetch from the RPC.")
+    p.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"Users per Multicall3 call (default: {BATCH_SIZE}).")
+    p.add_argument("--workers", type=int, default=WORKERS, help=f"Batches in flight per market (default: {WORKERS}).")
+    p.add_argument("--parallel-markets", type=int, default=PARALLEL_MARKETS, help=f"Markets snapshotted at once (default: {PARALLEL_MARKETS}).")
+    return p.parse_args()
+
 def main():
     """Main function."""
+    args = parse_args()
+    if args.batch_size < 1 or args.workers < 1 or args.parallel_markets < 1:
+        logger.error("--batch-size, --workers and --parallel-markets must be at least 1")
+        sys.exit(2)
+    
+    multi_market = bool(args.markets or args.all_markets)
+    chain = args.chain
+    if not multi_market and chain != DEFAULT_CHAIN:
+        logger.error(f"The hardcoded market is on {DEFAULT_CHAIN}; use --markets or --all-markets for {chain}")
+        sys.exit(2)
+    
     logger.info("Starting Silo Data Collection")
-    logger.info(f"Silo0 address: {SILO0_ADDRESS}")
-    logger.info(f"Silo1 address: {SILO1_ADDRESS}")
     
     # Generate file names
-    input_file, output_file = get_file_names()
-    
+    default_input_file, default_output_file = get_file_names()
+    input_file = args.users or default_input_file
     logger.info(f"Input file: {input_file}")
-    logger.info(f"Output file: {output_file}")
-    logger.info(f"Block number: {BLOCK_NUMBER}")
     
-    # Load ABI from file
-    abi_file_path = "../../deployments/sonic/Silo.sol.json"
+    # Load ABIs from the chain's deployments
+    abi_file_path = os.path.join(DEPLOYMENTS_DIR, chain, "Silo.sol.json")
     abi = load_abi_from_file(abi_file_path)
     logger.info(f"Loaded ABI from: {abi_file_path}")
     
-    # Load SiloLens ABI from file
-    silo_lens_abi_file_path = "../../deployments/sonic/SiloLens.sol.json"
+    silo_lens_abi_file_path = os.path.join(DEPLOYMENTS_DIR, chain, "SiloLens.sol.json")
     silo_lens_abi = load_abi_from_file(silo_lens_abi_file_path)
     logger.info(f"Loaded SiloLens ABI from: {silo_lens_abi_file_path}")
     
+    if args.lens:
+        silo_lens_address = args.lens
+    elif multi_market:
+        with open(silo_lens_abi_file_path, 'r') as f:
+            silo_lens_address = json.load(f)['address']
+    else:
+        silo_lens_address = SILO_LENS_ADDRESS
+    
     # Load addresses
-    addresses = load_addresses_from_json(input_file)
-    if not addresses:
+    users = load_users_from_json(input_file)
+    if not users:
         logger.error("No valid addresses found")
         sys.exit(1)
     
-    # Setup Web3 and contracts
-    w3 = setup_web3()
-    silo0_contract = get_silo_contract(w3, SILO0_ADDRESS, abi)
-    silo1_contract = get_silo_contract(w3, SILO1_ADDRESS, abi)
-    silo_lens_contract = get_silo_lens_contract(w3, silo_lens_abi)
+    # Setup Web3: one HTTP connection pool shared by every market and worker
+    rpc_env = CHAIN_TO_RPC_ENV.get(chain)
+    rpc_url = args.rpc_url or (os.getenv(rpc_env) if rpc_env else None)
+    if not rpc_url:
+        logger.error(f"{rpc_env or f'RPC_{chain.upper()}'} environment variable not set")
+        sys.exit(1)
+    parallel_markets = args.parallel_markets if multi_market else 1
+    cache = None if args.no_cache else RpcCache(args.cache_file, max_bytes=args.cache_max_mb * 2**20)
+    w3 = setup_web3(rpc_url, pool_size=parallel_markets * args.workers, cache=cache)
+    
+    # Pin everything to one block so markets are consistent with each other
+    if args.block is not None:
+        block = args.block
+    elif multi_market:
+        block = w3.eth.block_number
+    else:
+        block = BLOCK_NUMBER
+    logger.info(f"Block number: {block}")
     
-    # Get liquidity from both Silo contracts
-    silo0_liquidity = get_silo_liquidity(silo0_contract, "Silo0")
-    silo1_liquidity = get_silo_liquidity(silo1_contract, "Silo1")
+    silo_lens_contract = get_silo_lens_contract(w3, silo_lens_abi, silo_lens_address)
+    multicall_contract = get_multicall_contract(w3, block)
+    use_users_health = multicall_contract is not None and supports_users_health(silo_lens_contract, block)
     
-    # Fetch and print prices for both silos
-    fetch_silo_prices(w3, silo0_contract, silo1_contract)
+    if multi_market:
+        configs = select_markets(chain, args.markets, args.all_markets)
+    else:
+        configs = {"silo-54": None}
     
-    # Process each address
-    results = []
-    for i, address in enumerate(addresses, 1):
-        logger.info(f"Processing {i}/{len(addresses)}: {address}")
-        result = call_contract_methods(silo0_contract, silo1_contract, silo_lens_contract, address, w3)
-        results.append(result)
+    jobs = []  # (market, addresses, output file)
+    failed = 0
+    for market_name, config_address in configs.items():
+        if config_address is None:
+            silo0_address, silo1_address = SILO0_ADDRESS, SILO1_ADDRESS
+        else:
+            silo0_address, silo1_address = get_silos_from_config(w3, config_address, block)
+            if not silo0_address:
+                logger.error(f"{market_name}: could not resolve silos of {config_address}, skipping")
+                failed += 1
+                continue
+        
+        addresses = users.get(market_name, []) if isinstance(users, dict) else users
+        if not addresses:
+            logger.warning(f"{market_name}: no users, skipping")
+            continue
+        
+        logger.info(f"{market_name} Silo0 address: {silo0_address}")
+        logger.info(f"{market_name} Silo1 address: {silo1_address}")
+        market = Market(
+            name=market_name,
+            w3=w3,
+            block=block,
+            silo0=get_silo_contract(w3, silo0_address, abi),
+            silo1=get_silo_contract(w3, silo1_address, abi),
+            silo_lens=silo_lens_contract,
+            multicall=multicall_contract,
+            use_users_health=use_users_health,
+        )
+        if multi_market:
+            os.makedirs(args.output_dir, exist_ok=True)
+            output_file = os.path.join(args.output_dir, f"{market_name}.{args.format}")
+        else:
+            output_file = args.output or os.path.splitext(default_output_file)[0] + f".{args.format}"
+        logger.info(f"{market_name} output file: {output_file}")
+        jobs.append((market, addresses, output_file))
     
-    # Save results
-    save_to_csv(results, output_file, silo0_liquidity, silo1_liquidity)
+    with ThreadPoolExecutor(max_workers=parallel_markets) as pool:
+        futures = {
+            pool.submit(snapshot_market, market, addresses, output_file, args.batch_size, args.workers, args.format): market.name
+            for market, addresses, output_file in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                rows = future.result()
+                logger.info(f"{futures[future]}: {rows} users written")
+            except Exception as e:
+                logger.error(f"{futures[future]}: snapshot failed: {e}")
+                failed += 1
+    
+    if cache is not None:
+        stats = cache.stats()
+        logger.info(f"RPC cache: {stats['hits']} hits, {stats['misses']} fetched, {stats['entries']} entries ({stats['bytes'] / 2**20:.1f} MB) in {cache.path}")
+        cache.close()
+    
+    if failed:
+        logger.error(f"{failed} market(s) failed or were skipped; rerun to resume interrupted ones")
+        sys.exit(1)
     
     logger.info("Data collection completed successfully!")
 
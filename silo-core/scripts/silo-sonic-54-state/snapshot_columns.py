@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Columnar snapshot output: fixed-width binary records and NumPy .npz columns.
+
+CSV stores every uint256 as decimal text, and loading 100k+ positions means parsing all of it
+back into Python ints row by row. Here each row is a fixed-width record:
+
+    user_address   20 bytes
+    <field>        32 bytes big-endian uint256, one per field
+
+The records file starts with one JSON header line ({"format", "fields", "meta"}) and is
+append-only, so silo_data_collector.py can stream batches into it and resume after a crash
+(a torn record at the end is truncated). Writing needs only the stdlib.
+
+With NumPy installed the records file is loaded with a single np.fromfile and saved as .npz:
+user_address is a (n, 20) uint8 array, each field a (n, 32) uint8 array (big-endian), and
+"meta" a JSON string. Helpers turn uint256 columns into float64 / uint64 limbs / hi-lo
+halves with vectorised ops; exact Python ints are only built when asked for.
+
+Usage:
+    # convert a records file written by silo_data_collector.py --format npz
+    python3 snapshot_columns.py --to-npz silo-54-results.npz.records
+
+    # in analysis code
+    from snapshot_columns import load_npz, uint256_to_float
+    columns, meta = load_npz("silo-54-results.npz")
+    ltv = uint256_to_float(columns["user_ltv"]) / 1e18
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed to read records / write .npz
+    np = None
+
+RECORDS_FORMAT = "silo-snapshot-records/1"
+ADDRESS_BYTES = 20
+UINT256_BYTES = 32
+RECORDS_SUFFIX = ".records"
+
+def record_size(fields: List[str]) -> int:
+    """Bytes per record: the address plus one uint256 per field."""
+    return ADDRESS_BYTES + UINT256_BYTES * len(fields)
+
+def encode_record(row: Dict[str, Any], fields: List[str]) -> bytes:
+    """Fixed-width record of one result row (address + big-endian uint256 values)."""
+    parts = [bytes.fromhex(row['user_address'][2:])]
+    for field in fields:
+        parts.append(int(row[field] or 0).to_bytes(UINT256_BYTES, 'big'))
+    return b''.join(parts)
+
+def read_header(fp) -> Tuple[Dict[str, Any], int]:
+    """(header, data offset) of an open records file."""
+    line = fp.readline()
+    header = json.loads(line)
+    if header.get('format') != RECORDS_FORMAT:
+        raise ValueError(f"not a {RECORDS_FORMAT} file")
+    return header, len(line)
+
+class RecordsWriter:
+    """Append-only records file; same writerows() interface as csv.DictWriter."""
+
+    def __init__(self, path: str, fields: List[str], meta: Dict[str, Any], resume: bool = False):
+        self.path = path
+        self.fields = fields
+        self.size = record_size(fields)
+        if resume and os.path.exists(path):
+            with open(path, 'rb') as fp:
+                header, offset = read_header(fp)
+            if header['fields'] != fields:
+                raise ValueError(f"{path} has fields {header['fields']}, expected {fields}")
+            # Drop a record torn by a crash mid-write
+            end = os.path.getsize(path)
+            torn = (end - offset) % self.size
+            if torn:
+                with open(path, 'r+b') as fp:
+                    fp.truncate(end - torn)
+            self.file = open(path, 'ab')
+        else:
+            self.file = open(path, 'wb')
+            header = {'format': RECORDS_FORMAT, 'fields': fields, 'meta': meta}
+            self.file.write((json.dumps(header, sort_keys=True) + '\n').encode('utf-8'))
+
+    def writerows(self, rows: List[Dict[str, Any]]) -> None:
+        self.file.write(b''.join(encode_record(row, self.fields) for row in rows))
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+def iter_record_addresses(path: str):
+    """Checksum-less 0x addresses of every complete record (stdlib only, for resuming)."""
+    with open(path, 'rb') as fp:
+        header, _ = read_header(fp)
+        size = record_size(header['fields'])
+        while True:
+            record = fp.read(size)
+            if len(record) < size:
+                return
+            yield '0x' + record[:ADDRESS_BYTES].hex()
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for columnar loading: pip3 install numpy")
+
+def load_records(path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """({column: ndarray}, meta) of a records file, read with one np.fromfile."""
+    _require_numpy()
+    with open(path, 'rb') as fp:
+        header, offset = read_header(fp)
+    fields = header['fields']
+    dtype = np.dtype([('user_address', 'u1', (ADDRESS_BYTES,))] + [(field, 'u1', (UINT256_BYTES,)) for field in fields])
+    records = np.fromfile(path, dtype=dtype, offset=offset)
+    columns = {name: np.ascontiguousarray(records[name]) for name in dtype.names}
+    return columns, header['meta']
+
+def save_npz(path: str, columns: Dict[str, Any], meta: Dict[str, Any]) -> None:
+    """Write columns and meta (as a JSON string) to a compressed .npz."""
+    _require_numpy()
+    np.savez_compressed(path, meta=np.array(json.dumps(meta, sort_keys=True)), **columns)
+
+def load_npz(path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """({column: ndarray}, meta) of a .npz written by save_npz."""
+    _require_numpy()
+    with np.load(path) as data:
+        columns = {name: data[name] for name in data.files if name != 'meta'}
+        meta = json.loads(str(data['meta']))
+    return columns, meta
+
+def records_to_npz(records_path: str, npz_path: str) -> int:
+    """Convert a records file to .npz; returns the number of rows."""
+    columns, meta = load_records(records_path)
+    save_npz(npz_path, columns, meta)
+    return len(columns['user_address'])
+
+def uint256_limbs(column: Any) -> Any:
+    """(n, 4) uint64 limbs, most significant first, of a (n, 32) big-endian uint256 column."""
+    _require_numpy()
+    return np.ascontiguousarray(column).view('>u8').astype(np.uint64)
+
+def uint256_hi_lo(column: Any) -> Tuple[Any, Any]:
+    """(hi, lo) uint128 halves as (n, 2) uint64 limb arrays each (numpy has no uint128)."""
+    limbs = uint256_limbs(column)
+    return limbs[:, :2], limbs[:, 2:]
+
+def uint256_to_float(column: Any) -> Any:
+    """float64 values of a uint256 column (exact up to 2**53, relative error ~1e-16 above)."""
+    limbs = uint256_limbs(column).astype(np.float64)
+    return ((limbs[:, 0] * 2.0**64 + limbs[:, 1]) * 2.0**64 + limbs[:, 2]) * 2.0**64 + limbs[:, 3]
+
+def uint256_to_ints(column: Any) -> List[int]:
+    """Exact Python ints of a uint256 column (builds one object per row; use for small slices)."""
+    return [int.from_bytes(value.tobytes(), 'big') for value in column]
+
+def addresses_to_hex(column: Any) -> List[str]:
+    """0x-prefixed lowercase addresses of a (n, 20) address column."""
+    return ['0x' + value.tobytes().hex() for value in column]
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Convert snapshot records files to .npz columns.")
+    p.add_argument("--to-npz", nargs='+', metavar="RECORDS", required=True, help=f"Records file(s); writes the path without {RECORDS_SUFFIX}.")
+    args = p.parse_args()
+    if np is None:
+        print("numpy is required: pip3 install numpy", file=sys.stderr)
+        return 2
+    for records_path in args.to_npz:
+        npz_path = records_path[: -len(RECORDS_SUFFIX)] if records_path.endswith(RECORDS_SUFFIX) else records_path + '.npz'
+        rows = records_to_npz(records_path, npz_path)
+        print(f"{records_path} -> {npz_path} ({rows} rows)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())